@@ -5,29 +5,40 @@
 """
 from typing import Optional, Union
 
+from anyio import to_thread
 from api.crud.dashboard import (
     load_equipments,
+    load_equipments_with_line,
     load_line_equipment_category,
     load_plcmodel_by_equipment,
 )
-from api.crud.setting_client import get_motors_in_equipment
-from api.crud.util import get_detail_motor_number_list
+from api.crud.setting_client import load_equipment_motors
 from api.format.dashboard import format_dashboard
 from fastapi import APIRouter
 
 router = APIRouter()
 
 
-@router.get("/line-equipment")
+@router.get("/bootstrap")
+async def bootstrap_api() -> dict[str, list[dict[str, Union[int, str]]]]:
+    """페이지 진입 시 필요한 전체 호기와 현재 라인의 라인, 호기 정보를 한 번에 불러오는 api.
+
+    - **equipments**: /equipments api의 응답과 같음
+    - **line_equipment**: /line-equipment api의 응답과 같음.
+    """
+    return await to_thread.run_sync(load_equipments_with_line)
+
+
+@router.get("/line-equipment", deprecated=True)
 async def line_equipment_api() -> list[dict]:
     """현재 라인 넘버(환경변수)에 해당하는 라인, 호기 정보를 불러오는 api."""
-    return load_line_equipment_category()
+    return await to_thread.run_sync(load_line_equipment_category)
 
 
-@router.get("/equipments")
+@router.get("/equipments", deprecated=True)
 async def equipments_api() -> list[dict[str, Union[int, str]]]:
     """현재 라인에 들어있는 전체 호기를 불러오는 API."""
-    return load_equipments()
+    return await to_thread.run_sync(load_equipments)
 
 
 @router.get("/plc_models")
@@ -36,7 +47,7 @@ async def plc_model_api(equipment_id: int) -> list[dict[str, Union[int, str]]]:
 
     - **equipment_id**: 호기 번호.
     """
-    return load_plcmodel_by_equipment(equipment_id)
+    return await to_thread.run_sync(load_plcmodel_by_equipment, equipment_id)
 
 
 @router.get("/")
@@ -50,7 +61,8 @@ async def dashboard_api(
     - **plc**: plc 모델 번호, 기본 값으로는 PLC log 테이블에서
                 현재 호기에 해당하는 가장 최신 plc값을 사용.
     """
-    motors_in_equipment = get_motors_in_equipment(equipment_id)
-    equipment_name = motors_in_equipment[0]["equipment_name"]
-    part_motor_number_dict = get_detail_motor_number_list(equipment_name)
-    return format_dashboard(motors_in_equipment, part_motor_number_dict, plc)
+    motors_in_equipment, part_motor_number_dict = await to_thread.run_sync(
+        load_equipment_motors,
+        equipment_id,
+    )
+    return await format_dashboard(motors_in_equipment, part_motor_number_dict, plc)
@@ -3,238 +3,226 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
-import sys
-from collections import defaultdict
+import asyncio
+from collections.abc import Coroutine
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
+from anyio import to_thread
+from api.crud.detail import (
+    UniformExternalDetailFeature,
+    UniformTensionDetailFeature,
+    VariablePhase3DetailFeature,
+)
 from api.crud.util import (
-    display_num_dict,
     get_detail_motor_number_list,
     get_equipment_name,
+    get_motor_id,
 )
 from api.format.detail import format_detail, response_key_change
 from api.schemas.detail import DetailInitAPIFactory
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from schemas.detail import DetailResponse
 
 router = APIRouter()
 
+part_description = {
+    "pc": "양극 커팅부",
+    "nc": "음극 커팅부",
+    "lami": "라미롤부",
+    "fc": "파이널 커팅부",
+}
+
+detail_feature_columns = frozenset(
+    column
+    for detail_feature_class in (
+        UniformExternalDetailFeature,
+        UniformTensionDetailFeature,
+        VariablePhase3DetailFeature,
+    )
+    for column in detail_feature_class.columns
+)
 
-@router.get("/pc")
-async def pc_api(
-    equipment_id: int,
-    plc: Optional[int] = None,
-    start: Optional[datetime] = None,
-    end: Optional[datetime] = None,
-) -> dict:
-    """양극 커팅부 API.
 
-    - **equipment_id**: 호기 번호
-    - **plc**: plc 모델 번호, 기본 값으로는 PLC log 테이블에서
-                현재 호기에 해당하는 가장 최신 plc값을 사용
-    - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
-    - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
-    """
-    equipment_name = get_equipment_name(equipment_id)
-    part_name = sys._getframe().f_code.co_name.split("API")[0]  # noqa: SLF001
-    motor_number_list = get_detail_motor_number_list(equipment_name)[part_name]
+def _parse_fields(fields: Optional[str]) -> Optional[frozenset[str]]:
+    """쉼표로 구분한 fields 쿼리를 조회할 컬럼 집합으로 바꾸는 함수.
 
-    response: dict = defaultdict(dict)
+    모터 카테고리마다 컬럼이 달라 카테고리별로 없는 컬럼은 무시하지만,
+    어느 카테고리에도 없는 컬럼은 오타로 보고 422를 리턴한다.
 
-    for motor_number in motor_number_list:
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        response[str_mtr_id] = response_key_change(
-            format_detail(equipment_id, motor_number, plc, start, end),
+    Args:
+        fields (Optional[str]): 쉼표로 구분한 조회할 feature 컬럼
+    Returns:
+        Optional[frozenset[str]]
+    """
+    if fields is None:
+        return None
+    field_set = frozenset(fields.split(","))
+    unknown_fields = field_set - detail_feature_columns
+    if unknown_fields:
+        raise HTTPException(
+            status_code=422,
+            detail=f"존재하지 않는 feature 컬럼입니다: {', '.join(sorted(unknown_fields))}",
         )
+    return field_set
 
-    for motor_number in response:
-        for key, value in display_num_dict.items():
-            if key in response[motor_number]["name"]:
-                response[motor_number]["display_num"] = value
 
-    return response
-
-
-@router.get("/nc")
-async def nc_api(
+async def _detail_response(  # noqa: PLR0913
     equipment_id: int,
-    plc: Optional[int] = None,
-    start: Optional[datetime] = None,
-    end: Optional[datetime] = None,
+    part_name: str,
+    plc: Optional[int],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    fields: Optional[frozenset[str]] = None,
 ) -> dict:
-    """음극 커팅부 API.
+    """상세페이지 파트에 속한 모터들의 데이터를 조회하여 응답을 만드는 함수.
 
-    - **equipment_id**: 호기 번호
-    - **plc**: plc 모델 번호, 기본 값으로는 PLC log 테이블에서
-                현재 호기에 해당하는 가장 최신 plc값을 사용
-    - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
-    - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
+    모터별 조회는 서로 독립적이므로 스레드에서 동시에 수행한다.
+
+    Args:
+        equipment_id (int): 호기 번호
+        part_name (str): 상세페이지 파트 이름(pc, nc, lami, fc)
+        plc (Optional[int]): plc 모델 번호
+        start (Optional[datetime]): 조회 시작 시간
+        end (Optional[datetime]): 조회 끝 시간
+        fields (Optional[frozenset[str]]): 조회할 feature 컬럼, None이면 전체 컬럼
+    Returns:
+        dict
     """
-    equipment_name = get_equipment_name(equipment_id)
-    part_name = sys._getframe().f_code.co_name.split("API")[0]  # noqa: SLF001
+    equipment_name = await to_thread.run_sync(get_equipment_name, equipment_id)
     motor_number_list = get_detail_motor_number_list(equipment_name)[part_name]
 
-    response: dict = defaultdict(dict)
-
-    for motor_number in motor_number_list:
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        response[str_mtr_id] = response_key_change(
-            format_detail(equipment_id, motor_number, plc, start, end),
-        )
-
-    for motor_number in response:
-        for key, value in display_num_dict.items():
-            if key in response[motor_number]["name"]:
-                response[motor_number]["display_num"] = value
+    results = await asyncio.gather(
+        *(
+            to_thread.run_sync(
+                format_detail,
+                equipment_id,
+                motor_number,
+                plc,
+                start,
+                end,
+                fields,
+            )
+            for motor_number in motor_number_list
+        ),
+    )
+
+    response = {}
+    for motor_number, result in zip(motor_number_list, results):
+        response[get_motor_id(motor_number)] = response_key_change(result)
 
     return response
 
 
-@router.get("/lami")
-async def lami_api(
-    equipment_id: int,
-    plc: Optional[int] = None,
-    start: Optional[datetime] = None,
-    end: Optional[datetime] = None,
-) -> dict:
-    """라미롤부 API.
+def _make_detail_endpoint(
+    part_name: str,
+    sort: bool = False,  # noqa: FBT001, FBT002
+) -> Callable[..., Coroutine[Any, Any, ORJSONResponse]]:
+    """상세페이지 파트별 API를 생성하는 함수.
 
-    - **equipment_id**: 호기 번호
-    - **plc**: plc 모델 번호, 기본 값으로는 PLC log 테이블에서
-                현재 호기에 해당하는 가장 최신 plc값을 사용
-    - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
-    - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
-    """
-    equipment_name = get_equipment_name(equipment_id)
-    part_name = sys._getframe().f_code.co_name.split("API")[0]  # noqa: SLF001
-    motor_number_list = get_detail_motor_number_list(equipment_name)[part_name]
+    응답은 서버에서 만든 dict이므로 jsonable_encoder를 거치지 않고 바로 직렬화한다.
 
-    response: dict = defaultdict(dict)
+    Args:
+        part_name (str): 상세페이지 파트 이름(pc, nc, lami, fc)
+        sort (bool): display_num 순서로 정렬할지 여부
+    Returns:
+        Callable[..., Coroutine[Any, Any, ORJSONResponse]]
+    """
 
-    for motor_number in motor_number_list:
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        response[str_mtr_id] = response_key_change(
-            format_detail(equipment_id, motor_number, plc, start, end),
+    async def detail_api(
+        equipment_id: int,
+        plc: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        fields: Optional[str] = None,
+    ) -> ORJSONResponse:
+        response = await _detail_response(
+            equipment_id,
+            part_name,
+            plc,
+            start,
+            end,
+            _parse_fields(fields),
         )
+        if sort:
+            response = dict(sorted(response.items(), key=lambda x: x[1]["display_num"]))
+        return ORJSONResponse(response)
 
-    for motor_number in response:
-        for key, value in display_num_dict.items():
-            if key in response[motor_number]["name"]:
-                response[motor_number]["display_num"] = value
-
-    return response
-
-
-@router.get("/fc")
-async def fc_api(
-    equipment_id: int,
-    plc: Optional[int] = None,
-    start: Optional[datetime] = None,
-    end: Optional[datetime] = None,
-) -> dict:
-    """파이널 커팅부 API.
+    detail_api.__doc__ = f"""{part_description[part_name]} API.
 
     - **equipment_id**: 호기 번호
     - **plc**: plc 모델 번호, 기본 값으로는 PLC log 테이블에서
                 현재 호기에 해당하는 가장 최신 plc값을 사용
     - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
-    - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
+    - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
+    - **fields**: 쉼표로 구분한 조회할 feature 컬럼(e.g. avg_load,peak_load),
+                기본 값으로는 전체 feature를 조회.
     """
-    equipment_name = get_equipment_name(equipment_id)
-    part_name = sys._getframe().f_code.co_name.split("API")[0]  # noqa: SLF001
-    motor_number_list = get_detail_motor_number_list(equipment_name)[part_name]
-
-    response: dict = defaultdict(dict)
-
-    for motor_number in motor_number_list:
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        response[str_mtr_id] = response_key_change(
-            format_detail(equipment_id, motor_number, plc, start, end),
-        )
-
-    for motor_number in response:
-        for key, value in display_num_dict.items():
-            if key in response[motor_number]["name"]:
-                response[motor_number]["display_num"] = value
-
-    return dict(sorted(response.items(), key=lambda x: x[1]["display_num"]))
+    return detail_api
 
 
 def get_detail_init_api_factory(
-    equipment_id: int,
-    request: Request,
-) -> DetailInitAPIFactory:
-    """Detail_init_API_factory를 생성하는 함수.
+    part_name: str,
+) -> Callable[[int], DetailInitAPIFactory]:
+    """파트 이름을 고정한 DetailInitAPIFactory 의존성을 생성하는 함수.
+
+    파트 이름은 라우트를 등록할 때 정해지므로 요청마다 url path를 파싱하지 않는다.
 
     Args:
-        equipment_id (int): 호기 번호
-        request (Request): FastAPI Request 객체
+        part_name (str): 상세페이지 파트 이름
     Returns:
-        DetailInitAPIFactory
+        Callable[[int], DetailInitAPIFactory]
     """
-    path = request.url.path
-    part = path.split("/")[-1].split("-")[0]
-    return DetailInitAPIFactory(equipment_id, part)
 
+    def detail_init_api_factory(equipment_id: int) -> DetailInitAPIFactory:
+        return DetailInitAPIFactory(equipment_id, part_name)
 
-@router.get("/pc-init")
-async def pc_init_api(
-    equipment_id: int,  # noqa: ARG001
-    detail_init_api_factory: DetailInitAPIFactory = Depends(
-        get_detail_init_api_factory,
-    ),
-) -> dict[str, dict[str, Union[int, str, list[str]]]]:
-    """양극 커팅부 상세페이지를 처음 눌렀을 때, 호출되어야 하는 api.
+    return detail_init_api_factory
 
-    - **equipment_id**: 호기 번호
-    - **detail_init_api_factory**: DetailInitAPIFactory를
-        호기번호와 파트 이름으로 초기화한 후, 필요 정보 리턴.
-    """
-    return detail_init_api_factory.init_api()
 
+def _make_detail_init_endpoint(
+    part_name: str,
+) -> Callable[..., Coroutine[Any, Any, dict]]:
+    """상세페이지 파트별 init API를 생성하는 함수.
 
-@router.get("/nc-init")
-async def nc_init_api(
-    equipment_id: int,  # noqa: ARG001
-    detail_init_api_factory: DetailInitAPIFactory = Depends(
-        get_detail_init_api_factory,
-    ),
-) -> dict[str, dict[str, Union[int, str, list[str]]]]:
-    """음극 커팅부 상세페이지를 처음 눌렀을 때, 호출되어야 하는 api.
-
-    - **equipment_id**: 호기 번호
-    - **detail_init_api_factory**: DetailInitAPIFactory를
-        호기번호와 파트 이름으로 초기화한 후, 필요 정보 리턴.
+    Args:
+        part_name (str): 상세페이지 파트 이름
+    Returns:
+        Callable[..., Coroutine[Any, Any, dict]]
     """
-    return detail_init_api_factory.init_api()
 
+    async def detail_init_api(
+        equipment_id: int,  # noqa: ARG001
+        detail_init_api_factory: DetailInitAPIFactory = Depends(
+            get_detail_init_api_factory(part_name),
+        ),
+    ) -> dict[str, dict[str, Union[int, str, list[str]]]]:
+        return await to_thread.run_sync(detail_init_api_factory.init_api)
 
-@router.get("/lami-init")
-async def lami_init_api(
-    equipment_id: int,  # noqa: ARG001
-    detail_init_api_factory: DetailInitAPIFactory = Depends(
-        get_detail_init_api_factory,
-    ),
-) -> dict[str, dict[str, Union[int, str, list[str]]]]:
-    """라미롤부 상세페이지를 처음 눌렀을 때, 호출되어야 하는 api.
+    detail_init_api.__doc__ = f"""{part_description[part_name]} 상세페이지를 처음 눌렀을 때, 호출되어야 하는 api.
 
     - **equipment_id**: 호기 번호
     - **detail_init_api_factory**: DetailInitAPIFactory를
         호기번호와 파트 이름으로 초기화한 후, 필요 정보 리턴.
-    """
-    return detail_init_api_factory.init_api()
-
-
-@router.get("/fc-init")
-async def fc_init_api(
-    equipment_id: int,  # noqa: ARG001
-    detail_init_api_factory: DetailInitAPIFactory = Depends(
-        get_detail_init_api_factory,
-    ),
-) -> dict[str, dict[str, Union[int, str, list[str]]]]:
-    """파이널 커팅부 상세페이지를 처음 눌렀을 때, 호출되어야 하는 api.
-
-    - **equipment_id**: 호기 번호
-    - **detail_init_api_factory**: DetailInitAPIFactory 객체.
-    """
-    return detail_init_api_factory.init_api()
+    """  # noqa: E501
+    return detail_init_api
+
+
+for part in part_description:
+    router.add_api_route(
+        f"/{part}",
+        _make_detail_endpoint(part, sort=part == "fc"),
+        methods=["GET"],
+        response_class=ORJSONResponse,
+        responses={200: {"model": DetailResponse}},
+        name=f"{part}_api",
+    )
+
+for part in part_description:
+    router.add_api_route(
+        f"/{part}-init",
+        _make_detail_init_endpoint(part),
+        methods=["GET"],
+        name=f"{part}_init_api",
+    )
@@ -9,17 +9,34 @@ Window Server minio가 자주 다운되어 부하 테스트를 하기 위해 생
 
 
 import random
-from array import array
 from datetime import datetime
+from functools import partial
 from typing import List, Union
 
 import boto3
+import numpy as np
 import zstd
+from anyio import to_thread
 from botocore.client import Config
+from core.config import setting
 from fastapi import APIRouter, status
 
 router = APIRouter()
 
+bucket_name = "test"
+compression_level = 3
+
+# 요청마다 스레드에서 put을 실행하므로 thread-safe한 client 사용
+s3 = boto3.client(
+    "s3",
+    endpoint_url=setting.endpoint_url,
+    aws_access_key_id=setting.aws_access_key_id,
+    aws_secret_access_key=setting.aws_secret_access_key,
+    config=Config(signature_version="s3v4", max_pool_connections=32),
+    verify=setting.verify,
+    region_name="ap-northeast-2",
+)
+
 
 @router.post("/insert-minio", status_code=status.HTTP_201_CREATED)
 async def insert_minio(body: dict):
@@ -27,28 +44,20 @@ async def insert_minio(body: dict):
     fdc feature를 읽어오는 api, deprecated
     """
 
-    endpoint_url = "http://10.10.30.23:9000"
-    aws_access_key_id = "guardione"
-    aws_secret_access_key = "onepredict1!"
-    bucket_name = "test"
-
     # arr = random.sample(range(160000), 160000)
-    # data = bytes(array("f", arr))
+    # data = np.asarray(arr, dtype="<f4").tobytes()
     # compressed_data = zstd.compress(data, 22)
 
-    s3 = boto3.resource(
-        "s3",
-        endpoint_url=endpoint_url,
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        config=Config(signature_version="s3v4"),
-        verify=False,
-        region_name="ap-northeast-2",
-    )
-
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    data = bytes(array("f", body["data"]))
-    compressed_data = zstd.compress(data, 22)
+    data = np.asarray(body["data"], dtype="<f4").tobytes()
+    compressed_data = await to_thread.run_sync(zstd.compress, data, compression_level)
 
-    s3.Object(bucket_name, "".join((now, ".zst"))).put(Body=compressed_data)
+    await to_thread.run_sync(
+        partial(
+            s3.put_object,
+            Bucket=bucket_name,
+            Key="".join((now, ".zst")),
+            Body=compressed_data,
+        ),
+    )
@@ -6,8 +6,8 @@
 from datetime import datetime
 from typing import Optional
 
-from api.crud.setting_client import get_motors_in_equipment
-from api.crud.util import get_detail_motor_number_list
+from anyio import to_thread
+from api.crud.setting_client import load_equipment_motors
 from api.format.trend import (
     format_load,
     format_operating,
@@ -19,6 +19,11 @@ from fastapi import APIRouter
 
 router = APIRouter()
 
+trend_init = {
+    "operating": OperatingTrendInit.apply_operating_prefix(),
+    "health": HealthTrendInit.apply_health_prefix(),
+}
+
 
 @router.get("/variable_diagnosis")
 async def variable_diagnosis_api(
@@ -35,10 +40,11 @@ async def variable_diagnosis_api(
     - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
     - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
     """
-    motors_in_equipment = get_motors_in_equipment(equipment_id)
-    equipment_name = motors_in_equipment[0]["equipment_name"]
-    part_motor_number_dict = get_detail_motor_number_list(equipment_name)
-    return format_variable_diagnosis(
+    motors_in_equipment, part_motor_number_dict = await to_thread.run_sync(
+        load_equipment_motors,
+        equipment_id,
+    )
+    return await format_variable_diagnosis(
         motors_in_equipment,
         part_motor_number_dict,
         plc,
@@ -62,10 +68,11 @@ async def uniform_diagnosis_api(
     - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
     - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
     """
-    motors_in_equipment = get_motors_in_equipment(equipment_id)
-    equipment_name = motors_in_equipment[0]["equipment_name"]
-    part_motor_number_dict = get_detail_motor_number_list(equipment_name)
-    return format_uniform_diagnosis(
+    motors_in_equipment, part_motor_number_dict = await to_thread.run_sync(
+        load_equipment_motors,
+        equipment_id,
+    )
+    return await format_uniform_diagnosis(
         motors_in_equipment,
         part_motor_number_dict,
         plc,
@@ -89,10 +96,11 @@ async def load_api(
     - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
     - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
     """
-    motors_in_equipment = get_motors_in_equipment(equipment_id)
-    equipment_name = motors_in_equipment[0]["equipment_name"]
-    part_motor_number_dict = get_detail_motor_number_list(equipment_name)
-    return format_load(motors_in_equipment, part_motor_number_dict, plc, start, end)
+    motors_in_equipment, part_motor_number_dict = await to_thread.run_sync(
+        load_equipment_motors,
+        equipment_id,
+    )
+    return await format_load(motors_in_equipment, part_motor_number_dict, plc, start, end)
 
 
 @router.get("/operating")
@@ -110,10 +118,11 @@ async def operating_api(
     - **start**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜
     - **end**: 특정 구간 조회할 경우(상세페이지 다운로드 때 사용) 시작 날짜.
     """
-    motors_in_equipment = get_motors_in_equipment(equipment_id)
-    equipment_name = motors_in_equipment[0]["equipment_name"]
-    part_motor_number_dict = get_detail_motor_number_list(equipment_name)
-    return format_operating(
+    motors_in_equipment, part_motor_number_dict = await to_thread.run_sync(
+        load_equipment_motors,
+        equipment_id,
+    )
+    return await format_operating(
         motors_in_equipment,
         part_motor_number_dict,
         plc,
@@ -123,9 +132,6 @@ async def operating_api(
 
 
 @router.get("/trend-init")
-async def trend_init_api() -> dict[str, list[int]]:
+async def trend_init_api() -> dict[str, list[str]]:
     """Trend 페이지 처음 누를 때 호출되어야하는 api."""
-    return {
-        "operating": OperatingTrendInit.apply_operating_prefix(),
-        "health": HealthTrendInit.apply_health_prefix(),
-    }
+    return trend_init
@@ -3,10 +3,12 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
-import re
-from typing import Optional, TypeVar, Union
+from collections.abc import Collection
+from functools import lru_cache
+from typing import Any, TypeVar, Union
 
-from api.crud.interface import AnalysisSQL
+from api.crud.interface import get_analysis_sql
+from api.crud.util import get_motor_number
 from core.config import setting
 from db.plc.crud.load import load_current_plc_model
 from db.plc.database import PLCSessionLocal
@@ -14,176 +16,222 @@ from db.plc.model import PLCModel
 from db.service.database import SessionLocal
 from db.service.model import Equipment, Line, MotorBearing
 from fastapi import HTTPException
-from sqlalchemy.engine.row import Row
+from sqlalchemy import Integer, bindparam, func, select, true
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.declarative import DeclarativeMeta
-from sqlalchemy.orm import sessionmaker
-from util.utils import row_to_dict
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Select
+from util.cache import ttl_cache
 
 T = TypeVar("T")
 
 
+def read_current_plc(equipment_id: int) -> int:
+    """PLC log 테이블에 들어있는 호기의 가장 최신 plc 값을 리턴.
+
+    Args:
+        equipment_id (int): 호기 번호
+    Returns:
+        int
+    """
+    line_equipment = {
+        "line_id": 1,
+        "equipment_id": equipment_id,
+        "name": "CellState_Model",
+    }
+    return load_current_plc_model(line_equipment)
+
+
+@lru_cache(maxsize=16)
+def _latest_dashboard_stmt(columns: tuple[str, ...], orm_cls: DeclarativeMeta) -> Select:
+    """모터 번호 목록의 모터별 가장 최신 row를 한 번에 조회하는 statement.
+
+    모터 번호 배열을 unnest한 결과는 motors(motor_number)로 컬럼 이름까지 지정해야
+    motors.motor_number로 참조할 수 있다(지정하지 않으면 컬럼 이름이 motors가 됨).
+    모터 번호 배열을 unnest한 뒤 모터마다 LATERAL 서브쿼리로 최신 row 1개를 조회하므로,
+    모터별 조회가 기존과 같이 primary key 인덱스를 역순으로 타고 1개만 읽는다.
+    호기 번호, 모터 번호 목록, plc는 실행할 때 bind parameter로 넘긴다.
+
+    Args:
+        columns (tuple[str, ...]): 조회할 컬럼들
+        orm_cls (DeclarativeMeta): ORM 클래스
+    Returns:
+        Select
+    """
+    motors = (
+        func.unnest(bindparam("motor_numbers", type_=ARRAY(Integer)))
+        .table_valued("motor_number")
+        .render_derived()
+        .alias("motors")
+    )
+    latest = (
+        select(*(getattr(orm_cls, column) for column in columns))
+        .where(
+            orm_cls.equipment_id == bindparam("equipment_id"),
+            orm_cls.motor_number == motors.c.motor_number,
+            orm_cls.plc == bindparam("plc"),
+        )
+        .order_by(orm_cls.acq_time.desc())
+        .limit(1)
+        .lateral("latest")
+    )
+    return select(latest).select_from(motors).join(latest, true())
+
+
 class Dashboard:
-    """Dashboard API 조회 메소드를 구현한 부모 클래스."""
+    """Dashboard API 조회 메소드를 구현한 부모 클래스.
 
-    def __init__(
-        self, equipment_id: int, motor_number: int, plc: Optional[int] = None,
-    ) -> None:
-        """대쉬보드 클래스 생성자.
+    Attributes:
+        columns: 조회할 컬럼들, 자식 클래스에서 정의
+    """
 
-        Args:
-            equipment_id (int): 호기 번호
-            motor_number (int): 모터 번호
-            plc (int):plc 값이 None(default)로 주어진 경우,
-                        PLC log테이블에 들어있는 가장 최신 plc값 사용,
-        """
-        self.columns: list[str] = None  # type: ignore[assignment]
-        line_equipment = {
-            "line_id": 1,
-            "equipment_id": equipment_id,
-            "name": "CellState_Model",
-        }
-        self.plc = load_current_plc_model(line_equipment) if plc is None else plc
-        self.required_dict = {
-            "equal_condition": {
-                "equipment_id": equipment_id,
-                "motor_number": motor_number,
-                "plc": self.plc,
-            },
-            "order_by_condition": {"column": "acq_time", "option": "desc"},
-            "limit_condition": 1,
-        }
+    columns: tuple[str, ...] = ()
 
-    def read_dashboard(
-        self,
-        SessionLocal: sessionmaker,
+    @classmethod
+    def read_dashboards_bulk(  # noqa: PLR0913
+        cls,
+        session: Session,
         orm_cls: DeclarativeMeta,
-    ) -> list[Row]:
-        """특정 컬럼과 orm class를 조건으로 주어 AnalysisSQL 세션을 생성.
-
-        주어진 조건(required_dict)에 맞는 결과를 리턴.
+        equipment_id: int,
+        motor_numbers: Collection[int],
+        plc: int,
+    ) -> dict[int, dict[str, Any]]:
+        """같은 호기의 여러 모터의 가장 최신 결과를 한 번의 쿼리로 조회.
 
         Args:
-            SessionLocal: sessionmaker 객체
-            orm_cls : ORM 클래스
+            session (Session): 열려있는 세션
+            orm_cls (DeclarativeMeta): ORM 클래스
+            equipment_id (int): 호기 번호
+            motor_numbers (Collection[int]): 조회할 모터 번호들
+            plc (int): 배터리 생산 모드
+
         Returns:
-            list[Row]
+            dict[int, dict[str, Any]], 모터 번호별 조회 결과, 결과가 없는 모터는 제외
         """
-        analysis_session = AnalysisSQL(self.columns, SessionLocal, orm_cls)
-        query_results = analysis_session.load_query_result(**self.required_dict)
-        return query_results
+        if not motor_numbers:
+            return {}
+        rows = session.execute(
+            _latest_dashboard_stmt(cls.columns, orm_cls),
+            {
+                "equipment_id": equipment_id,
+                "motor_numbers": list(motor_numbers),
+                "plc": plc,
+            },
+        ).mappings()
+        return {row["motor_number"]: dict(row) for row in rows}
 
 
 class VariableDashboard(Dashboard):
     """변속 Dashboard 클래스."""
 
-    def __init__(
-        self, equipment_id: int, motor_number: int, plc: Optional[int] = None,
-    ) -> None:
-        """대쉬보드에서 변속 모터 관련 인자를 나타내기 위해 사용되는 클래스 생성자.
-
-        Args:
-            equipment_id (int): 호기 번호
-            motor_number (int): 모터 번호
-            plc (int): 배터리 생산 모드.
-        """
-        super().__init__(equipment_id, motor_number, plc)
-        self.columns = [
-            "equipment_id",
-            "acq_time",
-            "motor_number",
-            "plc",
-            "final_diagnosis",
-        ]
+    columns: tuple[str, ...] = (
+        "equipment_id",
+        "acq_time",
+        "motor_number",
+        "plc",
+        "final_diagnosis",
+    )
 
 
 class UniformExternalDashboard(Dashboard):
     """정속 외부 베어링 1개 Dashboard 클래스."""
 
-    def __init__(
-        self, equipment_id: int, motor_number: int, plc: Optional[int] = None,
-    ) -> None:
-        """대쉬보드에서 외부 베어링 관련 인자를 나타내기 위해 사용되는 클래스 생성자.
-
-        Args:
-            equipment_id (int): 호기 번호
-            motor_number (int): 모터 번호
-            plc (int): 배터리 생산 모드.
-        """
-        super().__init__(equipment_id, motor_number, plc)
-        self.columns = [
-            "equipment_id",
-            "acq_time",
-            "motor_number",
-            "plc",
-            "stator_diagnosis",
-            "motor_bearing_diagnosis",
-            "gear_shaft_diagnosis",
-            "external_bearing_diagnosis",
-            "coupling_diagnosis",
-            "belt_diagnosis",
-            "final_diagnosis",
-        ]
+    columns: tuple[str, ...] = (
+        "equipment_id",
+        "acq_time",
+        "motor_number",
+        "plc",
+        "stator_diagnosis",
+        "motor_bearing_diagnosis",
+        "gear_shaft_diagnosis",
+        "external_bearing_diagnosis",
+        "coupling_diagnosis",
+        "belt_diagnosis",
+        "final_diagnosis",
+    )
 
 
 class UniformTensionDashboard(UniformExternalDashboard):
     """정속 외부 베어링 2개 Dashboard 클래스."""
 
-    def __init__(
-        self, equipment_id: int, motor_number: int, plc: Optional[int] = None,
-    ) -> None:
-        """대쉬보드에서 텐션 베어링 관련 인자를 나타내기 위해 사용되는 클래스 생성자.
-
-        Args:
-            equipment_id (int): 호기 번호
-            motor_number (int): 모터 번호
-            plc (int): 배터리 생산 모드.
-        """
-        super().__init__(equipment_id, motor_number, plc)
-        self.columns.remove("external_bearing_diagnosis")
-        self.columns += [
-            "external_main_bearing_diagnosis",
-            "external_tension_bearing_diagnosis",
-        ]
+    columns: tuple[str, ...] = (
+        *(
+            column
+            for column in UniformExternalDashboard.columns
+            if column != "external_bearing_diagnosis"
+        ),
+        "external_main_bearing_diagnosis",
+        "external_tension_bearing_diagnosis",
+    )
 
 
 class TriggerDashboard(Dashboard):
     """Trigger 대쉬보드 클래스."""
 
-    def __init__(
-        self, equipment_id: int, motor_number: int, plc: Optional[int] = None,
-    ) -> None:
-        """대쉬보드에서 트리거를 나타내기 위해 사용되는 클래스 생성자.
-
-        Args:
-            equipment_id (int): 호기 번호
-            motor_number (int): 모터 번호
-            plc (int): 배터리 생산 모드.
-        """
-        super().__init__(equipment_id, motor_number, plc)
-        self.columns = [
-            "equipment_id",
-            "acq_time",
-            "motor_number",
-            "plc",
-            "status",
-            "plc_status",
-            "supply_freq_by_data",
-            "rms_u",
-        ]
+    columns: tuple[str, ...] = (
+        "equipment_id",
+        "acq_time",
+        "motor_number",
+        "plc",
+        "status",
+        "plc_status",
+        "supply_freq_by_data",
+        "rms_u",
+    )
 
 
+@ttl_cache(setting.cache_ttl)
 def load_equipments() -> list[dict[str, Union[int, str]]]:
     """현재 라인에 들어있는 호기 조회.
 
+    ORM 객체를 만들지 않고 필요한 컬럼만 조회하여 바로 dict로 변환한다.
+
     Returns:
         list[dict[str, Union[int, str]]]
     """
+    stmt = select(Equipment.id, Equipment.line_id, Equipment.name)
     with SessionLocal() as session:
-        query_results = session.query(Equipment).all()
+        return [dict(row) for row in session.execute(stmt).mappings()]
+
+
+@ttl_cache(setting.cache_ttl)
+def load_equipments_with_line() -> dict[str, list[dict[str, Union[int, str]]]]:
+    """load_equipments와 load_line_equipment_category의 결과를 한 번의 조회로 리턴.
 
-    return row_to_dict(query_results)
+    전체 호기와 라인 정보를 join해서 한 번 조회한 뒤,
+    현재 라인 넘버(환경변수)에 해당하는 호기만 골라 라인, 호기 정보를 만든다.
+
+    Returns:
+        dict[str, list[dict[str, Union[int, str]]]]
+    """
+    stmt = select(
+        Equipment.id,
+        Equipment.line_id,
+        Equipment.name,
+        Line.category,
+        Line.name.label("line_name"),
+    ).join(Line, Line.id == Equipment.line_id)
+    with SessionLocal() as session:
+        rows = session.execute(stmt).all()
+
+    return {
+        "equipments": [
+            {"id": row.id, "line_id": row.line_id, "name": row.name} for row in rows
+        ],
+        "line_equipment": [
+            {
+                "category": row.category,
+                "line_name": row.line_name,
+                "equipment_id": row.id,
+                "equipment_name": row.name,
+            }
+            for row in rows
+            if row.line_name == setting.line_num
+        ],
+    }
 
 
+@ttl_cache(setting.cache_ttl)
 def load_plcmodel_by_equipment(equipment_id: int) -> list[dict[str, Union[int, str]]]:
     """현재 호기에 들어있는 plc 모델 정보 리턴.
 
@@ -192,9 +240,9 @@ def load_plcmodel_by_equipment(equipment_id: int) -> list[dict[str, Union[int, s
     Returns:
         list[dict[str, Union[int, str]]]
     """
-    columns = ["equipment_id", "model", "name", "description"]
+    columns = ("equipment_id", "model", "name", "description")
     orm_class = PLCModel
-    analysis_session = AnalysisSQL(columns, PLCSessionLocal, orm_class)
+    analysis_session = get_analysis_sql(columns, PLCSessionLocal, orm_class)
     required_dict = {"equal_condition": {"line_id": 1, "equipment_id": equipment_id}}
     query_results = analysis_session.load_query_result(**required_dict)
     if not query_results:
@@ -205,9 +253,13 @@ def load_plcmodel_by_equipment(equipment_id: int) -> list[dict[str, Union[int, s
     return query_results
 
 
+@ttl_cache(setting.cache_ttl, maxsize=4096)
 def get_supply_freq(str_motor_id: str, equipment_id: int, plc: int) -> dict:
     """대쉬보드 정속모터 supply freq 정보 리턴.
 
+    모터 파라미터가 바뀌는 경우에만 값이 달라지므로 캐시하며,
+    파라미터 수정 api에서 cache_clear()로 비운다.
+
     Args:
         str_motor_id (str): 모터 번호(e.g. motor1, motor2)
         equipment_id (int): 호기 번호
@@ -215,10 +267,10 @@ def get_supply_freq(str_motor_id: str, equipment_id: int, plc: int) -> dict:
     Returns:
         dict
     """
-    motor_number = int(re.sub(r"[^0-9]", "", str_motor_id))
-    columns = ["supply_freq"]
+    motor_number = get_motor_number(str_motor_id)
+    columns = ("supply_freq",)
     orm_class = MotorBearing
-    analysis_session = AnalysisSQL(columns, SessionLocal, orm_class)
+    analysis_session = get_analysis_sql(columns, SessionLocal, orm_class)
     required_dict = {
         "equal_condition": {
             "equipment_id": equipment_id,
@@ -226,27 +278,27 @@ def get_supply_freq(str_motor_id: str, equipment_id: int, plc: int) -> dict:
             "plc": plc,
         },
     }
-    query_results = analysis_session.load_query_result(**required_dict)
-    if not query_results:
+    query_result = analysis_session.load_query_first(**required_dict)
+    if query_result is None:
         raise HTTPException(
             status_code=404,
             detail="해당 호기에 대한 plc 정보가 없습니다.",
         )
-    return query_results[0]
+    return query_result
 
 
+@ttl_cache(setting.cache_ttl)
 def load_line_equipment_category() -> list[dict]:
     """line의 카테고리, line 이름, 호기 아이디, 호기 이름을 리턴해주는 함수."""
-    with SessionLocal() as session:
-        query_result = (
-            session.query(Line.category, Line.name, Equipment.id, Equipment.name)
-            .filter(Line.name == setting.line_num)
-            .join(Equipment, Line.id == Equipment.line_id)
-            .all()
+    stmt = (
+        select(
+            Line.category.label("category"),
+            Line.name.label("line_name"),
+            Equipment.id.label("equipment_id"),
+            Equipment.name.label("equipment_name"),
         )
-    key_list = ["category", "line_name", "equipment_id", "equipment_name"]
-    response = []
-    for row in query_result:
-        result_dict = dict(zip(key_list, row))
-        response.append(result_dict)
-    return response
+        .join(Equipment, Line.id == Equipment.line_id)
+        .where(Line.name == setting.line_num)
+    )
+    with SessionLocal() as session:
+        return [dict(row) for row in session.execute(stmt).mappings()]
@@ -3,7 +3,9 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
+from collections.abc import Collection
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional, TypeVar
 
 from api.crud.setting_client import (
@@ -22,31 +24,68 @@ from sqlalchemy.orm import sessionmaker
 T = TypeVar("T")
 
 
+def load_motor_bootstrap(
+    equipment_id: int,
+    motor_number: int,
+    category: Optional[str] = None,
+) -> tuple[str, int]:
+    """모터 카테고리와 현재 plc 모델을 함께 불러오는 함수.
+
+    카테고리는 service DB, plc 모델은 plc DB에 있어서 하나의 쿼리로 합칠 수 없으므로,
+    각각 캐시된 조회 함수를 사용하고 호출하는 쪽에서 이미 알고 있는 카테고리는
+    다시 조회하지 않는다. 미국 LGES까지는 line이 1개씩만 존재하므로 line_id는 1로 고정.
+
+    Args:
+        equipment_id (int): 호기 번호
+        motor_number (int): 모터 번호
+        category (str): 이미 알고 있는 모터 카테고리, None이면 DB에서 조회
+    Returns:
+        tuple[str, int], (모터 카테고리, 현재 plc 모델)
+    """
+    if category is None:
+        category = read_motor_category(equipment_id, motor_number)
+    plc = load_current_plc_model(
+        {
+            "line_id": 1,
+            "equipment_id": equipment_id,
+            "name": "CellState_Model",
+        },
+    )
+    return category, plc
+
+
 class MotorInfo:
     """현재 plc에 대한 특정호기 특정모터번호에 대한 parameter 리턴받을 수 있는 클래스."""
 
-    def __init__(self, equipment_id: int, motor_number: int) -> None:
-        """미국 LGES까지는 line이 1개씩만 존재하므로 저렇게 하드코딩으로 써둠.
+    category_parameter_function = MappingProxyType(
+        {
+            "u3e": read_single_external_setting,
+            "u3t": read_single_tension_setting,
+            "v3": read_single_variable_setting,
+        },
+    )
+
+    def __init__(
+        self,
+        equipment_id: int,
+        motor_number: int,
+        category: Optional[str] = None,
+    ) -> None:
+        """모터 카테고리와 현재 plc 모델을 불러와서 객체 생성.
 
         Args:
             equipment_id (int): 호기 번호
             motor_number (int): 모터 번호
+            category (str): 이미 알고 있는 모터 카테고리, None이면 DB에서 조회
         """
         self.equipment_id = equipment_id
         self.motor_number = motor_number
-        self.category = read_motor_category(self.equipment_id, self.motor_number)
-        self.plc = load_current_plc_model(
-            {
-                "line_id": 1,
-                "equipment_id": self.equipment_id,
-                "name": "CellState_Model",
-            },
+        self.category, self.plc = load_motor_bootstrap(
+            equipment_id,
+            motor_number,
+            category,
         )
-        self.category_parameter_function = {
-            "u3e": read_single_external_setting,
-            "u3t": read_single_tension_setting,
-            "v3": read_single_variable_setting,
-        }
+        self._read_parameter = self.category_parameter_function[self.category]
 
     def read_motor_parameter(self) -> dict:
         """특정 모터의 카테고리에 맞는 feature들을 로딩.
@@ -56,7 +95,7 @@ class MotorInfo:
         Returns:
             dict
         """
-        return self.category_parameter_function[self.category](
+        return self._read_parameter(
             self.equipment_id,
             self.motor_number,
             self.plc,
@@ -67,21 +106,48 @@ class ReadDetailFeature:
     """템플릿 메소드 패턴을 위한 부모 클래스 정의.
 
     Args:
-        columns (list[str]): 조회할 컬럼들 목록
+        columns (tuple[str, ...]): 조회할 컬럼들 목록, 자식 클래스에서 정의
+        key_columns (tuple[str, ...]): 조회 컬럼을 골라서 조회할 때도 항상 조회할 컬럼
         required_dict (dict): 조회할 때 매번 공통으로 사용되는 컬럼 정보
+        yield_per (int): 조회 결과를 DB에서 한 번에 가져올 row 수
     Examples:
         required_dict = {'equipment_id':1, 'motor_number':3, 'plc':3}
     """
 
+    columns: tuple[str, ...] = ()
+    key_columns: tuple[str, ...] = ("equipment_id", "motor_number", "plc", "acq_time")
+    yield_per = 1000
+
     def __init__(self) -> None:
-        """컬럼과 required_dict(필수 인자)정의."""
-        self.columns: Optional[list[str]] = None
+        """required_dict(필수 인자)와 조회 기간 정의."""
         self.required_dict: Optional[dict] = None
         self.start: Optional[datetime] = None
         self.end: Optional[datetime] = None
 
+    def select_columns(self, fields: Optional[Collection[str]] = None) -> tuple[str, ...]:
+        """조회할 컬럼 중에서 fields에 포함된 컬럼과 key_columns만 골라서 리턴.
+
+        fields에 columns에 없는 컬럼이 있으면 무시하므로,
+        카테고리가 다른 모터가 섞여 있어도 같은 fields를 사용할 수 있다.
+
+        Args:
+            fields (Optional[Collection[str]]): 조회할 컬럼, None이면 전체 컬럼
+        Returns:
+            tuple[str, ...]
+        """
+        if fields is None:
+            return self.columns
+        return tuple(
+            column
+            for column in self.columns
+            if column in fields or column in self.key_columns
+        )
+
     def read_detail(
-        self, SessionLocal: sessionmaker, orm_cls: DeclarativeMeta,
+        self,
+        SessionLocal: sessionmaker,
+        orm_cls: DeclarativeMeta,
+        columns: Optional[tuple[str, ...]] = None,
     ) -> list[Row]:
         """부모 클래스에서 정의되는 템플릿 메소드.
 
@@ -89,16 +155,20 @@ class ReadDetailFeature:
         WHERE 조건으로는 self.start와 self.end 기간 사이와
         required_dict의 조건과 일치하는 row들을 필터를 걸고,
         ORDER BY로는 계측 시간(acq_time) 순서대로 리턴하도록 함.
+        조회 기간이 길면 row 수가 많으므로 server side cursor로 yield_per개씩 가져옴.
 
         Args:
             SessionLocal (sessionmaker): sessionmaker 객체
             orm_cls (DeclarativeMeta): ORM 클래스
+            columns (Optional[tuple[str, ...]]): 조회할 컬럼, None이면 self.columns
         Returns:
             list[Row]
         """
+        if columns is None:
+            columns = self.columns
         with SessionLocal() as session:
             query_results = (
-                session.query(*[getattr(orm_cls, column) for column in self.columns])
+                session.query(*[getattr(orm_cls, column) for column in columns])
                 .filter(
                     and_(
                         orm_cls.acq_time > self.start,
@@ -112,21 +182,44 @@ class ReadDetailFeature:
                     ],
                 )
                 .order_by(orm_cls.acq_time.asc())
-                .all()
+                .yield_per(self.yield_per)
             )
-        return query_results
+            return list(query_results)
 
 
 class UniformExternalDetailFeature(ReadDetailFeature):
     """정속 모터 외부베어링 1개(u3e) 상세페이지 인자 정의 클래스."""
 
+    columns: tuple[str, ...] = (
+        "equipment_id",
+        "motor_number",
+        "plc",
+        "acq_time",
+        "rolling_load",
+        "rolling_load_ratio",
+        "signal_noise_ratio",
+        "winding_supply_freq_amp_unbalance_ratio_median",
+        "motor_bpfi_1x_median",
+        "gearbox_rotation_freq_amp_median",
+        "external_bpfo_1x_median",
+        "coupling_supply_freq_amp_median",
+        "belt_kurtosis_max_median",
+        "stator_diagnosis",
+        "motor_bearing_diagnosis",
+        "gear_shaft_diagnosis",
+        "external_bearing_diagnosis",
+        "coupling_diagnosis",
+        "belt_diagnosis",
+        "final_diagnosis",
+    )
+
     def __init__(
         self,
         required_dict: dict[str, int],
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
     ) -> None:
-        """모터 카테고리(u3e)에서 조회해야하는 feature 목록 정의.
+        """모터 카테고리(u3e)의 조회 조건 정의, 조회할 feature 목록은 columns에 정의.
 
         Args:
             required_dict (Dict[str, int]): 조회할 때 매번 공통으로 사용되는 컬럼 정보
@@ -134,69 +227,55 @@ class UniformExternalDetailFeature(ReadDetailFeature):
             end (datetime): 조회 끝 시간
         """
         self.required_dict = required_dict
-        self.columns = [
-            "equipment_id",
-            "motor_number",
-            "plc",
-            "acq_time",
-            "rolling_load",
-            "rolling_load_ratio",
-            "signal_noise_ratio",
-            "winding_supply_freq_amp_unbalance_ratio_median",
-            "motor_bpfi_1x_median",
-            "gearbox_rotation_freq_amp_median",
-            "external_bpfo_1x_median",
-            "coupling_supply_freq_amp_median",
-            "belt_kurtosis_max_median",
-            "stator_diagnosis",
-            "motor_bearing_diagnosis",
-            "gear_shaft_diagnosis",
-            "external_bearing_diagnosis",
-            "coupling_diagnosis",
-            "belt_diagnosis",
-            "final_diagnosis",
-        ]
         self.start, self.end = determine_period(start, end)
 
 
 class UniformTensionDetailFeature(UniformExternalDetailFeature):
-    """정속 모터 텐션베어링 포함된(u3t) 모터의 상세페이지 인자 정의 클래스."""
-
-    def __init__(
-        self,
-        required_dict: dict[str, int],
-        start: Optional[datetime] = None,
-        end: Optional[datetime] = None,
-    ) -> None:
-        """모터 카테고리(u3t)에서 조회해야하는 feature 목록 정의.
+    """정속 모터 텐션베어링 포함된(u3t) 모터의 상세페이지 인자 정의 클래스.
 
-        u3t 카테고리는 u3e의 자식 클래스이므로,
-        부모 클래스의 메소드를 호출한 뒤, 추가 컬럼만 더해줌.
+    u3t 카테고리는 u3e의 자식 클래스이므로,
+    부모 클래스의 컬럼에서 외부 베어링 진단 대신 텐션 베어링 관련 컬럼만 더해줌.
+    """
 
-        Args:
-            required_dict (Dict[str, int]): 조회할 때 매번 공통으로 사용되는 컬럼 정보
-            start (datetime): 조회 시작 시간
-            end (datetime): 조회 끝 시간
-        """
-        super().__init__(required_dict, start, end)
-        self.columns.remove("external_bearing_diagnosis")
-        self.columns += [  # type: ignore[operator]
-            "tension_bpfo_1x_median",
-            "external_main_bearing_diagnosis",
-            "external_tension_bearing_diagnosis",
-        ]
+    columns: tuple[str, ...] = (
+        *(
+            column
+            for column in UniformExternalDetailFeature.columns
+            if column != "external_bearing_diagnosis"
+        ),
+        "tension_bpfo_1x_median",
+        "external_main_bearing_diagnosis",
+        "external_tension_bearing_diagnosis",
+    )
 
 
 class VariablePhase3DetailFeature(ReadDetailFeature):
     """변속 3상 모터 상세페이지 피처 정의 클래스."""
 
+    columns: tuple[str, ...] = (
+        "equipment_id",
+        "motor_number",
+        "plc",
+        "acq_time",
+        "avg_load",
+        "avg_load_ratio",
+        "peak_load",
+        "peak_load_ratio",
+        "cutting_interval",
+        "current_corr_pvm_median",
+        "current_noise_rms_pvm_median",
+        "current_corr_pvm_diagnosis",
+        "current_noise_rms_pvm_diagnosis",
+        "final_diagnosis",
+    )
+
     def __init__(
         self,
         required_dict: dict[str, int],
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
     ) -> None:
-        """모터 카테고리(v3)에서 조회해야하는 feature 목록 정의.
+        """모터 카테고리(v3)의 조회 조건 정의, 조회할 feature 목록은 columns에 정의.
 
         Args:
             required_dict (Dict[str, int]): 조회할 때 매번 공통으로 사용되는 컬럼 정보
@@ -204,20 +283,4 @@ class VariablePhase3DetailFeature(ReadDetailFeature):
             end (datetime): 조회 끝 시간
         """
         self.required_dict = required_dict
-        self.columns = [
-            "equipment_id",
-            "motor_number",
-            "plc",
-            "acq_time",
-            "avg_load",
-            "avg_load_ratio",
-            "peak_load",
-            "peak_load_ratio",
-            "cutting_interval",
-            "current_corr_pvm_median",
-            "current_noise_rms_pvm_median",
-            "current_corr_pvm_diagnosis",
-            "current_noise_rms_pvm_diagnosis",
-            "final_diagnosis",
-        ]
         self.start, self.end = determine_period(start, end)
@@ -1,64 +1,114 @@
-from typing import Any, Callable, Dict, Generic, List, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
-from sqlalchemy import and_
 from sqlalchemy.engine.row import Row
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.declarative import DeclarativeMeta
+from sqlalchemy.orm import Query, Session, sessionmaker
 
-T = TypeVar("T")
+
+@lru_cache(maxsize=64)
+def _order_by_clause(orm_class: Type[DeclarativeMeta], column: str, option: str):
+    """orm class의 컬럼과 정렬 옵션(asc, desc)에 해당하는 order by 절을 만드는 함수.
+    같은 조합은 매번 같은 절을 만들기 때문에 캐시해서 재사용함.
+    """
+    return getattr(getattr(orm_class, column), option)()
 
 
 class AnalysisSQL:
+    # get_analysis_sql로 공유되는 객체이므로 속성을 고정하고 인스턴스 __dict__를 없앰
+    __slots__ = (
+        "columns",
+        "local_session",
+        "orm_cls",
+        "between_column",
+        "_between_col",
+        "_col_attrs",
+    )
+
     def __init__(
-        self, columns: List[str], SessionLocal: sessionmaker, orm_class: Generic[T]
+        self,
+        columns: List[str],
+        SessionLocal: sessionmaker,
+        orm_class: Type[DeclarativeMeta],
+        between_column: str = "acq_time",
     ):
         self.columns = columns
         self.local_session = SessionLocal
         self.orm_cls = orm_class
-
-    def __getitem__(self, key):
-        return getattr(self, key)
-
-    def __setitem__(self, key, value):
-        return setattr(self, key, value)
+        self.between_column = between_column
+        # between 조건에 쓰는 컬럼이 없는 테이블(e.g. plc model)도 있으므로 None 허용
+        self._between_col = getattr(orm_class, between_column, None)
+        # 조회할 컬럼은 객체마다 고정이므로 매 조회마다 getattr 하지 않도록 미리 찾아둠
+        self._col_attrs = tuple(getattr(orm_class, column) for column in columns)
 
     def check_order_by_condition(self, **kwargs) -> Union[Callable, None]:
         """order by 조건 있는지를 체크하고, 있을 경우  해당 옵션으로 order by 함.
         만약 옵션을 이상하게 줬으면 디폴트 옵션은 시간순서대로 order by 하게 설정함.
         """
-        if kwargs.get("order_by_condition") is None:
+        order_by_condition = kwargs.get("order_by_condition")
+        if order_by_condition is None:
             return None
-        else:
-            return getattr(
-                getattr(
-                    self.orm_cls,
-                    kwargs.get("order_by_condition").get("column", "acq_time"),
-                ),
-                kwargs.get("order_by_condition").get("option", "asc"),
-            )()
+        return _order_by_clause(
+            self.orm_cls,
+            order_by_condition.get("column", "acq_time"),
+            order_by_condition.get("option", "asc"),
+        )
 
     def check_between_condition(self, **kwargs):
-        """order by 조건 있는지를 체크하고, 있을 경우  해당 옵션으로 order by 함.
-        만약 옵션을 이상하게 줬으면 디폴트 옵션은 시간순서대로 order by 하게 설정함.
+        """between 조건 있는지를 체크하고, 있을 경우 from, end 사이 조건을 리턴함.
+        컬럼을 주지 않거나 between_column과 같으면 미리 찾아둔 컬럼을 사용함.
         """
-        if kwargs.get("between_condition") is None:
+        between_condition = kwargs.get("between_condition")
+        if between_condition is None:
             return []
+        column = between_condition.get("column", self.between_column)
+        if column == self.between_column and self._between_col is not None:
+            between_col = self._between_col
+        else:
+            between_col = getattr(self.orm_cls, column)
         return [
-            getattr(self.orm_cls, kwargs.get("between_condition").get("column"))
-            > kwargs.get("between_condition").get("from"),
-            getattr(self.orm_cls, kwargs.get("between_condition").get("column"))
-            < kwargs.get("between_condition").get("end"),
+            between_col > between_condition.get("from"),
+            between_col < between_condition.get("end"),
         ]
 
+    def build_query(self, session: Session, **kwargs) -> Query:
+        """limit을 제외한 조회 조건을 적용한 쿼리를 만듦."""
+        return (
+            session.query(*self._col_attrs)
+            .filter(*self.check_between_condition(**kwargs))
+            .filter_by(**(kwargs.get("equal_condition", {})))
+            .order_by(self.check_order_by_condition(**kwargs))
+        )
+
     def load_query_result(self, **kwargs) -> List[Dict[str, Any]]:
         with self.local_session() as session:
-            query_results = (
-                session.query(
-                    *[getattr(self.orm_cls, column) for column in self.columns]
-                )
-                .filter(and_(*self.check_between_condition(**kwargs)))
-                .filter_by(**(kwargs.get("equal_condition", {})))
-                .order_by(self.check_order_by_condition(**kwargs))
-                .limit(kwargs.get("limit_condition", None))
-                .all()
-            )
-        return list(map(lambda x: x._asdict(), query_results))
+            return self.load_query_result_in_session(session, **kwargs)
+
+    def load_query_result_in_session(
+        self, session: Session, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """이미 열려있는 세션에서 조회, 여러 조회를 한 세션에서 처리할 때 사용."""
+        query_results = (
+            self.build_query(session, **kwargs)
+            .limit(kwargs.get("limit_condition", None))
+            .all()
+        )
+        return [dict(row._mapping) for row in query_results]
+
+    def load_query_first(self, **kwargs) -> Optional[Dict[str, Any]]:
+        """조건에 맞는 첫 번째 row만 조회, 결과가 없으면 None."""
+        with self.local_session() as session:
+            row = self.build_query(session, **kwargs).first()
+        return None if row is None else dict(row._mapping)
+
+
+@lru_cache(maxsize=256)
+def get_analysis_sql(
+    columns: Tuple[str, ...],
+    SessionLocal: sessionmaker,
+    orm_class: Type[DeclarativeMeta],
+) -> AnalysisSQL:
+    """같은 컬럼, 세션, orm class 조합에 대해 AnalysisSQL 객체를 재사용하는 함수.
+    조회 조건은 load_query_result 호출 시 넘기므로 객체를 공유해도 안전함.
+    """
+    return AnalysisSQL(list(columns), SessionLocal, orm_class)
@@ -0,0 +1,157 @@
+"""Plc log를 모아서 주기적으로 insert하는 백그라운드 writer.
+
+- Author: Sewon Kim
+- Contact: sewon.kim@onepredict.com
+Kepware가 짧은 주기로 보내는 plc log를 요청마다 insert하지 않고 큐에 쌓아둔 뒤,
+setting.plc_log_flush_interval초마다 쌓인 로그를 하나의 트랜잭션으로 insert한다.
+insert에 실패한 로그는 버리지 않고 최대 setting.plc_log_max_pending건까지 보관했다가
+다음 주기에 다시 insert한다.
+"""
+import logging
+import queue
+import threading
+from typing import Any, Optional
+
+from api.crud.setting_client import insert_plc_logs
+from api.schemas.detail import load_detail_init
+from core.config import setting
+from db.plc.crud.load import load_current_plc_model, load_plc_model_mm_ids
+from db.plc.database import PLCSessionLocal
+
+
+class PLCLogWriter:
+    """Plc log를 큐에 쌓아두고 백그라운드 스레드에서 주기적으로 insert하는 클래스.
+
+    Attributes:
+        flush_interval: 쌓인 로그를 insert하는 주기(초)
+        max_pending: insert에 실패해서 다시 시도하기 위해 보관할 최대 로그 개수
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int) -> None:
+        """Insert 주기와 재시도용으로 보관할 최대 로그 개수로 객체 생성.
+
+        Args:
+            flush_interval (float): 쌓인 로그를 insert하는 주기(초)
+            max_pending (int): insert에 실패해서 다시 시도하기 위해 보관할 최대 로그 개수
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._queue: queue.SimpleQueue[list[dict[str, Any]]] = queue.SimpleQueue()
+        self._pending: list[dict[str, Any]] = []
+        self._plc_models: dict[int, Any] = {}
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def put(self, plc_logs: list[dict[str, Any]]) -> None:
+        """Insert할 plc log를 큐에 추가, 여러 스레드에서 호출해도 안전함.
+
+        Args:
+            plc_logs (list[dict[str, Any]]): build_plc_logs로 만든 plc log
+        """
+        if plc_logs:
+            self._queue.put(plc_logs)
+
+    def start(self) -> None:
+        """백그라운드 스레드 시작, 앱 startup에서 호출."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="plc-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 로그를 모두 insert, 앱 shutdown에서 호출."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.flush()
+        except Exception:
+            logging.exception(
+                "종료 전에 plc log %d건을 insert하지 못했습니다.",
+                len(self._pending),
+            )
+
+    def flush(self) -> None:
+        """이전에 실패한 로그와 큐에 쌓인 로그를 하나의 트랜잭션으로 insert.
+
+        insert에 실패하면 로그를 다음 flush에서 다시 시도하도록 보관하고 예외를 raise한다.
+        현재 plc 모델은 plc log에서 계산하므로, plc 모델 값이 바뀐 경우에만 관련 캐시를 비운다.
+        """
+        with self._flush_lock:
+            plc_logs = self._pending
+            self._pending = []
+            while True:
+                try:
+                    plc_logs.extend(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not plc_logs:
+                return
+
+            try:
+                with PLCSessionLocal() as session:
+                    insert_plc_logs(plc_logs, session)
+            except Exception:
+                self._keep_pending(plc_logs)
+                raise
+            plc_model_changed = self._update_plc_models(plc_logs)
+        if plc_model_changed:
+            load_current_plc_model.cache_clear()
+            load_detail_init.cache_clear()
+
+    def _update_plc_models(self, plc_logs: list[dict[str, Any]]) -> bool:
+        """Insert한 로그에서 호기별 plc 모델 값을 갱신하고 바뀐 값이 있는지 리턴.
+
+        Args:
+            plc_logs (list[dict[str, Any]]): insert한 로그, 오래된 순서
+
+        Returns:
+            bool
+        """
+        plc_model_mm_ids = load_plc_model_mm_ids()
+        latest = {
+            plc_log["mm_id"]: plc_log["value"]
+            for plc_log in plc_logs
+            if plc_log["mm_id"] in plc_model_mm_ids
+        }
+        changed = any(
+            self._plc_models.get(mm_id) != value for mm_id, value in latest.items()
+        )
+        self._plc_models.update(latest)
+        return changed
+
+    def _keep_pending(self, plc_logs: list[dict[str, Any]]) -> None:
+        """Insert에 실패한 로그를 보관, max_pending을 넘으면 오래된 로그부터 버림.
+
+        Args:
+            plc_logs (list[dict[str, Any]]): insert에 실패한 로그, 오래된 순서
+        """
+        overflow = len(plc_logs) - self.max_pending
+        if overflow > 0:
+            logging.error(
+                "보관 가능한 개수를 넘어서 오래된 plc log %d건을 버립니다.",
+                overflow,
+            )
+            plc_logs = plc_logs[overflow:]
+        self._pending = plc_logs
+
+    def _run(self) -> None:
+        """flush_interval마다 flush를 호출하는 스레드 루프."""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logging.exception("plc log를 insert하지 못했습니다.")
+
+
+plc_log_writer = PLCLogWriter(
+    setting.plc_log_flush_interval,
+    setting.plc_log_max_pending,
+)
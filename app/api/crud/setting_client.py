@@ -5,12 +5,12 @@
 """
 import logging
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from datetime import datetime
-from typing import Any, Optional, TypeVar, Union
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
 
 from api.crud.util import (
-    general_insert_multiple_value,
-    general_insert_value,
+    get_detail_motor_number_list,
     update_variable_with_float_template,
 )
 from api.format.setting_client import (
@@ -49,7 +49,8 @@ from db.service.model import (
     VariableSpeedThreshold,
 )
 from fastapi import HTTPException
-from pytz import timezone, utc
+from pydantic.datetime_parse import parse_datetime
+from pytz import timezone
 from schemas.model import UniformSpeedMotor, VariableSpeedMotor
 from schemas.setting import (
     FDCConfigDTO,
@@ -57,54 +58,120 @@ from schemas.setting import (
     MotorEquipment,
     ParameterSettingModel,
 )
-from sqlalchemy import and_
+from sqlalchemy import bindparam, delete, exists, select, update
 from sqlalchemy.engine.row import Row
+from sqlalchemy.exc import InterfaceError, OperationalError, StatementError
 from sqlalchemy.ext.declarative import DeclarativeMeta
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ColumnElement, Select, Update
+from util.cache import ttl_cache
 from util.minio import get_zstd_object
-from util.utils import delete_key, extract_need_key, load_columns, row_to_dict
+from util.utils import (
+    construct_model,
+    row_to_dict,
+)
 
 T = TypeVar("T")
 
+# 요청마다 timezone 이름을 다시 찾지 않도록 import 시점에 한 번만 생성
+_LOCAL_TIMEZONE = timezone(setting.timezone)
+
 
 def get_motors_in_equipment(equipment_id: int) -> list[dict[str, Union[int, str]]]:
     """특정 호기번호를 주었을 때, 거기 있는 모든 모터 정보 리턴."""
-    return list(
-        filter(
-            lambda x: x["equipment_id"] == equipment_id,
-            (x.dict() for x in read_total_motor_equipment()),
-        ),
-    )
+    return [
+        motor
+        for motor in read_total_motor_equipment_dicts()
+        if motor["equipment_id"] == equipment_id
+    ]
+
+
+@ttl_cache(setting.cache_ttl)
+def load_equipment_motors(
+    equipment_id: int,
+) -> tuple[list[dict[str, Union[int, str]]], dict[str, tuple[int, ...]]]:
+    """트렌드, 대쉬보드 api에서 공통으로 필요한 호기의 모터 정보와 파트별 모터 번호 리턴.
+
+    결과는 캐시되어 여러 요청이 공유하므로 수정하면 안됨.
+
+    Args:
+        equipment_id (int): 호기 번호
+    Returns:
+        Tuple[List[Dict[str, Union[int, str]]], Dict[str, Tuple[int, ...]]]
+    """
+    motors_in_equipment = get_motors_in_equipment(equipment_id)
+    equipment_name = motors_in_equipment[0]["equipment_name"]
+    return motors_in_equipment, get_detail_motor_number_list(equipment_name)
 
 
+@ttl_cache(setting.cache_ttl)
 def read_total_motor_equipment() -> list[MotorEquipment]:
     """모터 테이블에서 호기 번호, 모터 번호, 모터 이름 정보 전부 불러오기.
 
     Returns:
         List[MotorEquipment]
     """
+    return [
+        construct_model(MotorEquipment, row)
+        for row in read_total_motor_equipment_dicts()
+    ]
+
+
+_TOTAL_MOTOR_EQUIPMENT_STMT = (
+    select(
+        Equipment.line_id,
+        Equipment.name.label("equipment_name"),
+        Motor.equipment_id,
+        Motor.number,
+        Motor.name,
+        Motor.category,
+    )
+    .join(Motor, Motor.equipment_id == Equipment.id)
+    .order_by(Motor.equipment_id.asc(), Motor.number.asc())
+)
+
+
+@ttl_cache(setting.cache_ttl)
+def read_total_motor_equipment_dicts() -> list[dict[str, Union[int, str]]]:
+    """read_total_motor_equipment와 같은 정보를 모델 변환 없이 dict로 불러오기.
+
+    dict만 필요한 호출부에서 pydantic 모델 생성과 .dict() 변환을 반복하지 않도록 사용.
+    결과는 캐시되어 여러 요청이 공유하므로 수정하면 안됨.
+
+    Returns:
+        List[Dict[str, Union[int, str]]]
+    """
     with SessionLocal() as session:
-        query_results = (
-            session.query(Motor, Equipment.name, Equipment.line_id)
-            .join(Motor, Motor.equipment_id == Equipment.id)
-            .order_by(Motor.equipment_id.asc(), Motor.number.asc())
-            .all()
+        return [
+            dict(row)
+            for row in session.execute(_TOTAL_MOTOR_EQUIPMENT_STMT).mappings()
+        ]
+
+
+def _acq_time_range_stmt(orm_cls: DeclarativeMeta) -> Select:
+    """특정 호기, 모터의 start~end 구간 row를 최신순으로 조회하는 select문 생성.
+
+    start, end, equipment_id, motor_number는 실행할 때 bind parameter로 넘긴다.
+
+    Args:
+        orm_cls (DeclarativeMeta): acq_time, equipment_id, motor_number 컬럼이 있는 테이블
+    Returns:
+        Select
+    """
+    return (
+        select(orm_cls.__table__)
+        .where(
+            orm_cls.acq_time > bindparam("start"),
+            orm_cls.acq_time < bindparam("end"),
+            orm_cls.equipment_id == bindparam("equipment_id"),
+            orm_cls.motor_number == bindparam("motor_number"),
         )
+        .order_by(orm_cls.acq_time.desc())
+    )
 
-    needed_keys = ["line_id", "equipment_id", "number", "name", "category"]
-    response = []
-    for row in query_results:
-        motor_query_result, equipment_name, line_id = row
-        motor_dict = [
-            extract_need_key(row, needed_keys)
-            for row in row_to_dict([motor_query_result])
-        ]
-        equipment_dict = {"equipment_name": equipment_name, "line_id": line_id}
-        equipment_dict.update(motor_dict[0])
-        motor_equipment = MotorEquipment(**equipment_dict)
-        response.append(motor_equipment)
 
-    return response
+_METADATA_RANGE_STMT = _acq_time_range_stmt(MetaData)
+_TRIGGER_RANGE_STMT = _acq_time_range_stmt(Trigger)
 
 
 def read_metadata(
@@ -120,21 +187,17 @@ def read_metadata(
     Returns:
         List[MetadataDTO]
     """
+    params = {
+        "start": start,
+        "end": end,
+        "equipment_id": equipment_id,
+        "motor_number": motor_number,
+    }
     with MetadataSessionLocal() as session:
-        query_results = (
-            session.query(MetaData)
-            .filter(
-                and_(
-                    MetaData.acq_time > start,
-                    MetaData.acq_time < end,
-                ),
-            )
-            .filter(MetaData.equipment_id == equipment_id)
-            .filter(MetaData.motor_number == motor_number)
-            .order_by(MetaData.acq_time.desc())
-            .all()
-        )
-    return [MetadataDTO(**row) for row in row_to_dict(query_results)]
+        return [
+            MetadataDTO(**row)
+            for row in session.execute(_METADATA_RANGE_STMT, params).mappings()
+        ]
 
 
 def read_metadata_with_rms(
@@ -148,60 +211,61 @@ def read_metadata_with_rms(
     추후 metadata-rms 기능을 개발하고 싶은 경우, 본 함수를 사용하는 것보다는
     trigger 테이블에서 rms_v, rms_w를 만드는 것이 바람직함.
     """
+    params = {
+        "start": start,
+        "end": end,
+        "equipment_id": equipment_id,
+        "motor_number": motor_number,
+    }
     with MetadataSessionLocal() as session:
-        query_results = (
-            session.query(MetaData)
-            .filter(
-                and_(
-                    MetaData.acq_time > start,
-                    MetaData.acq_time < end,
-                ),
-            )
-            .filter(
-                MetaData.equipment_id == equipment_id,
-                MetaData.motor_number == motor_number,
-            )
-            .filter()
-            .order_by(MetaData.acq_time.desc())
-            .all()
-        )
-
-        metadata_query_results = row_to_dict(query_results)
-
+        metadata_query_results = [
+            dict(row) for row in session.execute(_METADATA_RANGE_STMT, params).mappings()
+        ]
     with FeatureSessionLocal() as session:
-        query_results = (
-            session.query(Trigger)
-            .filter(
-                and_(
-                    Trigger.acq_time > start,
-                    Trigger.acq_time < end,
-                ),
-            )
-            .filter(Trigger.equipment_id == equipment_id)
-            .filter(Trigger.motor_number == motor_number)
-            .order_by(Trigger.acq_time.desc())
-            .all()
-        )
-
-    trigger_query_results = row_to_dict(query_results)
+        trigger_query_results = [
+            dict(row) for row in session.execute(_TRIGGER_RANGE_STMT, params).mappings()
+        ]
 
     return matching_metadata_and_trigger(metadata_query_results, trigger_query_results)
 
 
-def read_motor_category(equipment_id: int, motor_number: int) -> str:
+_MOTOR_CATEGORY_STMT = (
+    select(Motor.category)
+    .where(
+        Motor.equipment_id == bindparam("equipment_id"),
+        Motor.number == bindparam("motor_number"),
+    )
+    .limit(1)
+)
+
+
+@ttl_cache(setting.cache_ttl, maxsize=1024)
+def read_motor_category(equipment_id: int, motor_number: int) -> Optional[str]:
     """equipment_id, motor_number를 이용해서 모터 카테고리 정보 받아오기.
 
     Returns:
-        List[Dict[str, Union[int, str]]]
+        Optional[str]: 해당 모터가 없으면 None
     """
     with SessionLocal() as session:
-        [query_results] = (
-            session.query(Motor.category)
-            .filter(Motor.equipment_id == equipment_id, Motor.number == motor_number)
-            .all()[0]
-        )
-
-    return query_results
+        return session.execute(
+            _MOTOR_CATEGORY_STMT,
+            {"equipment_id": equipment_id, "motor_number": motor_number},
+        ).scalar()
+
+
+_MOTOR_EQUIPMENT_STMT = (
+    select(
+        Equipment.name.label("equipment_name"),
+        Motor.name,
+        Motor.equipment_id,
+        Motor.number,
+    )
+    .join(Motor, Motor.equipment_id == Equipment.id)
+    .where(
+        Motor.equipment_id == bindparam("equipment_id"),
+        Motor.number == bindparam("motor_number"),
+    )
+)
 
 
 def read_motor_equipment(equipment_id: int, motor_number: int) -> list[dict[str, Any]]:
@@ -213,34 +277,67 @@ def read_motor_equipment(equipment_id: int, motor_number: int) -> list[dict[str,
     Returns:
         List[Dict[str, Union[int, str]]].
     """
+    params = {"equipment_id": equipment_id, "motor_number": motor_number}
     with SessionLocal() as session:
-        query_results = (
-            session.query(Motor, Equipment.name)
-            .join(Motor, Motor.equipment_id == Equipment.id)
-            .filter(Motor.equipment_id == equipment_id, Motor.number == motor_number)
-            .all()
-        )
-
-    needed_keys = ["equipment_id", "number", "name"]
-    response = []
-    for row in query_results:
-        motor_query_result, equipment_name = row
-        motor_dict = [
-            extract_need_key(row, needed_keys)
-            for row in row_to_dict([motor_query_result])
+        return [
+            dict(row)
+            for row in session.execute(_MOTOR_EQUIPMENT_STMT, params).mappings()
         ]
-        equipment_dict = {"equipment_name": equipment_name}
-        equipment_dict.update(motor_dict[0])
-        response.append(equipment_dict)
 
-    return response
 
+class PathParts(NamedTuple):
+    """Minio object 경로에서 추출한 metadata 키.
+
+    Attributes:
+        line_name: 라인 이름, metadata에는 line_id로 저장하므로 조회에는 쓰지 않음
+        equipment_id: 호기 번호
+        motor_number: 모터 번호
+        phase: 데이터 종류(e.g. 전류:uvw)
+        acq_time: 데이터 취득 시간
+    """
+
+    line_name: str
+    equipment_id: int
+    motor_number: int
+    phase: str
+    acq_time: datetime
+
+
+def parse_minio_path(path: str) -> PathParts:
+    """Minio object 경로를 한 번만 split하여 PathParts로 변환하는 함수.
 
-def read_minio_object(path: str) -> Optional[dict]:
+    Args:
+        path (str): line_name/equipment_id/motor_number/year/month/day/HHMMSS_phase.zst
+
+    Returns:
+        PathParts
+    """
+    parts = path.split("/")
+    line_name, equipment_id, motor_number = parts[1:4]
+    year, month, day, file_name = parts[4:]
+    hhmmss, phase = file_name.rsplit(".", 1)[0].split("_")
+    return PathParts(
+        line_name=line_name,
+        equipment_id=int(equipment_id),
+        motor_number=int(motor_number),
+        phase=phase,
+        acq_time=datetime.strptime(  # noqa: DTZ007
+            f"{year}{month}{day}{hhmmss}",
+            "%Y%m%d%H%M%S",
+        ),
+    )
+
+
+def read_minio_object(
+    path: str,
+    loader: Callable[[str], Any] = get_zstd_object,
+) -> Optional[dict]:
     """Zstd 압축방식으로 압축된 minio object를 압축 해제 후 float list로 리턴하는 함수.
 
     Args:
         path (str): line_name/equipment_id/motor_number/year/month/day/HHMMSS_phase.zst
+        loader (Callable[[str], Any]): minio 객체를 읽어 current 값으로 변환하는 함수,
+                                    기본값은 float list로 변환하는 get_zstd_object
 
 
     Returns:
@@ -251,114 +348,98 @@ def read_minio_object(path: str) -> Optional[dict]:
         /13/02/03/2023/04/12/045137_u.zst
 
     """
-    line_id, equipment_id, motor_number = path.split("/")[1:4]
-    year, month, day, file_name = path.split("/")[4:]
-    hhmmss, phase = file_name.split("_")
-    phase = phase.split(".")[0]
-    acq_time = f"{year}-{month}-{day} {hhmmss}"
-    acq_time_date = datetime.strptime(acq_time, "%Y-%m-%d %H%M%S")  # noqa: DTZ007
-
-    line_id = 1  # type: ignore[assignment]
+    path_parts = parse_minio_path(path)
+    # 경로의 첫 값은 라인 이름이고, metadata는 단일 라인(id=1)으로 저장됨
+    line_id = 1
+    metadata_conditions = (
+        MetaData.line_id == line_id,
+        MetaData.equipment_id == path_parts.equipment_id,
+        MetaData.motor_number == path_parts.motor_number,
+        MetaData.phase == path_parts.phase,
+    )
 
     try:
-        response_dict = {"current": get_zstd_object(path)}
+        response_dict = {"current": loader(path)}
     except ClientError as ex:
-        if ex.response["Error"]["Code"] == "NoSuchKey":  # minio에 객체가 없음
-            # MetaData에 실제로 해당 path가 존재하지 않는지 확인하기
-            with MetadataSessionLocal() as session:
-                query_result = (
-                    session.query(MetaData).filter(
-                        MetaData.line_id == line_id,
-                        MetaData.equipment_id == equipment_id,
-                        MetaData.motor_number == motor_number,
-                        MetaData.phase == phase,
-                    )
-                ).all()
-
-                if not query_result:  # minio에 없고, metadata RDS에도 없을 경우
-                    logging.warning("Data not found in minio and metadata RDBMS")
-                    raise HTTPException(
-                        status_code=404,
-                        detail="Data not found in minio and metadata RDBMS",
-                    ) from ex
-                # minio에는 없는데, metadata RDS에 해당 값이 존재할 경우, 해당 값 삭제
-                if query_result:
-                    session.query(MetaData).filter(
-                        MetaData.line_id == line_id,
-                        MetaData.equipment_id == equipment_id,
-                        MetaData.motor_number == motor_number,
-                        MetaData.phase == phase,
-                    ).delete()
-                    session.commit()
-
-                    logging.warning("Data was in Metadata RDBMS but not in minio")
-                    # minio 객체가 없으므로 에러 메시지 전송
-                    raise HTTPException(
-                        status_code=404,
-                        detail="Data was in Metadata RDBMS but not in minio",
-                    ) from ex
-        else:
+        if ex.response["Error"]["Code"] != "NoSuchKey":
             logging.error("Data not found, need to check")
             raise HTTPException(status_code=404, detail="Data not found") from ex
-    else:  # minio에 객체가 있음
+
+        # minio에 객체가 없으므로 metadata RDS에 남아있는 값이 있으면 삭제
         with MetadataSessionLocal() as session:
-            query_result = (
-                session.query(MetaData).filter(
-                    MetaData.line_id == line_id,
-                    MetaData.equipment_id == equipment_id,
-                    MetaData.motor_number == motor_number,
-                    MetaData.phase == phase,
+            deleted_rows = (
+                session.execute(
+                    delete(MetaData)
+                    .where(*metadata_conditions)
+                    .returning(MetaData.acq_time),
                 )
-            ).all()
-
-        if (
-            not query_result
-        ):  # minio에 객체가 있는데, metadata RDS에는 없을 경우 metadata RDS에 insert
-            raw_data_dict = {
-                "line_id": line_id,
-                "equipment_id": equipment_id,
-                "motor_number": motor_number,
-                "phase": phase,
-                "acq_time": acq_time_date,
-                "file_path": path,
-            }
-            # 이 작업을 해주면 minio, metadata RDS에 둘다 존재함
-            general_insert_value(MetadataSessionLocal, MetaData, raw_data_dict)
-
-        # minio, metadata RDS에 둘다 존재함
-        channel_dict = {"channel": path.split("_")[-1].split(".")[0]}
-        equipment_id, motor_number = path.split("/")[2:4]
-        response_dict.update(
-            read_motor_equipment(int(equipment_id), int(motor_number))[0],
-        )
-        response_dict.update(channel_dict)
+                .scalars()
+                .all()
+            )
+            session.commit()
+
+        if not deleted_rows:  # minio에 없고, metadata RDS에도 없을 경우
+            logging.warning("Data not found in minio and metadata RDBMS")
+            raise HTTPException(
+                status_code=404,
+                detail="Data not found in minio and metadata RDBMS",
+            ) from ex
+        logging.warning("Data was in Metadata RDBMS but not in minio")
+        # minio 객체가 없으므로 에러 메시지 전송
+        raise HTTPException(
+            status_code=404,
+            detail="Data was in Metadata RDBMS but not in minio",
+        ) from ex
+
+    # minio에 객체가 있는데, metadata RDS에는 없을 경우 metadata RDS에 insert
+    with MetadataSessionLocal() as session:
+        if not session.execute(select(exists().where(*metadata_conditions))).scalar():
+            session.add(
+                MetaData(
+                    line_id=line_id,
+                    equipment_id=path_parts.equipment_id,
+                    motor_number=path_parts.motor_number,
+                    phase=path_parts.phase,
+                    acq_time=path_parts.acq_time,
+                    file_path=path,
+                ),
+            )
+            try:
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logging.error(e)
+
+    # minio, metadata RDS에 둘다 존재함
+    response_dict.update(
+        read_motor_equipment(path_parts.equipment_id, path_parts.motor_number)[0],
+    )
+    response_dict["channel"] = path_parts.phase
     return response_dict
 
 
+_FDC_CONFIG_COLUMNS = tuple(
+    column
+    for column in FDCConfig.__table__.columns
+    if column.name not in ("id", "updated_time")
+)
+
+
+@ttl_cache(setting.cache_ttl)
 def read_fdc_config() -> FDCConfigDTO:
     """Fdc config를 읽는 함수.
 
+    update_fdc_config로 값을 바꾸면 cache_clear()로 캐시를 비워야함.
+
     Returns:
         FDCConfigDTO
     """
     with FDCSessionLocal() as session:
-        query_results = session.query(FDCConfig).all()
-
-    columns = load_columns(FDCConfig())
-    columns.remove("id")
-    columns.remove("updated_time")
+        row = session.execute(select(*_FDC_CONFIG_COLUMNS).limit(1)).mappings().first()
 
-    if not query_results:
-        response = {key: "" for key in columns}
-
-    else:
-        response = {
-            key: value
-            for key, value in row_to_dict(query_results)[0].items()
-            if key in columns
-        }
-
-    return response
+    if row is None:
+        return {column.name: "" for column in _FDC_CONFIG_COLUMNS}
+    return dict(row)
 
 
 def update_fdc_config(config: FDCConfigDTO) -> FDCConfigDTO:
@@ -378,32 +459,311 @@ def update_fdc_config(config: FDCConfigDTO) -> FDCConfigDTO:
     return FDCConfigDTO(**config)
 
 
-def insert_plc_log(body: dict) -> None:
-    """Plc log를 쌓는 함수.
+def build_plc_logs(body: dict, session: Session) -> list[dict[str, Any]]:
+    """Kepware에서 보낸 body를 plc log 테이블에 insert할 row로 변환하는 함수.
 
     Args:
         body(dict): Kepware에서 보내는 plc log.
+        session (Session): memory mapping을 조회할 PLC DB 세션
+    Returns:
+        list[dict[str, Any]]
     """
-    plc_log_dict = {}
-    plc_log_dict["timestamp"] = body["timestamp"]
-    body.pop("timestamp", None)
+    # DB에 넣을 수 없는 timestamp는 큐에 쌓기 전에 요청에서 바로 거절
+    try:
+        timestamp = parse_datetime(body.pop("timestamp"))
+    except (KeyError, TypeError, ValueError) as err:
+        raise HTTPException(
+            status_code=422,
+            detail="timestamp가 없거나 시간 형식이 아닙니다.",
+        ) from err
 
+    tag_values: dict[str, list[tuple[str, Any]]] = defaultdict(list)
     for key, value in body.items():
         _, equipment_name, name = key.split(".")
-        filtered_list = view_memory_mapping(
-            matching_equipment_id_using_equipment_name(equipment_name),
+        tag_values[equipment_name].append((name, value))
+
+    memory_mapping_index = read_memory_mapping_index(tag_values.keys(), session)
+    return [
+        {"timestamp": timestamp, "mm_id": mm_id, "value": value}
+        for equipment_name, values in tag_values.items()
+        for name, value in values
+        for mm_id in memory_mapping_index.get((equipment_name, name), ())
+    ]
+
+
+# 다시 insert하면 성공할 수 있는 DB 접속 오류, 그 외의 오류는 로그 자체의 문제로 봄
+_PLC_LOG_RETRY_ERRORS = (OperationalError, InterfaceError)
+
+
+def insert_plc_logs(plc_logs: list[dict[str, Any]], session: Session) -> None:
+    """Plc log를 하나의 트랜잭션에서 한 번에 insert하는 함수.
+
+    DB 접속 오류는 호출한 쪽에서 다시 시도할 수 있도록 그대로 raise하고,
+    중복이나 잘못된 값 등 그 외의 오류는 한 건씩 insert하면서 문제가 있는 로그만 건너뛴다.
+
+    Args:
+        plc_logs (list[dict[str, Any]]): build_plc_logs로 만든 plc log
+        session (Session): PLC DB 세션
+    """
+    if not plc_logs:
+        return
+
+    try:
+        with session.begin_nested():
+            session.bulk_insert_mappings(PLCLog, plc_logs)
+    except _PLC_LOG_RETRY_ERRORS:
+        raise
+    except StatementError:
+        logging.warning("plc log를 한 번에 insert하지 못하여 한 건씩 insert합니다.")
+        _insert_plc_logs_one_by_one(plc_logs, session)
+    session.commit()
+
+
+def _insert_plc_logs_one_by_one(plc_logs: list[dict], session: Session) -> None:
+    """Plc log를 한 건씩 savepoint 안에서 insert하는 함수.
+
+    이미 들어간 로그나 잘못된 값이 섞여 있으면 실패한 로그만 건너뛰고
+    나머지는 그대로 insert하며, DB 접속 오류는 그대로 raise한다.
+
+    Args:
+        plc_logs (list[dict]): insert할 plc log
+        session (Session): PLC DB 세션
+    """
+    for plc_log in plc_logs:
+        try:
+            with session.begin_nested():
+                session.add(PLCLog(**plc_log))
+        except _PLC_LOG_RETRY_ERRORS:
+            raise
+        except StatementError as e:
+            logging.error(e)
+
+
+def read_memory_mapping_index(
+    equipment_names: Iterable[str],
+    plc_session: Session,
+) -> dict[tuple[str, str], list[int]]:
+    """(호기 이름, memory mapping 이름)으로 memory mapping id를 찾는 딕셔너리 생성.
+
+    plc log body의 key("PLC.13-1.CellState_Model")마다 호기와 memory mapping 테이블을
+    조회하지 않도록, body에 들어있는 호기들에 대해서만 두 테이블을 한 번씩 읽어서 만든다.
+    같은 이름의 호기가 여러 개면 id가 가장 작은 호기를 사용한다.
+
+    Args:
+        equipment_names (Iterable[str]): plc log body에 들어있는 호기 이름
+        plc_session (Session): memory mapping을 조회할 PLC DB 세션
+    Returns:
+        dict[tuple[str, str], list[int]]
+    """
+    with SessionLocal() as session:
+        equipments = session.execute(
+            select(Equipment.id, Equipment.line_id, Equipment.name)
+            .where(Equipment.name.in_(list(equipment_names)))
+            .order_by(Equipment.id.desc()),
+        ).all()
+
+    # 내림차순으로 덮어써서 이름별로 id가 가장 작은 호기만 남김
+    equipment_by_name = {equipment.name: equipment for equipment in equipments}
+    if not equipment_by_name:
+        return {}
+    equipment_names_by_key = {
+        (equipment.id, equipment.line_id): name
+        for name, equipment in equipment_by_name.items()
+    }
+
+    memory_mappings = plc_session.execute(
+        select(
+            MemoryMapping.id,
+            MemoryMapping.line_id,
+            MemoryMapping.equipment_id,
+            MemoryMapping.name,
+        ).where(
+            MemoryMapping.equipment_id.in_(
+                [equipment.id for equipment in equipment_by_name.values()],
+            ),
+        ),
+    ).all()
+
+    memory_mapping_index: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for memory_mapping in memory_mappings:
+        equipment_name = equipment_names_by_key.get(
+            (memory_mapping.equipment_id, memory_mapping.line_id),
         )
-        for i in filtered_list:
-            if i["name"] == name:
-                plc_log_dict.update({"mm_id": i["id"], "value": value})
-                general_insert_value(PLCSessionLocal, PLCLog, plc_log_dict)
+        if equipment_name is not None:
+            memory_mapping_index[(equipment_name, memory_mapping.name)].append(
+                memory_mapping.id,
+            )
+    return memory_mapping_index
+
+
+_MEMORY_MAPPING_STMT = select(
+    MemoryMapping.id,
+    MemoryMapping.line_id,
+    MemoryMapping.equipment_id,
+    MemoryMapping.name,
+)
+
 
+@ttl_cache(setting.cache_ttl)
+def read_memory_mapping() -> list[dict[str, Union[int, str]]]:
+    """PLC DB의 memorymapping 테이블을 읽는 함수.
 
-def read_memory_mapping() -> dict[str, Union[int, str]]:
-    """PLC DB의 memorymapping 테이블을 읽는 함수."""
+    ORM 객체로 만들지 않고 필요한 컬럼만 조회해서 바로 dict로 변환한다.
+    """
     with PLCSessionLocal() as session:
-        query_results = session.query(MemoryMapping).all()
-    return row_to_dict(query_results)
+        return [
+            dict(row)
+            for row in session.execute(_MEMORY_MAPPING_STMT).mappings()
+        ]
+
+
+_SETTING_SKIPPED_COLUMNS = frozenset(("id", "updated_time"))
+# DTO 필드명과 다른 컬럼은 select할 때 label로 이름을 바꿔서 조회 결과를 그대로 사용
+_SETTING_COLUMN_LABELS: dict[tuple[DeclarativeMeta, str], str] = {
+    (Equipment, "name"): "equipment_name",
+    (MotorBearing, "moving_median_sample_number"): (
+        "motor_bearing_moving_median_sample_number"
+    ),
+    (ExternalBearing, "moving_median_sample_number"): (
+        "external_bearing_moving_median_sample_number"
+    ),
+    (TensionBearing, "moving_median_sample_number"): (
+        "tension_bearing_moving_median_sample_number"
+    ),
+    (ExternalBearing, "bearing_number"): "external_bearing_number",
+    (TensionBearing, "bearing_number"): "tension_bearing_number",
+}
+
+
+def _setting_columns(*orm_classes: DeclarativeMeta) -> list[ColumnElement]:
+    """세팅 파라미터 조회 시 select할 컬럼 목록을 만드는 함수.
+
+    id, updated_time은 제외하고, _SETTING_COLUMN_LABELS에 있는 컬럼은 DTO 필드명으로
+    label을 붙인다. 여러 테이블에 같은 이름의 컬럼이 있으면 뒤에 오는 테이블의 컬럼을 사용한다.
+
+    Args:
+        orm_classes (DeclarativeMeta): join할 테이블 ORM 클래스
+    Returns:
+        list[ColumnElement]
+    """
+    columns = {}
+    for orm_cls in orm_classes:
+        for column in orm_cls.__table__.columns:
+            if column.name in _SETTING_SKIPPED_COLUMNS:
+                continue
+            name = _SETTING_COLUMN_LABELS.get((orm_cls, column.name), column.name)
+            columns[name] = column.label(name)
+    return list(columns.values())
+
+
+_VARIABLE_SETTING_COLUMNS = _setting_columns(
+    Equipment,
+    Motor,
+    Variable,
+    VariableSpeedThreshold,
+)
+_EXTERNAL_SETTING_COLUMNS = _setting_columns(
+    Equipment,
+    Motor,
+    MotorBearing,
+    ExternalBearing,
+    UniformSpeedThreshold,
+)
+_TENSION_SETTING_COLUMNS = _setting_columns(
+    Equipment,
+    Motor,
+    MotorBearing,
+    ExternalBearing,
+    TensionBearing,
+    UniformSpeedThreshold,
+)
+
+
+_VARIABLE_SETTING_STMT = (
+    select(*_VARIABLE_SETTING_COLUMNS)
+    .select_from(Equipment)
+    .join(Motor)
+    .join(Variable)
+    .join(VariableSpeedThreshold)
+    .where(
+        Motor.category == "v3",  # 폴란드 api 기준으로는 v3, 오창에는 v1 포함
+        Motor.equipment_id == Variable.equipment_id,
+        Motor.number == Variable.motor_number,
+        Motor.equipment_id == VariableSpeedThreshold.equipment_id,
+        Motor.number == VariableSpeedThreshold.motor_number,
+        VariableSpeedThreshold.plc == bindparam("plc"),
+        Variable.plc == bindparam("plc"),
+    )
+)
+
+_EXTERNAL_SETTING_STMT = (
+    select(*_EXTERNAL_SETTING_COLUMNS)
+    .select_from(Equipment)
+    .join(Motor)
+    .join(MotorBearing)
+    .join(ExternalBearing)
+    .join(UniformSpeedThreshold)
+    .where(
+        Motor.category == "u3e",
+        Motor.equipment_id == MotorBearing.equipment_id,
+        Motor.number == MotorBearing.motor_number,
+        Motor.equipment_id == ExternalBearing.equipment_id,
+        Motor.number == ExternalBearing.motor_number,
+        Motor.equipment_id == UniformSpeedThreshold.equipment_id,
+        Motor.number == UniformSpeedThreshold.motor_number,
+        UniformSpeedThreshold.plc == bindparam("plc"),
+        MotorBearing.plc == bindparam("plc"),
+        ExternalBearing.plc == bindparam("plc"),
+    )
+)
+
+_TENSION_SETTING_STMT = (
+    select(*_TENSION_SETTING_COLUMNS)
+    .select_from(Equipment)
+    .join(Motor)
+    .join(MotorBearing)
+    .join(ExternalBearing)
+    .join(TensionBearing)
+    .join(UniformSpeedThreshold)
+    .where(
+        Motor.category == "u3t",
+        Motor.equipment_id == MotorBearing.equipment_id,
+        Motor.number == MotorBearing.motor_number,
+        Motor.equipment_id == ExternalBearing.equipment_id,
+        Motor.number == ExternalBearing.motor_number,
+        Motor.equipment_id == UniformSpeedThreshold.equipment_id,
+        Motor.number == UniformSpeedThreshold.motor_number,
+        Motor.equipment_id == TensionBearing.equipment_id,
+        Motor.number == TensionBearing.motor_number,
+        UniformSpeedThreshold.plc == bindparam("plc"),
+        MotorBearing.plc == bindparam("plc"),
+        ExternalBearing.plc == bindparam("plc"),
+        TensionBearing.plc == bindparam("plc"),
+    )
+)
+
+# 모터 1개를 조회할 때는 같은 select문에 호기, 모터 번호 조건만 추가해서 사용
+_SINGLE_MOTOR_CONDITIONS = (
+    Motor.equipment_id == bindparam("equipment_id"),
+    Motor.number == bindparam("motor_number"),
+)
+_SINGLE_VARIABLE_SETTING_STMT = _VARIABLE_SETTING_STMT.where(*_SINGLE_MOTOR_CONDITIONS)
+_SINGLE_EXTERNAL_SETTING_STMT = _EXTERNAL_SETTING_STMT.where(*_SINGLE_MOTOR_CONDITIONS)
+_SINGLE_TENSION_SETTING_STMT = _TENSION_SETTING_STMT.where(*_SINGLE_MOTOR_CONDITIONS)
+
+
+def _variable_speed_motor(row: Mapping[str, Any]) -> VariableSpeedMotor:
+    """변속 모터 세팅 조회 결과 row를 VariableSpeedMotor로 변환.
+
+    Args:
+        row (Mapping[str, Any]): _VARIABLE_SETTING_COLUMNS로 조회한 row
+    Returns:
+        VariableSpeedMotor
+    """
+    return construct_model(
+        VariableSpeedMotor,
+        update_variable_with_float_template(dict(row)),
+    )
 
 
 def read_variable_setting(plc: int) -> list[VariableSpeedMotor]:
@@ -416,47 +776,10 @@ def read_variable_setting(plc: int) -> list[VariableSpeedMotor]:
     Returns:
         list[UniformSpeedMotor]
     """
-    """"""
     with SessionLocal() as session:
-        query_results = (
-            session.query(Equipment, Motor, Variable, VariableSpeedThreshold)
-            .select_from(Equipment)
-            .join(Motor)
-            .join(Variable)
-            .join(VariableSpeedThreshold)
-            .filter(
-                Motor.category == "v3",  # 폴란드 api 기준으로는 v3, 오창에는 v1 포함
-                Motor.equipment_id == Variable.equipment_id,
-                Motor.number == Variable.motor_number,
-                Motor.equipment_id == VariableSpeedThreshold.equipment_id,
-                Motor.number == VariableSpeedThreshold.motor_number,
-                VariableSpeedThreshold.plc == plc,
-                Variable.plc == plc,
-            )
-        ).all()
-    dict_list = row_to_dict(query_results)
+        rows = session.execute(_VARIABLE_SETTING_STMT, {"plc": plc}).mappings().all()
 
-    popped_column = ["id", "updated_time", "template"]
-
-    setting_client_param_list = []
-
-    for _dict in dict_list:
-        equipment, motor, variable, variable_threshold = (
-            _dict["Equipment"],
-            _dict["Motor"],
-            _dict["Variable"],
-            _dict["VariableSpeedThreshold"],
-        )
-        equipment["equipment_name"] = equipment.pop("name")
-        variable = update_variable_with_float_template(variable)
-        setting_client_param_list.append(
-            delete_key(
-                equipment | motor | variable | variable_threshold,
-                popped_column,
-            ),
-        )
-
-    return [VariableSpeedMotor(**x) for x in setting_client_param_list]
+    return [_variable_speed_motor(row) for row in rows]
 
 
 def read_external_setting(plc: int) -> list[UniformSpeedMotor]:
@@ -470,63 +793,10 @@ def read_external_setting(plc: int) -> list[UniformSpeedMotor]:
         list[UniformSpeedMotor]
     """
     with SessionLocal() as session:
-        query_results = (
-            session.query(
-                Equipment,
-                Motor,
-                MotorBearing,
-                ExternalBearing,
-                UniformSpeedThreshold,
-            )
-            .select_from(Equipment)
-            .join(Motor)
-            .join(MotorBearing)
-            .join(ExternalBearing)
-            .join(UniformSpeedThreshold)
-            .filter(
-                Motor.category == "u3e",
-                Motor.equipment_id == MotorBearing.equipment_id,
-                Motor.number == MotorBearing.motor_number,
-                Motor.equipment_id == ExternalBearing.equipment_id,
-                Motor.number == ExternalBearing.motor_number,
-                Motor.equipment_id == UniformSpeedThreshold.equipment_id,
-                Motor.number == UniformSpeedThreshold.motor_number,
-                UniformSpeedThreshold.plc == plc,
-                MotorBearing.plc == plc,
-                ExternalBearing.plc == plc,
-            )
-        ).all()
-    dict_list = row_to_dict(query_results)
-    popped_column = ["id", "updated_time"]
-
-    setting_client_param_list = []
-    for _dict in dict_list:
-        equipment, motor, motor_bearing, external_bearing, uniform_threshold = (
-            _dict["Equipment"],
-            _dict["Motor"],
-            _dict["MotorBearing"],
-            _dict["ExternalBearing"],
-            _dict["UniformSpeedThreshold"],
-        )
-        equipment["equipment_name"] = equipment.pop("name")
-        motor_bearing["motor_bearing_moving_median_sample_number"] = motor_bearing.pop(
-            "moving_median_sample_number",
-        )
-        external_bearing[
-            "external_bearing_moving_median_sample_number"
-        ] = external_bearing.pop("moving_median_sample_number")
-        setting_client_param_list.append(
-            delete_key(
-                equipment
-                | motor
-                | motor_bearing
-                | external_bearing
-                | uniform_threshold,
-                popped_column,
-            ),
-        )
-
-    return [UniformSpeedMotor(**x) for x in setting_client_param_list]
+        return [
+            construct_model(UniformSpeedMotor, row)
+            for row in session.execute(_EXTERNAL_SETTING_STMT, {"plc": plc}).mappings()
+        ]
 
 
 def read_tension_setting(plc: int) -> list[UniformSpeedMotor]:
@@ -540,81 +810,10 @@ def read_tension_setting(plc: int) -> list[UniformSpeedMotor]:
         list[UniformSpeedMotor]
     """
     with SessionLocal() as session:
-        query_results = (
-            session.query(
-                Equipment,
-                Motor,
-                MotorBearing,
-                ExternalBearing,
-                TensionBearing,
-                UniformSpeedThreshold,
-            )
-            .select_from(Equipment)
-            .join(Motor)
-            .join(MotorBearing)
-            .join(ExternalBearing)
-            .join(TensionBearing)
-            .join(UniformSpeedThreshold)
-            .filter(
-                Motor.category == "u3t",
-                Motor.equipment_id == MotorBearing.equipment_id,
-                Motor.number == MotorBearing.motor_number,
-                Motor.equipment_id == ExternalBearing.equipment_id,
-                Motor.number == ExternalBearing.motor_number,
-                Motor.equipment_id == UniformSpeedThreshold.equipment_id,
-                Motor.number == UniformSpeedThreshold.motor_number,
-                Motor.equipment_id == TensionBearing.equipment_id,
-                Motor.number == TensionBearing.motor_number,
-                UniformSpeedThreshold.plc == plc,
-                MotorBearing.plc == plc,
-                ExternalBearing.plc == plc,
-                TensionBearing.plc == plc,
-            )
-        ).all()
-
-    dict_list = row_to_dict(query_results)
-    popped_column = ["id", "updated_time"]
-
-    setting_client_param_list = []
-    for _dict in dict_list:
-        (
-            equipment,
-            motor,
-            motor_bearing,
-            external_bearing,
-            tension_bearing,
-            uniform_threshold,
-        ) = (
-            _dict["Equipment"],
-            _dict["Motor"],
-            _dict["MotorBearing"],
-            _dict["ExternalBearing"],
-            _dict["TensionBearing"],
-            _dict["UniformSpeedThreshold"],
-        )
-        motor_bearing["motor_bearing_moving_median_sample_number"] = motor_bearing.pop(
-            "moving_median_sample_number",
-        )
-        external_bearing[
-            "external_bearing_moving_median_sample_number"
-        ] = external_bearing.pop("moving_median_sample_number")
-        tension_bearing[
-            "tension_bearing_moving_median_sample_number"
-        ] = tension_bearing.pop("moving_median_sample_number")
-        equipment["equipment_name"] = equipment.pop("name")
-        setting_client_param_list.append(
-            delete_key(
-                equipment
-                | motor
-                | motor_bearing
-                | external_bearing
-                | tension_bearing
-                | uniform_threshold,
-                popped_column,
-            ),
-        )
-
-    return [UniformSpeedMotor(**x) for x in setting_client_param_list]
+        return [
+            construct_model(UniformSpeedMotor, row)
+            for row in session.execute(_TENSION_SETTING_STMT, {"plc": plc}).mappings()
+        ]
 
 
 def read_feature_by_acq_time(
@@ -635,12 +834,10 @@ def read_feature_by_acq_time(
         list[Row]
     """
     with SessionLocal() as session:
-        category = (
-            session.query(Motor.category).filter(
-                Motor.equipment_id == equipment_id,
-                Motor.number == motor_number,
-            )
-        ).first()[0]
+        category = session.execute(
+            _MOTOR_CATEGORY_STMT,
+            {"equipment_id": equipment_id, "motor_number": motor_number},
+        ).scalar()
 
     _cls_list = {
         "v3": VariableSpeedPhase3Feature,
@@ -662,6 +859,7 @@ def read_feature_by_acq_time(
     return query_results
 
 
+@ttl_cache(setting.cache_ttl)
 def read_plc_model() -> list[Row]:
     """GET /api/v1/setting-client/plc-model api에서 사용되는 함수.
 
@@ -692,48 +890,14 @@ def read_single_variable_setting(
     Returns:
         UniformSpeedMotor
     """
+    params = {
+        "plc": plc,
+        "equipment_id": equipment_id,
+        "motor_number": motor_number,
+    }
     with SessionLocal() as session:
-        query_results = (
-            session.query(Equipment, Motor, Variable, VariableSpeedThreshold)
-            .select_from(Equipment)
-            .join(Motor)
-            .join(Variable)
-            .join(VariableSpeedThreshold)
-            .filter(
-                Motor.category == "v3",  # 폴란드 api 기준으로는 v3, 오창에는 v1 포함
-                Motor.equipment_id == Variable.equipment_id,
-                Motor.number == Variable.motor_number,
-                Motor.equipment_id == VariableSpeedThreshold.equipment_id,
-                Motor.number == VariableSpeedThreshold.motor_number,
-                VariableSpeedThreshold.plc == plc,
-                Variable.plc == plc,
-                Motor.equipment_id == equipment_id,
-                Motor.number == motor_number,
-            )
-        ).all()
-    dict_list = row_to_dict(query_results)
-
-    popped_column = ["id", "updated_time"]
-
-    setting_client_param_list = []
-
-    for _dict in dict_list:
-        equipment, motor, variable, variable_threshold = (
-            _dict["Equipment"],
-            _dict["Motor"],
-            _dict["Variable"],
-            _dict["VariableSpeedThreshold"],
-        )
-        variable = update_variable_with_float_template(variable)
-        equipment["equipment_name"] = equipment.pop("name")
-        setting_client_param_list.append(
-            delete_key(
-                equipment | motor | variable | variable_threshold,
-                popped_column,
-            ),
-        )
-
-    return [VariableSpeedMotor(**x) for x in setting_client_param_list][0]
+        row = session.execute(_SINGLE_VARIABLE_SETTING_STMT, params).mappings().one()
+    return _variable_speed_motor(row)
 
 
 def read_single_tension_setting(
@@ -753,90 +917,14 @@ def read_single_tension_setting(
     Returns:
         UniformSpeedMotor
     """
+    params = {
+        "plc": plc,
+        "equipment_id": equipment_id,
+        "motor_number": motor_number,
+    }
     with SessionLocal() as session:
-        query_results = (
-            session.query(
-                Equipment,
-                Motor,
-                MotorBearing,
-                ExternalBearing,
-                TensionBearing,
-                UniformSpeedThreshold,
-            )
-            .select_from(Equipment)
-            .join(Motor)
-            .join(MotorBearing)
-            .join(ExternalBearing)
-            .join(TensionBearing)
-            .join(UniformSpeedThreshold)
-            .filter(
-                Motor.category == "u3t",
-                Motor.equipment_id == MotorBearing.equipment_id,
-                Motor.number == MotorBearing.motor_number,
-                Motor.equipment_id == ExternalBearing.equipment_id,
-                Motor.number == ExternalBearing.motor_number,
-                Motor.equipment_id == UniformSpeedThreshold.equipment_id,
-                Motor.number == UniformSpeedThreshold.motor_number,
-                Motor.equipment_id == TensionBearing.equipment_id,
-                Motor.number == TensionBearing.motor_number,
-                UniformSpeedThreshold.plc == plc,
-                MotorBearing.plc == plc,
-                ExternalBearing.plc == plc,
-                TensionBearing.plc == plc,
-                Motor.equipment_id == equipment_id,
-                Motor.number == motor_number,
-            )
-        ).all()
-
-    dict_list = row_to_dict(query_results)
-    popped_column = ["id", "updated_time"]
-
-    setting_client_param_list = []
-    for _dict in dict_list:
-        (
-            equipment,
-            motor,
-            motor_bearing,
-            external_bearing,
-            tension_bearing,
-            uniform_threshold,
-        ) = (
-            _dict["Equipment"],
-            _dict["Motor"],
-            _dict["MotorBearing"],
-            _dict["ExternalBearing"],
-            _dict["TensionBearing"],
-            _dict["UniformSpeedThreshold"],
-        )
-        motor_bearing["motor_bearing_moving_median_sample_number"] = motor_bearing.pop(
-            "moving_median_sample_number",
-        )
-        external_bearing[
-            "external_bearing_moving_median_sample_number"
-        ] = external_bearing.pop("moving_median_sample_number")
-        tension_bearing[
-            "tension_bearing_moving_median_sample_number"
-        ] = tension_bearing.pop("moving_median_sample_number")
-        equipment["equipment_name"] = equipment.pop("name")
-        external_bearing["external_bearing_number"] = external_bearing.pop(
-            "bearing_number",
-        )
-        tension_bearing["tension_bearing_number"] = tension_bearing.pop(
-            "bearing_number",
-        )
-        setting_client_param_list.append(
-            delete_key(
-                equipment
-                | motor
-                | motor_bearing
-                | external_bearing
-                | tension_bearing
-                | uniform_threshold,
-                popped_column,
-            ),
-        )
-
-    return [UniformSpeedMotor(**x) for x in setting_client_param_list][0]
+        row = session.execute(_SINGLE_TENSION_SETTING_STMT, params).mappings().one()
+    return construct_model(UniformSpeedMotor, row)
 
 
 def read_single_external_setting(
@@ -856,244 +944,161 @@ def read_single_external_setting(
     Returns:
         UniformSpeedMotor
     """
+    params = {
+        "plc": plc,
+        "equipment_id": equipment_id,
+        "motor_number": motor_number,
+    }
     with SessionLocal() as session:
-        query_results = (
-            session.query(
-                Equipment,
-                Motor,
-                MotorBearing,
-                ExternalBearing,
-                UniformSpeedThreshold,
-            )
-            .select_from(Equipment)
-            .join(Motor)
-            .join(MotorBearing)
-            .join(ExternalBearing)
-            .join(UniformSpeedThreshold)
-            .filter(
-                Motor.category == "u3e",
-                Motor.equipment_id == MotorBearing.equipment_id,
-                Motor.number == MotorBearing.motor_number,
-                Motor.equipment_id == ExternalBearing.equipment_id,
-                Motor.number == ExternalBearing.motor_number,
-                Motor.equipment_id == UniformSpeedThreshold.equipment_id,
-                Motor.number == UniformSpeedThreshold.motor_number,
-                UniformSpeedThreshold.plc == plc,
-                MotorBearing.plc == plc,
-                ExternalBearing.plc == plc,
-                Motor.equipment_id == equipment_id,
-                Motor.number == motor_number,
-            )
-        ).all()
-    dict_list = row_to_dict(query_results)
-    popped_column = ["id", "updated_time"]
-
-    setting_client_param_list = []
-    for _dict in dict_list:
-        equipment, motor, motor_bearing, external_bearing, uniform_threshold = (
-            _dict["Equipment"],
-            _dict["Motor"],
-            _dict["MotorBearing"],
-            _dict["ExternalBearing"],
-            _dict["UniformSpeedThreshold"],
-        )
-        equipment["equipment_name"] = equipment.pop("name")
-        motor_bearing["motor_bearing_moving_median_sample_number"] = motor_bearing.pop(
-            "moving_median_sample_number",
-        )
-        external_bearing[
-            "external_bearing_moving_median_sample_number"
-        ] = external_bearing.pop("moving_median_sample_number")
-        external_bearing["external_bearing_number"] = external_bearing.pop(
-            "bearing_number",
-        )
-        setting_client_param_list.append(
-            delete_key(
-                equipment
-                | motor
-                | motor_bearing
-                | external_bearing
-                | uniform_threshold,
-                popped_column,
-            ),
-        )
+        row = session.execute(_SINGLE_EXTERNAL_SETTING_STMT, params).mappings().one()
+    return construct_model(UniformSpeedMotor, row)
+
+
+_PLC_MODEL_INFO_STMT = (
+    select(PLCModel.name, PLCModel.description)
+    .where(PLCModel.model == bindparam("plc"))
+    .limit(1)
+)
+
 
-    return [UniformSpeedMotor(**x) for x in setting_client_param_list][0]
+@ttl_cache(setting.cache_ttl)
+def read_plc_model_info(plc: int) -> dict[str, Union[int, str]]:
+    """GET /api/v1/setting-client/parameter api에서 사용되는 함수.
+
+    plc 모델 번호에 해당하는 모델 이름과 설명을 불러오는 함수.
+    결과는 캐시되어 여러 요청이 공유하므로 수정하면 안됨.
+
+    Args:
+        plc (int): plc_model 값
+    Returns:
+        dict[str, Union[int, str]]
+        ParameterSettingModel의 model 필드와 같음
+    """
+    with PLCSessionLocal() as session:
+        row = session.execute(_PLC_MODEL_INFO_STMT, {"plc": plc}).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"{plc}번 PLC 모델이 없습니다.")
+    return {"model": plc, "name": row.name, "description": row.description}
+
+
+_PARAMETER_MOTOR_KEYS = (
+    "equipment_id",
+    "number",
+    "rated_current",
+    "pole",
+    "name",
+    "category",
+    "gear_ratio",
+    "max_current",
+)
+_PARAMETER_MOTOR_BEARING_KEYS = (
+    "supply_freq",
+    "motor_bearing_moving_median_sample_number",
+    "motor_bearing_ball_diameter",
+    "motor_bearing_ball_number",
+    "motor_bearing_pitch_diameter",
+)
+_PARAMETER_EXTERNAL_BEARING_KEYS = (
+    "external_bearing_moving_median_sample_number",
+    "external_bearing_ball_diameter",
+    "external_bearing_pitch_diameter",
+    "external_bearing_ball_number",
+    "external_bearing_number",
+)
+
+
+def _is_threshold_key(key: str) -> bool:
+    """Threshold 값을 의미하는 키인지 확인하는 함수."""
+    return key.endswith(("_warning", "_caution"))
+
+
+# 모델 필드는 고정이므로 카테고리별 키를 import 시점에 한 번만 계산
+_V3_THRESHOLD_KEYS = tuple(
+    key for key in VariableSpeedMotor.__fields__ if "current_" in key
+)
+_U3E_THRESHOLD_KEYS = tuple(
+    key
+    for key in UniformSpeedMotor.__fields__
+    if _is_threshold_key(key) and not key.startswith("tension_")
+)
+_U3T_THRESHOLD_KEYS = tuple(
+    key for key in UniformSpeedMotor.__fields__ if _is_threshold_key(key)
+)
+_U3E_PARAMETER_KEYS = _PARAMETER_MOTOR_BEARING_KEYS + _PARAMETER_EXTERNAL_BEARING_KEYS
+_U3T_PARAMETER_KEYS = _U3E_PARAMETER_KEYS + tuple(
+    key
+    for key in UniformSpeedMotor.__fields__
+    if key.startswith("tension_")
+    and (not _is_threshold_key(key) or key.startswith("tension_bearing_feature"))
+)
 
 
 def read_parameter_inquery(equipment_id: int, motor_number: int, plc: int) -> dict:
     """GET /api/v1/setting-client/parameter api에서 사용되는 함수.
 
+    plc 모델 정보(model)는 read_plc_model_info에서 따로 불러오므로 포함하지 않는다.
+
     Args:
         equipment_id (int): 모터 번호
         motor_number (int): 호기 번호
         plc (int): plc_model 값
     Returns:
         dict
-        ParameterSettingModel의 딕셔너리 형태와 같음
+        ParameterSettingModel에서 model을 제외한 딕셔너리 형태와 같음
     """
-    with SessionLocal() as session:
-        category = (
-            session.query(Motor.category).filter(
-                Motor.equipment_id == equipment_id,
-                Motor.number == motor_number,
-            )
-        ).first()[0]
+    category = read_motor_category(equipment_id, motor_number)
+    response: dict = {}
+    motor_setting: Union[VariableSpeedMotor, UniformSpeedMotor]
+    if category == "v3":
+        motor_setting = read_single_variable_setting(
+            equipment_id=equipment_id,
+            motor_number=motor_number,
+            plc=plc,
+        )
+        parameter_keys: tuple[str, ...] = ("moving_median_sample_number",)
+        threshold_keys = _V3_THRESHOLD_KEYS
+    elif category == "u3e":
+        motor_setting = read_single_external_setting(
+            equipment_id=equipment_id,
+            motor_number=motor_number,
+            plc=plc,
+        )
+        parameter_keys = _U3E_PARAMETER_KEYS
+        threshold_keys = _U3E_THRESHOLD_KEYS
+    elif category == "u3t":
+        motor_setting = read_single_tension_setting(
+            equipment_id=equipment_id,
+            motor_number=motor_number,
+            plc=plc,
+        )
+        parameter_keys = _U3T_PARAMETER_KEYS
+        threshold_keys = _U3T_THRESHOLD_KEYS
+    else:
+        return response
 
-        response: dict = defaultdict(dict)
-        with PLCSessionLocal() as plcsession:
-            name, description = (
-                plcsession.query(PLCModel.name, PLCModel.description).filter(
-                    PLCModel.model == plc,
-                )
-            ).first()
-
-        response["model"] = {"model": plc, "name": name, "description": description}
-
-        if category == "v3":
-            vari_setting = read_single_variable_setting(
-                equipment_id=equipment_id,
-                motor_number=motor_number,
-                plc=plc,
-            ).dict()
-            column_dict = {
-                "Motor": [
-                    "equipment_id",
-                    "number",
-                    "rated_current",
-                    "pole",
-                    "name",
-                    "category",
-                    "gear_ratio",
-                    "max_current",
-                ],
-                "Variable": ["moving_median_sample_number"],
-                "VariableSpeedThreshold": [
-                    key for key in vari_setting if "current_" in key
-                ],
-            }
-            response["motor"] = {key: vari_setting[key] for key in column_dict["Motor"]}
-            response["parameter"] = {
-                key: vari_setting[key] for key in column_dict["Variable"]
-            }
-            response["threshold"] = {
-                key: vari_setting[key] for key in column_dict["VariableSpeedThreshold"]
-            }
-
-        elif category == "u3e":
-            external_setting = read_single_external_setting(
-                equipment_id=equipment_id,
-                motor_number=motor_number,
-                plc=plc,
-            ).dict()
-            column_dict = {
-                "Motor": [
-                    "equipment_id",
-                    "number",
-                    "rated_current",
-                    "pole",
-                    "name",
-                    "category",
-                    "gear_ratio",
-                    "max_current",
-                ],
-                "MotorBearing": [
-                    "supply_freq",
-                    "motor_bearing_moving_median_sample_number",
-                    "motor_bearing_ball_diameter",
-                    "motor_bearing_ball_number",
-                    "motor_bearing_pitch_diameter",
-                ],
-                "ExternalBearing": [
-                    "external_bearing_moving_median_sample_number",
-                    "external_bearing_ball_diameter",
-                    "external_bearing_pitch_diameter",
-                    "external_bearing_ball_number",
-                    "external_bearing_number",
-                ],
-                "UniformSpeedThreshold": [
-                    key
-                    for key in external_setting
-                    if (key.endswith("_warning") or key.endswith("_caution"))
-                    and not key.startswith("tension_")
-                ],
-            }
-
-            response["motor"] = {
-                key: external_setting[key] for key in column_dict["Motor"]
-            }
-            response["parameter"] = {
-                key: external_setting[key] for key in column_dict["MotorBearing"]
-            } | {key: external_setting[key] for key in column_dict["ExternalBearing"]}
-            response["threshold"] = {
-                key: external_setting[key]
-                for key in column_dict["UniformSpeedThreshold"]
-            }
-        elif category == "u3t":
-            tension_setting = read_single_tension_setting(
-                equipment_id=equipment_id,
-                motor_number=motor_number,
-                plc=plc,
-            ).dict()
-            column_dict = {
-                "Motor": [
-                    "equipment_id",
-                    "number",
-                    "rated_current",
-                    "pole",
-                    "name",
-                    "category",
-                    "gear_ratio",
-                    "max_current",
-                ],
-                "MotorBearing": [
-                    "supply_freq",
-                    "motor_bearing_moving_median_sample_number",
-                    "motor_bearing_ball_diameter",
-                    "motor_bearing_ball_number",
-                    "motor_bearing_pitch_diameter",
-                ],
-                "ExternalBearing": [
-                    "external_bearing_moving_median_sample_number",
-                    "external_bearing_ball_diameter",
-                    "external_bearing_pitch_diameter",
-                    "external_bearing_ball_number",
-                    "external_bearing_number",
-                ],
-                "UniformSpeedThreshold": [
-                    key
-                    for key in tension_setting
-                    if (key.endswith("_warning") or key.endswith("_caution"))
-                ],
-                "TensionBearing": [
-                    key
-                    for key in tension_setting
-                    if key.startswith("tension_")
-                    and not (key.endswith("_warning") or key.endswith("_caution"))
-                    or key.startswith("tension_bearing_feature")
-                ],
-            }
-
-            response["motor"] = {
-                key: tension_setting[key] for key in column_dict["Motor"]
-            }
-            response["parameter"] = (
-                {key: tension_setting[key] for key in column_dict["MotorBearing"]}
-                | {key: tension_setting[key] for key in column_dict["ExternalBearing"]}
-                | {key: tension_setting[key] for key in column_dict["TensionBearing"]}
-            )
-            response["threshold"] = {
-                key: tension_setting[key]
-                for key in column_dict["UniformSpeedThreshold"]
-            }
+    # .dict()는 전체 필드(변속 템플릿 포함)를 복사하므로 필요한 필드만 속성으로 읽음
+    response["motor"] = {
+        key: getattr(motor_setting, key) for key in _PARAMETER_MOTOR_KEYS
+    }
+    response["parameter"] = {key: getattr(motor_setting, key) for key in parameter_keys}
+    response["threshold"] = {key: getattr(motor_setting, key) for key in threshold_keys}
     return response
 
 
-def update_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
+def update_parameter_by_plc(
+    body: dict,
+    session: Session,
+    plc_session: Session,
+) -> Optional[ParameterSettingModel]:
     """PUT /api/v1/setting-client/parameter api에서 사용되는 함수.
 
+    service DB, PLC DB 모두 요청에서 주입받은 세션 하나씩으로 수정하고,
+    api에서 캐시를 비우기 전에 반영되도록 여기서 commit한다.
+
     Args:
         body (dict): setting client의 Parameter setting 부분에서의 body
+        session (Session): 요청 단위 service DB 세션
+        plc_session (Session): 요청 단위 PLC DB 세션
     Note:
         body["model"]["model"] == 31로 적힌 부분은
         원래 고객사 측에서 세팅클라이언트를 사용할 때,
@@ -1115,9 +1120,7 @@ def update_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
 
     # 2. default가 아닌 plc의 경우 업데이트 진행
     category = body["motor"]["category"]
-    aware_now = utc.localize(datetime.utcnow()).astimezone(  # noqa: DTZ003
-        timezone(setting.timezone),
-    )
+    aware_now = datetime.now(_LOCAL_TIMEZONE)
 
     category_functions = {
         "u3e": update_uniform_parameter,
@@ -1126,69 +1129,129 @@ def update_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
     }
 
     # PLC 부분 업데이트
-    with PLCSessionLocal() as plcsession:
-        plcsession.query(PLCModel).filter(
+    plc_session.execute(
+        update(PLCModel)
+        .where(
             PLCModel.model == body["model"]["model"],
             PLCModel.equipment_id == body["motor"]["equipment_id"],
-        ).update(body["model"])
-        category_functions[category](body, aware_now)
-        plcsession.commit()
+        )
+        .values(body["model"])
+        .execution_options(synchronize_session=False),
+    )
+    category_functions[category](body, aware_now, session)
+    session.commit()
+    plc_session.commit()
     return ParameterSettingModel(**body)
 
 
-def update_uniform_parameter(body: dict, aware_now: datetime) -> None:
-    """PUT /api/v1/setting-client/parameter api에서 사용되는 함수.
-
-    현재 파일의 update_parameter_by_plc함수에서
-    body의 모터 카테고리가 정속(u3e, u3t)일 때 사용됨.
+def _motor_update_stmt(body: dict, aware_now: datetime) -> Update:
+    """body의 motor 값으로 모터 테이블을 수정하는 update문 생성.
 
     Args:
         body (dict): setting client의 Parameter setting 부분에서의 body
         aware_now (datetime): aware datetime 값
+    Returns:
+        Update
     """
-    with SessionLocal() as session:
-        session.query(Motor).filter(
+    return (
+        update(Motor)
+        .where(
             Motor.equipment_id == body["motor"]["equipment_id"],
             Motor.number == body["motor"]["number"],
-        ).update(body["motor"] | {"updated_time": aware_now})
+        )
+        .values({**body["motor"], "updated_time": aware_now})
+        .execution_options(synchronize_session=False)
+    )
 
-        motor_bearing = format_motor_bearing(body, aware_now)
 
-        session.query(MotorBearing).filter(
-            MotorBearing.equipment_id == body["motor"]["equipment_id"],
-            MotorBearing.motor_number == body["motor"]["number"],
-            MotorBearing.plc == body["model"]["model"],
-        ).update(motor_bearing | {"updated_time": aware_now})
+def _parameter_update_stmt(
+    orm_cls: DeclarativeMeta,
+    body: dict,
+    values: dict,
+) -> Update:
+    """body의 호기, 모터 번호, plc 모델에 해당하는 파라미터 테이블 row를 수정하는 update문 생성.
 
-        external_bearing = format_external_bearing(body, aware_now)
+    Args:
+        orm_cls (DeclarativeMeta): equipment_id, motor_number, plc 컬럼이 있는 테이블
+        body (dict): setting client의 Parameter setting 부분에서의 body
+        values (dict): 수정할 컬럼과 값, updated_time을 포함해야 함
+    Returns:
+        Update
+    """
+    return (
+        update(orm_cls)
+        .where(
+            orm_cls.equipment_id == body["motor"]["equipment_id"],
+            orm_cls.motor_number == body["motor"]["number"],
+            orm_cls.plc == body["model"]["model"],
+        )
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
 
-        session.query(ExternalBearing).filter(
-            ExternalBearing.equipment_id == body["motor"]["equipment_id"],
-            ExternalBearing.motor_number == body["motor"]["number"],
-            ExternalBearing.plc == body["model"]["model"],
-        ).update(external_bearing | {"updated_time": aware_now})
 
-        uniform_threshold = format_uniform_threshold(body, aware_now)
+def _execute_updates(session: Session, statements: Iterable[Update]) -> None:
+    """미리 만들어둔 update문들을 같은 세션(트랜잭션)에서 실행하는 함수.
 
-        session.query(UniformSpeedThreshold).filter(
-            UniformSpeedThreshold.equipment_id == body["motor"]["equipment_id"],
-            UniformSpeedThreshold.motor_number == body["motor"]["number"],
-            UniformSpeedThreshold.plc == body["model"]["model"],
-        ).update(uniform_threshold | {"updated_time": aware_now})
+    Args:
+        session (Session): 요청 단위 service DB 세션
+        statements (Iterable[Update]): 실행할 update문
+    """
+    for statement in statements:
+        session.execute(statement)
 
-        # 텐션 베어링이 포함된 경우
-        if "tension_bearing_number" in body["parameter"]:
-            tension_bearing = format_tension_bearing(body, aware_now)
-            session.query(TensionBearing).filter(
-                TensionBearing.equipment_id == body["motor"]["equipment_id"],
-                TensionBearing.motor_number == body["motor"]["number"],
-                TensionBearing.plc == body["model"]["model"],
-            ).update(tension_bearing | {"updated_time": aware_now})
 
-        session.commit()
+def update_uniform_parameter(
+    body: dict,
+    aware_now: datetime,
+    session: Session,
+) -> None:
+    """PUT /api/v1/setting-client/parameter api에서 사용되는 함수.
+
+    현재 파일의 update_parameter_by_plc함수에서
+    body의 모터 카테고리가 정속(u3e, u3t)일 때 사용됨.
+    format_* 함수의 결과에는 updated_time이 이미 들어있으므로 그대로 사용한다.
+
+    Args:
+        body (dict): setting client의 Parameter setting 부분에서의 body
+        aware_now (datetime): aware datetime 값
+        session (Session): 요청 단위 service DB 세션
+    """
+    statements = [
+        _motor_update_stmt(body, aware_now),
+        _parameter_update_stmt(
+            MotorBearing,
+            body,
+            format_motor_bearing(body, aware_now),
+        ),
+        _parameter_update_stmt(
+            ExternalBearing,
+            body,
+            format_external_bearing(body, aware_now),
+        ),
+        _parameter_update_stmt(
+            UniformSpeedThreshold,
+            body,
+            format_uniform_threshold(body, aware_now),
+        ),
+    ]
+    # 텐션 베어링이 포함된 경우
+    if "tension_bearing_number" in body["parameter"]:
+        statements.append(
+            _parameter_update_stmt(
+                TensionBearing,
+                body,
+                format_tension_bearing(body, aware_now),
+            ),
+        )
+    _execute_updates(session, statements)
 
 
-def update_variable_parameter(body: dict, aware_now: datetime) -> None:
+def update_variable_parameter(
+    body: dict,
+    aware_now: datetime,
+    session: Session,
+) -> None:
     """PUT /api/v1/setting-client/parameter api에서 사용되는 함수.
 
     현재 파일의 update_parameter_by_plc함수에서
@@ -1197,35 +1260,34 @@ def update_variable_parameter(body: dict, aware_now: datetime) -> None:
     Args:
         body (dict): setting client의 Parameter setting 부분에서의 body
         aware_now (datetime): aware datetime 값
+        session (Session): 요청 단위 service DB 세션
     """
-    with SessionLocal() as session:
-        session.query(Motor).filter(
-            Motor.equipment_id == body["motor"]["equipment_id"],
-            Motor.number == body["motor"]["number"],
-        ).update(body["motor"] | {"updated_time": aware_now})
-
-        variable_threshold = {
-            key: body["threshold"][key]
-            for key in body["threshold"]
-            if not key.startswith("external_bearing")
-        }
-        session.query(VariableSpeedThreshold).filter(
-            VariableSpeedThreshold.equipment_id == body["motor"]["equipment_id"],
-            VariableSpeedThreshold.motor_number == body["motor"]["number"],
-            VariableSpeedThreshold.plc == body["model"]["model"],
-        ).update(variable_threshold | {"updated_time": aware_now})
-
-        # parameter 업데이트
-        session.query(Variable).filter(
-            Variable.equipment_id == body["motor"]["equipment_id"],
-            Variable.motor_number == body["motor"]["number"],
-            Variable.plc == body["model"]["model"],
-        ).update(body["parameter"] | {"updated_time": aware_now})
-
-        session.commit()
+    variable_threshold = {
+        key: value
+        for key, value in body["threshold"].items()
+        if not key.startswith("external_bearing")
+    }
+    variable_threshold["updated_time"] = aware_now
+    _execute_updates(
+        session,
+        (
+            _motor_update_stmt(body, aware_now),
+            _parameter_update_stmt(VariableSpeedThreshold, body, variable_threshold),
+            # parameter 업데이트
+            _parameter_update_stmt(
+                Variable,
+                body,
+                {**body["parameter"], "updated_time": aware_now},
+            ),
+        ),
+    )
 
 
-def insert_variable_parameter(body: dict, aware_now: datetime) -> None:
+def insert_variable_parameter(
+    body: dict,
+    aware_now: datetime,
+    session: Session,
+) -> None:
     """POST /api/v1/setting-client/parameter api에서 사용되는 함수.
 
     현재 파일의 insert_parameter_by_plc함수에서
@@ -1234,19 +1296,23 @@ def insert_variable_parameter(body: dict, aware_now: datetime) -> None:
     Args:
         body (dict): setting client의 Parameter setting 부분에서의 body
         aware_now (datetime): aware datetime 값
+        session (Session): 요청 단위 service DB 세션
     """
-    with SessionLocal():
-        required_dict = generate_required_dict(body, aware_now)
-        cls_format_dict = {
-            Variable: (body["parameter"] | required_dict),
-            VariableSpeedThreshold: (
-                body["threshold"] | required_dict | {"phase_number": 3}
-            ),
-        }
-        general_insert_multiple_value(SessionLocal, cls_format_dict)
+    required_dict = generate_required_dict(body, aware_now)
+    cls_format_dict = {
+        Variable: (body["parameter"] | required_dict),
+        VariableSpeedThreshold: (
+            body["threshold"] | required_dict | {"phase_number": 3}
+        ),
+    }
+    _insert_rows(session, cls_format_dict)
 
 
-def insert_uniform_parameter(body: dict, aware_now: datetime) -> None:
+def insert_uniform_parameter(
+    body: dict,
+    aware_now: datetime,
+    session: Session,
+) -> None:
     """POST /api/v1/setting-client/parameter api에서 사용되는 함수.
 
     현재 파일의 insert_parameter_by_plc함수에서
@@ -1255,85 +1321,103 @@ def insert_uniform_parameter(body: dict, aware_now: datetime) -> None:
     Args:
         body (dict): setting client의 Parameter setting 부분에서의 body
         aware_now (datetime): aware datetime 값
+        session (Session): 요청 단위 service DB 세션
     """
-    motor_bearing = format_motor_bearing(body, aware_now)
-    external_bearing = format_external_bearing(body, aware_now)
-    uniform_threshold = format_uniform_threshold(body, aware_now)
-    if "tension_bearing_feature_warning" not in body["parameter"].keys():
-        cls_format_dict = {
-            MotorBearing: motor_bearing,
-            ExternalBearing: external_bearing,
-            UniformSpeedThreshold: uniform_threshold,
-        }
-        general_insert_multiple_value(SessionLocal, cls_format_dict)
+    cls_format_dict = {
+        MotorBearing: format_motor_bearing(body, aware_now),
+        ExternalBearing: format_external_bearing(body, aware_now),
+        UniformSpeedThreshold: format_uniform_threshold(body, aware_now),
+    }
+    # 텐션 베어링이 포함된 경우
+    if "tension_bearing_feature_warning" in body["parameter"]:
+        cls_format_dict[TensionBearing] = format_tension_bearing(body, aware_now)
+    _insert_rows(session, cls_format_dict)
 
-    else:
-        tension_bearing = format_tension_bearing(body, aware_now)
 
-        cls_format_dict = {
-            MotorBearing: motor_bearing,
-            ExternalBearing: external_bearing,
-            TensionBearing: tension_bearing,
-            UniformSpeedThreshold: uniform_threshold,
-        }
-        general_insert_multiple_value(SessionLocal, cls_format_dict)
+def _insert_rows(session: Session, cls_format_dict: dict[DeclarativeMeta, dict]) -> None:
+    """테이블별 row 1개씩을 ORM 객체 없이 bulk_insert_mappings로 insert하는 함수.
+
+    commit은 호출하는 쪽(insert_parameter_by_plc)에서 한 번만 수행한다.
+
+    Args:
+        session (Session): 요청 단위 service DB 세션
+        cls_format_dict (dict[DeclarativeMeta, dict]): 테이블과 insert할 row
+    """
+    for class_type, row in cls_format_dict.items():
+        session.bulk_insert_mappings(class_type, [row])
 
 
 def unique_key_already_exists(
-    SessionLocal: sessionmaker,
+    session: Session,
     class_type: DeclarativeMeta,
     key_value: dict,
-) -> list[Row]:
+) -> bool:
     """중복된 키가 존재하는지 안하는지 확인하는 함수.
 
+    row를 가져오지 않고 EXISTS로 존재 여부만 조회한다.
+
     Args:
-        SessionLocal (sessionmaker): 세션 메이커 객체
+        session (Session): 조회할 DB 세션
         class_type (DeclarativeMeta): orm class
-        key_value (dict): where문 조건으로 사용되는 값.
+        key_value (dict): where문 조건으로 사용되는 값
+
+    Returns:
+        bool
     """
-    with SessionLocal() as session:
-        query_results = session.query(class_type).filter_by(**key_value).all()
-    return query_results
+    return session.query(
+        session.query(class_type).filter_by(**key_value).exists(),
+    ).scalar()
 
 
 def delete_parameters_by_plc(
-    SessionLocal: sessionmaker,
-    class_type: DeclarativeMeta,
+    session: Session,
+    class_types: list[DeclarativeMeta],
     plc: int,
 ) -> None:
     """DELETE /api/v1/setting-client/parameter api에서 사용되는 함수.
 
+    같은 DB에 있는 테이블들은 요청에서 주입받은 하나의 세션에서 삭제하고,
+    api에서 캐시를 비우기 전에 반영되도록 여기서 commit한다.
+    세션에 올라온 객체가 없으므로 ORM 동기화 없이 DELETE문만 실행한다.
+
     Args:
-        SessionLocal (sessionmaker): 세션 메이커 객체
-        class_type (DeclarativeMeta): orm class
+        session (Session): 요청 단위 세션
+        class_types (list[DeclarativeMeta]): orm class 리스트
         plc (int): plc model 값
     """
-    with SessionLocal() as session:
-        if class_type.__name__ != "PLCModel":
-            session.query(class_type).filter_by(**{"plc": plc}).delete()
-        else:
-            session.query(class_type).filter_by(**{"model": plc}).delete()
-        session.commit()
+    for class_type in class_types:
+        plc_column = class_type.model if class_type is PLCModel else class_type.plc
+        session.execute(
+            delete(class_type)
+            .where(plc_column == plc)
+            .execution_options(synchronize_session=False),
+        )
+    session.commit()
 
 
-def insert_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
+def insert_parameter_by_plc(
+    body: dict,
+    session: Session,
+    plc_session: Session,
+) -> Optional[ParameterSettingModel]:
     """POST /api/v1/setting-client/parameter api에서 사용되는 함수.
 
+    service DB, PLC DB 모두 요청에서 주입받은 세션 하나씩으로 중복 확인과 insert를 하고,
+    api에서 캐시를 비우기 전에 반영되도록 여기서 commit한다.
+
     Args:
         body (dict): setting client의 Parameter setting 부분에서의 body
+        session (Session): 요청 단위 service DB 세션
+        plc_session (Session): 요청 단위 PLC DB 세션
     Returns:
         Optional[ParameterSettingModel]
     """
     category = body["motor"]["category"]
-    if category != read_motor_category(
+    real_category = read_motor_category(
         body["motor"]["equipment_id"],
         body["motor"]["number"],
-    ):
-
-        real_category = read_motor_category(
-            body["motor"]["equipment_id"],
-            body["motor"]["number"],
-        )
+    )
+    if category != real_category:
         raise HTTPException(
             status_code=403,
             detail=(
@@ -1341,9 +1425,7 @@ def insert_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
             ),
         )
 
-    aware_now = utc.localize(datetime.utcnow()).astimezone(  # noqa: DTZ003
-        timezone(setting.timezone),
-    )
+    aware_now = datetime.now(_LOCAL_TIMEZONE)
 
     category_functions = {
         "u3e": insert_uniform_parameter,
@@ -1358,14 +1440,14 @@ def insert_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
     }
 
     if "u3" in category:
-        if unique_key_already_exists(SessionLocal, MotorBearing, required_dict):
+        if unique_key_already_exists(session, MotorBearing, required_dict):
             logging.info("해당 호기와 해당 모터 번호에 해당하는 모델 파라미터가 이미 존재합니다.")  # noqa: E501
             raise HTTPException(
                 status_code=409,
                 detail="해당 호기와 해당 모터 번호에 해당하는 모델 파라미터가 이미 존재합니다.",  # noqa: E501
             )
 
-    elif unique_key_already_exists(SessionLocal, Variable, required_dict):
+    elif unique_key_already_exists(session, Variable, required_dict):
         logging.info("해당 호기와 해당 모터 번호에 해당하는 모델 파라미터가 이미 존재합니다.")  # noqa: E501
         raise HTTPException(
             status_code=409,
@@ -1373,7 +1455,7 @@ def insert_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
         )
 
     if unique_key_already_exists(
-        PLCSessionLocal,
+        plc_session,
         PLCModel,
         {key: value for key, value in body["model"].items() if key == "model"},
     ):
@@ -1382,56 +1464,24 @@ def insert_parameter_by_plc(body: dict) -> Optional[ParameterSettingModel]:
 
     try:
         # insert 함수 실행
-        category_functions[category](body, aware_now)
+        category_functions[category](body, aware_now, session)
+        session.commit()
     except Exception as err:
+        session.rollback()
         logging.info("업데이트하려는 파라미터가 조건에 부합하지 않습니다.")
         raise HTTPException(
             status_code=403,
             detail=("업데이트하려는 파라미터가 조건에 부합하지 않습니다."),
         ) from err
-    else:
-        with PLCSessionLocal() as plcsession:
-            plcsession.add(
-                PLCModel(
-                    **(
-                        body["model"]
-                        | {"line_id": 1, "equipment_id": required_dict["equipment_id"]}
-                    ),
-                ),
-            )
-            plcsession.commit()
-            logging.info("모델별 파라미터 추가를 성공하였습니다.")
-            return ParameterSettingModel(**body)
-
-
-def view_memory_mapping(line_equipment: dict) -> list[dict]:
-    """특정 라인번호, 호기 번호에 해당하는 memory mapping 테이블 row를 불러오는 함수.
-
-    Args:
-        line_equipment (dict): matching_equipment_id_using_equipment_name의 리턴값.
-    """
-    with PLCSessionLocal() as session:
-        query_results = session.query(MemoryMapping).filter_by(**line_equipment).all()
-    return row_to_dict(query_results)
-
 
-def matching_equipment_id_using_equipment_name(equipment_name: str) -> dict:
-    """PLC log를 insert할 때 사용되는 body에 적혀있는 key의 equipment_name을 기준으로.
-
-    equipment table에서의 equipment_id와 line_id를 리턴하는 함수.
-
-    Args:
-        equipment_name(str): /setting-client/plc(POST)에서 사용되는
-                            body의 key에 들어있는 equipment_name
-    """
-    with SessionLocal() as session:
-        query_results = session.query(Equipment).all()
-
-    equipment_table = row_to_dict(query_results)
-    for equipment_row in equipment_table:
-        if equipment_row["name"] == equipment_name:
-            return {
-                "equipment_id": equipment_row["id"],
-                "line_id": equipment_row["line_id"],
-            }
-    return None  # type: ignore[return-value]
+    plc_session.add(
+        PLCModel(
+            **(
+                body["model"]
+                | {"line_id": 1, "equipment_id": required_dict["equipment_id"]}
+            ),
+        ),
+    )
+    plc_session.commit()
+    logging.info("모델별 파라미터 추가를 성공하였습니다.")
+    return ParameterSettingModel(**body)
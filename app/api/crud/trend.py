@@ -4,13 +4,15 @@
 - Contact: sewon.kim@onepredict.com
 """
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, TypeVar
 
 from api.crud.util import determine_period
-from sqlalchemy import and_
+from sqlalchemy import bindparam, select
 from sqlalchemy.engine.row import Row
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import Select
 
 T = TypeVar("T")
 
@@ -22,8 +24,11 @@ class Trend:
         columns (list[str]): 조회할 컬럼들 목록
         required_dict (dict): 조회할 때 매번 공통으로 사용되는 컬럼 정보
         e.g. required_dict = {'equipment_id':1, 'motor_number':3, 'plc':3}
+        yield_per (int): 조회 결과를 DB에서 한 번에 가져올 row 수
     """
 
+    yield_per = 1000
+
     def __init__(self) -> None:
         """컬럼과 required_dict(필수 인자)정의."""
         self.columns: Optional[list[str]] = None
@@ -42,6 +47,7 @@ class Trend:
         WHERE 조건으로는 self.start와 self.end 기간 사이와
         required_dict의 조건과 일치하는 row들을 필터를 걸고,
         ORDER BY로는 계측 시간(acq_time) 순서대로 리턴하도록 함.
+        조회 기간이 길면 row 수가 많으므로 server side cursor로 yield_per개씩 가져옴.
 
         Args:
             SessionLocal (sessionmaker): sessionmaker 객체
@@ -49,25 +55,44 @@ class Trend:
         Returns:
             list[Row]
         """
+        stmt = _trend_stmt(orm_cls, tuple(self.columns), tuple(self.required_dict))
+        params = {"start": self.start, "end": self.end} | self.required_dict
         with SessionLocal() as session:
-            query_results = (
-                session.query(*[getattr(orm_cls, column) for column in self.columns])
-                .filter(
-                    and_(
-                        orm_cls.acq_time > self.start,
-                        orm_cls.acq_time < self.end,
-                    ),
-                )
-                .filter(
-                    *[
-                        getattr(orm_cls, key) == value
-                        for key, value in self.required_dict.items()
-                    ],
-                )
-                .order_by(orm_cls.acq_time.asc())
-                .all()
+            return list(
+                session.execute(
+                    stmt,
+                    params,
+                    execution_options={"stream_results": True},
+                ).yield_per(self.yield_per),
             )
-        return query_results
+
+
+@lru_cache(maxsize=64)
+def _trend_stmt(
+    orm_cls: DeclarativeMeta,
+    columns: tuple[str, ...],
+    required_keys: tuple[str, ...],
+) -> Select:
+    """테이블, 컬럼, 조건 키 조합별 트렌드 select문을 한 번만 만들어 재사용하는 함수.
+
+    기간(start, end)과 required_dict의 값은 실행할 때 bind parameter로 넘긴다.
+
+    Args:
+        orm_cls (DeclarativeMeta): ORM 클래스
+        columns (Tuple[str, ...]): 조회할 컬럼들 목록
+        required_keys (Tuple[str, ...]): required_dict의 키 목록
+    Returns:
+        Select
+    """
+    return (
+        select(*[getattr(orm_cls, column) for column in columns])
+        .where(
+            orm_cls.acq_time > bindparam("start"),
+            orm_cls.acq_time < bindparam("end"),
+            *[getattr(orm_cls, key) == bindparam(key) for key in required_keys],
+        )
+        .order_by(orm_cls.acq_time.asc())
+    )
 
 
 class VariableLoad(Trend):
@@ -6,14 +6,18 @@ display num dict은 상세페이지에서 모터이름에 따른 디스플레이
 싱글턴 패턴으로 정의되어있음.
 STK, PKG 등이나 ESGM 때 수정되어야함.
 """
+import asyncio
 import logging
-from collections import defaultdict
+import re
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypeVar, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 
 import numpy as np
 import yaml
+from anyio import to_thread
 from core.config import setting
 from db.service.database import SessionLocal
 from db.service.model import Equipment
@@ -21,6 +25,12 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm import sessionmaker
 
+# libyaml이 포함된 PyYAML이면 C 구현 loader를 사용하고, 없으면 순수 파이썬 loader 사용
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 T = TypeVar("T")
 display_num_dict = {
     "UpperElectrodeCuttingLinear": 1,
@@ -38,24 +48,129 @@ display_num_dict = {
     "UncutCellConveyor": 2,
     "CellConveyor": 1,
 }
+# 응답 키로 매 요청마다 만들어지는 모터 아이디 문자열을 미리 생성
+motor_ids = tuple(f"motor{motor_number}" for motor_number in range(256))
+# 긴 이름을 먼저 검사하여 UncutCellConveyor가 CellConveyor로 매칭되지 않도록 함
+display_num_pattern = re.compile(
+    "|".join(re.escape(key) for key in sorted(display_num_dict, key=len, reverse=True)),
+)
+
+
+def get_motor_id(motor_number: int) -> str:
+    """모터 번호를 응답 키로 사용하는 모터 아이디(e.g. motor1)로 변환하는 함수.
+
+    Args:
+        motor_number (int): 모터 번호
+    Returns:
+        str
+    """
+    if 0 <= motor_number < len(motor_ids):
+        return motor_ids[motor_number]
+    return f"motor{motor_number}"
+
+
+def get_motor_number(motor_id: str) -> int:
+    """모터 아이디(e.g. motor1)를 모터 번호로 변환하는 함수, get_motor_id의 역변환.
+
+    Args:
+        motor_id (str): 모터 아이디
+    Returns:
+        int
+    """
+    return int(motor_id.removeprefix("motor"))
 
 
 def merge_list_of_dictionary(dict_list: list[dict]) -> dict:
     """Merge all values from dict list into a single dict.
 
+    모든 row가 같은 키를 가지므로 첫 row의 키 기준으로 컬럼별 리스트를 한 번에 만든다.
+
     Returns:
         dict
     """
-    response = defaultdict(list)
-    for _dict in dict_list:
-        for key, value in _dict.items():
-            if key == "acq_time":
-                response[key].append(dt_to_unix(value))
-            else:
-                response[key].append(value)
+    if not dict_list:
+        return {}
+    response = {key: [_dict[key] for _dict in dict_list] for key in dict_list[0]}
+    if "acq_time" in response:
+        response["acq_time"] = dts_to_unix(response["acq_time"])
     return response
 
 
+def get_display_num(motor_name: str) -> Optional[int]:
+    """모터 이름에 해당하는 상세페이지 디스플레이 순서를 리턴하는 함수.
+
+    generate_motor_code로 변환한 코드는 첫 글자가 소문자이므로 DB의 모터 이름을 넘겨야함.
+
+    Args:
+        motor_name (str): DB에 들어있는 모터 이름
+    Returns:
+        Optional[int]
+    """
+    matched = display_num_pattern.search(motor_name)
+    if matched is None:
+        return None
+    return display_num_dict[matched.group()]
+
+
+async def gather_motors(
+    format_motor: Callable[..., Optional[dict]],
+    motors_in_equipment: list[dict[str, Union[int, str]]],
+    *args: Any,
+) -> dict:
+    """모터별 포매팅 함수를 스레드에서 동시에 실행하여 모터 아이디별로 모으는 함수.
+
+    format_motor가 None을 리턴한 모터는 응답에서 제외하며,
+    응답 순서는 motors_in_equipment의 순서를 따름.
+
+    Args:
+        format_motor (Callable[..., Optional[dict]]): 모터 정보 1개를 첫번째 인자로 받는
+                                                    포매팅 함수
+        motors_in_equipment (list[dict[str, Union[int, str]]]): 현재 호기의 전체 모터 정보
+        args (Any): format_motor에 함께 넘길 인자
+    Returns:
+        dict
+    """
+    results = await asyncio.gather(
+        *(
+            to_thread.run_sync(format_motor, motor_dict, *args)
+            for motor_dict in motors_in_equipment
+        ),
+    )
+    return {
+        get_motor_id(motor_dict["number"]): result
+        for motor_dict, result in zip(motors_in_equipment, results)
+        if result is not None
+    }
+
+
+_PART_MATCHING = {
+    "pc": "lges.menu.positiveCutting",
+    "nc": "lges.menu.negativeCutting",
+    "lami": "lges.menu.laminationRoll",
+    "fc": "lges.menu.finalCutting",
+}
+
+
+@lru_cache(maxsize=16)
+def _invert(
+    part_motor_number_dict_items: tuple[tuple[str, tuple[int, ...]], ...],
+) -> dict[int, str]:
+    """파트별 모터 번호를 모터 번호별 파트로 뒤집는 함수, 라인마다 한 번만 계산함.
+
+    Args:
+        part_motor_number_dict_items (tuple[tuple[str, tuple[int, ...]], ...]):
+                            get_detail_motor_number_list 결과의 items
+
+    Returns:
+        dict[int, str]
+    """
+    return {
+        motor_number: _PART_MATCHING[part]
+        for part, motor_numbers in part_motor_number_dict_items
+        for motor_number in motor_numbers
+    }
+
+
 def get_matching_part(
     part_motor_number_dict: dict[str, tuple[int]],
     motor_number: int,
@@ -69,17 +184,7 @@ def get_matching_part(
     Returns:
         str.
     """
-    part_matching = {
-        "pc": "lges.menu.positiveCutting",
-        "nc": "lges.menu.negativeCutting",
-        "lami": "lges.menu.laminationRoll",
-        "fc": "lges.menu.finalCutting",
-    }
-    return part_matching[
-        [key for key, value in part_motor_number_dict.items() if motor_number in value][
-            0
-        ]
-    ]
+    return _invert(tuple(part_motor_number_dict.items()))[motor_number]
 
 
 def dt_to_unix(acq_time: datetime) -> str:
@@ -94,10 +199,24 @@ def dt_to_unix(acq_time: datetime) -> str:
     return str(unix_timestamp)
 
 
+def dts_to_unix(acq_times: Iterable[datetime]) -> list[str]:
+    """계측 시간 컬럼 전체를 dt_to_unix와 같은 형식의 unix time 리스트로 변경.
+
+    Args:
+        acq_times (Iterable[datetime]): 계측 시간 목록
+    Returns:
+        list[str]
+    """
+    return [str(acq_time.timestamp() * 1000) for acq_time in acq_times]
+
+
+@lru_cache(maxsize=128)
 def get_equipment_name(equipment_id: int) -> str:
     """equipment_id를 이용하여 equipment_name을 조회하는 함수.
 
     13~14라인과 15라인의 모터 구성이 다르기 때문에 사용함.
+    호기 이름은 거의 바뀌지 않으므로 결과를 캐시하며,
+    호기 이름을 수정한 경우 get_equipment_name.cache_clear()를 호출해야함.
 
     Args:
         equipment_id (int): 호기 번호
@@ -116,13 +235,25 @@ def get_detail_motor_number_list(equipment_name: str) -> dict[str, tuple[int, ..
     """파트별 모터 리스트를 반환하는 함수.
 
     나중에 개선할 때에는 DB에 넣는 것이 바람직함.
+    같은 라인의 호기는 같은 딕셔너리를 공유하므로 리턴 값을 수정하면 안됨.
 
     Args:
         equipment_name (str): 호기 이름
     Returns:
         Dict[str, Tuple[int]]:
     """
-    line = equipment_name.split("-")[0]
+    return _get_line_motor_number_list(equipment_name.split("-")[0])
+
+
+@lru_cache(maxsize=16)
+def _get_line_motor_number_list(line: str) -> dict[str, tuple[int, ...]]:
+    """라인별 파트 모터 리스트를 만드는 함수, 호기가 아닌 라인 단위로 캐시함.
+
+    Args:
+        line (str): 라인 번호, 호기 이름의 "-" 앞부분
+    Returns:
+        Dict[str, Tuple[int]]:
+    """
     if line == "15":
         return {"pc": (3, 4), "nc": (1, 2), "lami": (5, 6), "fc": (7, 8, 9, 10)}
     else:
@@ -134,40 +265,6 @@ def get_detail_motor_number_list(equipment_name: str) -> dict[str, tuple[int, ..
         }
 
 
-def get_part_name(motor_param: dict[str, Union[str, int]]) -> str:
-    """트렌드에서 파트 이름을 붙이기 위해 사용할 함수.
-
-    나중에 개선할 때에는 DB에 넣는 것이 바람직함.
-
-    Args:
-        motor_param (dict[str, Union[str, int]]): 모터 파라미터.
-
-
-    Returns:
-        str
-    """
-    motor_number = motor_param["number"]
-    equipment_name = motor_param["equipment_name"].split("-")[0]
-
-    motor_mapping = {
-        ("15", (3, 4)): "양극 커팅부",
-        ("15", (1, 2)): "음극 커팅부",
-        ("15", (5, 6)): "라미롤부",
-        ("15", (7, 8, 9, 10)): "파이널 커팅부",
-        ("13", (3, 4, 5)): "양극 커팅부",
-        ("13", (1, 2, 6)): "음극 커팅부",
-        ("13", (7, 8, 12, 13)): "라미롤부",
-        ("13", (9, 10, 11, 14)): "파이널 커팅부",
-        ("14", (3, 4, 5)): "양극 커팅부",
-        ("14", (1, 2, 6)): "음극 커팅부",
-        ("14", (7, 8, 12, 13)): "라미롤부",
-        ("14", (9, 10, 11, 14)): "파이널 커팅부",
-    }
-    if (equipment_name, motor_number) in motor_mapping:
-        return motor_mapping[(equipment_name, motor_number)]  # type: ignore[index]
-    return ""
-
-
 def determine_period(start: datetime, end: datetime) -> tuple[datetime, datetime]:
     """조회할 날짜 구간을 결정해주는 함수.
 
@@ -212,26 +309,6 @@ def general_insert_value(
             logging.error(e)
 
 
-def general_insert_multiple_value(
-    SessionLocal: sessionmaker,
-    test_dict: dict[DeclarativeMeta, dict],
-) -> None:
-    """DB에 연결된 1개의 세션에서 여러 개의 insert가 수행되어야 하고.
-
-    1개의 insert라도 실패할 경우 해당 세션에서 발생한 모든 insert를 취소하는 것을
-    보장할 수 있는 함수.
-    """
-    with SessionLocal() as session:
-        session.begin()
-        try:
-            for class_type, row in test_dict.items():
-                session.add(class_type(**row))
-        except:  # noqa: E722
-            session.rollback()
-        else:
-            session.commit()
-
-
 def load_variable_template(npy_file: str) -> bytes:
     """지정된 경로에 존재하는 npy 파일을 읽어서 bytes로 바꿔주는 함수.
 
@@ -241,10 +318,9 @@ def load_variable_template(npy_file: str) -> bytes:
     Args:
         npy_file (str): 변속 템플릿 경로
     """
-    template_current = np.load(npy_file)
-    np_data = np.asarray(template_current, np.float64)
-    binary_data = np_data.tobytes()
-    return binary_data
+    # 파일 전체를 메모리에 올리지 않고 매핑된 배열에서 바로 bytes로 한 번만 복사
+    template_current = np.load(npy_file, mmap_mode="r")
+    return np.ascontiguousarray(template_current, dtype=np.float64).tobytes()
 
 
 def load_yaml_using_class_type(class_type: DeclarativeMeta) -> list[dict[str, Any]]:
@@ -264,11 +340,16 @@ def load_yaml_using_class_type(class_type: DeclarativeMeta) -> list[dict[str, An
     else:
         yaml_path = f"./yaml/{setting.bucket_name}/{class_type.__name__}.yml"
     with Path.open(yaml_path) as f:  # type: ignore[call-overload]
-        row_list: list[dict[str, Any]] = yaml.safe_load(f)
+        row_list: list[dict[str, Any]] = yaml.load(f, Loader=YamlLoader)
 
     if class_type.__name__ == "Variable":
+        # 같은 템플릿 파일을 여러 row가 공유하므로 파일마다 한 번만 읽어서 재사용
+        templates: dict[str, bytes] = {}
         for row in row_list:
-            row["template"] = load_variable_template(row["template"])
+            template_path = row["template"]
+            if template_path not in templates:
+                templates[template_path] = load_variable_template(template_path)
+            row["template"] = templates[template_path]
 
     return row_list
 
@@ -291,12 +372,10 @@ def general_insert_value_yaml(
     """
     row_list = load_yaml_using_class_type(class_type)
 
-    for row in row_list:
-        row_db = class_type(**row)
-        with SessionLocal() as session:
-            session.begin()
-            session.add(row_db)
-            session.commit()
+    # row마다 세션과 트랜잭션을 만들지 않고 한 번에 추가한 뒤 1번만 commit
+    with SessionLocal() as session:
+        session.add_all([class_type(**row) for row in row_list])
+        session.commit()
 
 
 def change_value_in_yaml(
@@ -331,18 +410,11 @@ def update_variable_with_float_template(variable: dict) -> dict:
     Returns:
         dict
     """
-    import numpy as np
-
-    template_uvw = np.frombuffer(variable["template"])
-    template_uvw = np.frombuffer(variable["template"]).reshape(
-        3,
-        template_uvw.shape[0] // 3,
-    )
-    phases = ["template_u", "template_v", "template_w"]
-    template_dict = {}
-    for phase, template in zip(phases, template_uvw):
-        template_dict[phase] = template.tolist()
-
-    variable.pop("template")
-    variable.update(template_dict)
+    template_uvw = np.frombuffer(variable.pop("template")).reshape(3, -1)
+    # 응답 스키마가 list[float]이므로 2차원 배열을 한 번에 리스트로 변환
+    (
+        variable["template_u"],
+        variable["template_v"],
+        variable["template_w"],
+    ) = template_uvw.tolist()
     return variable
@@ -0,0 +1,50 @@
+"""앱 시작 시 설정 값 캐시를 미리 채우는 함수 모음.
+
+- Author: Sewon Kim
+- Contact: sewon.kim@onepredict.com
+"""
+import logging
+
+from api.crud.dashboard import (
+    load_equipments,
+    load_equipments_with_line,
+    load_line_equipment_category,
+    load_plcmodel_by_equipment,
+)
+from api.crud.setting_client import (
+    load_equipment_motors,
+    read_memory_mapping,
+    read_plc_model,
+    read_total_motor_equipment,
+)
+from api.crud.util import get_equipment_name
+from api.schemas.detail import load_detail_init
+
+
+def warm_up_cache() -> None:
+    """전체 호기에 대해 대쉬보드, 트렌드, 상세페이지 init에서 쓰는 캐시를 채우는 함수.
+
+    첫 요청이 DB 조회를 기다리지 않도록 앱 시작 직후 백그라운드에서 실행하며,
+    DB 연결 실패 등으로 특정 호기의 캐시를 채우지 못해도 로그만 남기고 넘어감.
+    """
+    try:
+        load_line_equipment_category()
+        load_equipments_with_line()
+        read_total_motor_equipment()
+        read_plc_model()
+        read_memory_mapping()
+        equipments = load_equipments()
+    except Exception:
+        logging.exception("설정 값 캐시를 채우지 못했습니다.")
+        return
+
+    for equipment in equipments:
+        equipment_id = equipment["id"]
+        try:
+            get_equipment_name(equipment_id)
+            _, part_motor_number_dict = load_equipment_motors(equipment_id)
+            load_plcmodel_by_equipment(equipment_id)
+            for part_name in part_motor_number_dict:
+                load_detail_init(equipment_id, part_name)
+        except Exception:
+            logging.exception("%d번 호기의 캐시를 채우지 못했습니다.", equipment_id)
@@ -0,0 +1,41 @@
+"""api 엔드포인트에서 Depends로 주입하는 의존성 모음.
+
+- Author: Sewon Kim
+- Contact: sewon.kim@onepredict.com
+"""
+from collections.abc import Iterator
+
+from db.plc.database import PLCSessionLocal
+from db.service.database import SessionLocal
+from sqlalchemy.orm import Session, sessionmaker
+
+
+def _yield_session(session_maker: sessionmaker) -> Iterator[Session]:
+    """요청 하나에서 공유하는 세션을 생성하고 요청이 끝나면 commit 후 닫는 함수.
+
+    요청 처리 중 예외가 발생하면 rollback한다.
+
+    Args:
+        session_maker (sessionmaker): 세션 메이커 객체
+    Yields:
+        Session
+    """
+    session = session_maker()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_session() -> Iterator[Session]:
+    """Service DB 세션 의존성."""
+    yield from _yield_session(SessionLocal)
+
+
+def get_plc_session() -> Iterator[Session]:
+    """PLC DB 세션 의존성."""
+    yield from _yield_session(PLCSessionLocal)
@@ -3,18 +3,19 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
-import re
 from collections import defaultdict
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
+from anyio import to_thread
 from api.crud.dashboard import (
     TriggerDashboard,
     UniformExternalDashboard,
     UniformTensionDashboard,
     VariableDashboard,
     get_supply_freq,
+    read_current_plc,
 )
-from api.crud.util import get_matching_part
+from api.crud.util import get_matching_part, get_motor_id, get_motor_number
 from api.format.detail import generate_motor_code, response_key_change
 from db.feature.database import FeatureSessionLocal
 from db.feature.model import (
@@ -27,8 +28,125 @@ from fastapi import HTTPException
 from util.func import dt_to_unix
 from util.utils import extract_need_key
 
+category_matching_dict = {
+    "u3e": {
+        "dashboard": UniformExternalDashboard,
+        "orm_cls": UniformSpeedExternalFeature,
+    },
+    "u3t": {
+        "dashboard": UniformTensionDashboard,
+        "orm_cls": UniformSpeedTensionFeature,
+    },
+    "v3": {
+        "dashboard": VariableDashboard,
+        "orm_cls": VariableSpeedPhase3Feature,
+    },
+}
 
-def format_dashboard(
+
+def read_equipment_dashboards(
+    motors_in_equipment: list[dict[str, Union[int, str]]],
+    plc: Optional[int] = None,
+) -> tuple[dict[int, dict[str, Any]], dict[int, dict[str, Any]]]:
+    """호기의 모든 모터의 최신 진단 결과와 트리거를 모터 카테고리별로 한 번씩 조회.
+
+    모터마다 세션을 열고 조회하지 않고, 하나의 세션에서 카테고리별 진단 결과 조회와
+    트리거 조회를 각각 한 번씩만 수행한다.
+
+    Args:
+        motors_in_equipment (list[dict[str, Union[int, str]]]): 현재 호기의 전체 모터 정보
+        plc (int): plc 모델 번호, None이면 현재 호기의 가장 최신 plc 사용
+
+    Returns:
+        tuple[dict[int, dict[str, Any]], dict[int, dict[str, Any]]],
+        모터 번호별 진단 결과와 트리거
+    """
+    equipment_id = motors_in_equipment[0]["equipment_id"]
+    current_plc = read_current_plc(equipment_id)  # type: ignore[arg-type]
+    motor_numbers_by_category: defaultdict[str, list[int]] = defaultdict(list)
+    for motor_dict in motors_in_equipment:
+        motor_numbers_by_category[motor_dict["category"]].append(  # type: ignore[index]
+            motor_dict["number"],  # type: ignore[arg-type]
+        )
+
+    dashboards: dict[int, dict[str, Any]] = {}
+    with FeatureSessionLocal() as session:
+        for category, motor_numbers in motor_numbers_by_category.items():
+            matching = category_matching_dict[category]
+            dashboards |= matching["dashboard"].read_dashboards_bulk(
+                session,
+                matching["orm_cls"],
+                equipment_id,
+                motor_numbers,
+                current_plc if plc is None else plc,
+            )
+        # 트리거는 기존과 같이 요청한 plc와 상관없이 현재 plc 기준으로 조회
+        triggers = TriggerDashboard.read_dashboards_bulk(
+            session,
+            Trigger,
+            equipment_id,
+            [motor_dict["number"] for motor_dict in motors_in_equipment],
+            current_plc,
+        )
+    return dashboards, triggers
+
+
+def format_dashboard_motor(
+    motor_dict: dict[str, Union[int, str]],
+    part_motor_number_dict: dict[str, tuple[int]],
+    dashboards: dict[int, dict[str, Any]],
+    triggers: dict[int, dict[str, Any]],
+    plc: Optional[int] = None,
+) -> dict[str, Union[int, float, str]]:
+    """모터 1개의 대쉬보드 API 응답을 만드는 함수.
+
+    dashboards, triggers는 read_equipment_dashboards의 조회 결과이며,
+    나머지 인자는 format_dashboard 참고.
+    """
+    equipment_id, motor_number = motor_dict["equipment_id"], motor_dict["number"]
+    str_mtr_id = get_motor_id(motor_number)
+    category = motor_dict["category"]
+
+    dashboard = dashboards.get(motor_number)  # type: ignore[arg-type]
+    if dashboard is None:
+        raise HTTPException(
+            status_code=501,
+            detail=f"DB에 {str_mtr_id}에 해당하는 데이터가 존재하지 않습니다.",
+        )
+
+    dashboard["acq_time"] = dt_to_unix(dashboard["acq_time"])
+    response = dashboard | {
+        "part": get_matching_part(part_motor_number_dict, motor_number),
+        "name": generate_motor_code(motor_dict["name"]),
+        "label": category,
+    }
+    if category != "v3":
+        response = response | get_supply_freq(
+            str_mtr_id,
+            equipment_id,
+            3 if plc is None else plc,
+        )
+
+    trigger_dashboard = triggers[motor_number]  # type: ignore[index]
+    trigger_dashboard["trigger_acq_time"] = dt_to_unix(
+        trigger_dashboard["acq_time"],
+    )
+    trigger_status = extract_need_key(
+        trigger_dashboard,
+        [
+            "status",
+            "plc_status",
+            "supply_freq_by_data",
+            "rms_u",
+            "trigger_acq_time",
+        ],
+    )
+    trigger_status = format_trigger_status(trigger_status)
+
+    return response_key_change(response | trigger_status)
+
+
+async def format_dashboard(
     motors_in_equipment: list[dict[str, Union[int, str]]],
     part_motor_number_dict: dict[str, tuple[int]],
     plc: Optional[int] = None,
@@ -61,89 +179,36 @@ def format_dashboard(
             "fc": (9, 10, 11, 14),
         }.
     """
-    response: dict = defaultdict(dict)
-    for motor_dict in motors_in_equipment:
-        equipment_id, motor_number = motor_dict["equipment_id"], motor_dict["number"]
-        str_mtr_id = "".join(("motor", str(motor_number)))
-
-        def load_dashboard(str_mtr_id: str, category: str, plc: Optional[int]) -> dict:
-            category_matching_dict = {
-                "u3e": {
-                    "dashboard": UniformExternalDashboard,
-                    "orm_cls": UniformSpeedExternalFeature,
-                },
-                "u3t": {
-                    "dashboard": UniformTensionDashboard,
-                    "orm_cls": UniformSpeedTensionFeature,
-                },
-                "v3": {
-                    "dashboard": VariableDashboard,
-                    "orm_cls": VariableSpeedPhase3Feature,
-                },
-            }
-            ud = category_matching_dict[category]["dashboard"](
-                equipment_id,
-                motor_number,
-                plc,
-            )
-            try:
-                [dashboard] = ud.read_dashboard(
-                    FeatureSessionLocal,
-                    category_matching_dict[category]["orm_cls"],
-                )
-            except ValueError as err:
-                raise HTTPException(
-                    status_code=501,
-                    detail=f"DB에 {str_mtr_id}에 해당하는 데이터가 존재하지 않습니다.",
-                ) from err
-            else:
-                dashboard["acq_time"] = dt_to_unix(dashboard["acq_time"])
-                response[str_mtr_id] = dashboard | {
-                    "part": get_matching_part(part_motor_number_dict, motor_number),
-                    "name": generate_motor_code(motor_dict["name"]),
-                    "label": motor_dict["category"],
-                }
-                if category != "v3":
-                    if plc is None:
-                        plc = 3
-                    response[str_mtr_id] = response[str_mtr_id] | get_supply_freq(
-                        str_mtr_id,
-                        equipment_id,
-                        plc,
-                    )
-                    return response[str_mtr_id]
-                else:
-                    return response[str_mtr_id]
-
-        response[str_mtr_id] = load_dashboard(
-            str_mtr_id,
-            motor_dict["category"],  # type: ignore[arg-type]
-            plc,
-        )
+    if not motors_in_equipment:
+        return {}
+    response = await to_thread.run_sync(
+        _format_dashboard,
+        motors_in_equipment,
+        part_motor_number_dict,
+        plc,
+    )
+    return dict(
+        sorted(response.items(), key=lambda item: get_motor_number(item[0])),
+    )
 
-        trigger = TriggerDashboard(equipment_id, motor_number)
-        [trigger_dashboard] = trigger.read_dashboard(FeatureSessionLocal, Trigger)
-        trigger_dashboard["trigger_acq_time"] = dt_to_unix(
-            trigger_dashboard["acq_time"],
-        )
-        trigger_status = extract_need_key(
-            trigger_dashboard,
-            [
-                "status",
-                "plc_status",
-                "supply_freq_by_data",
-                "rms_u",
-                "trigger_acq_time",
-            ],
-        )
-        trigger_status = format_trigger_status(trigger_status)
 
-        response[str_mtr_id] = response_key_change(
-            response[str_mtr_id] | trigger_status,
+def _format_dashboard(
+    motors_in_equipment: list[dict[str, Union[int, str]]],
+    part_motor_number_dict: dict[str, tuple[int]],
+    plc: Optional[int] = None,
+) -> dict[str, dict[str, Union[int, float, str]]]:
+    """호기의 대쉬보드를 한 번에 조회한 뒤 모터별 응답을 만드는 함수."""
+    dashboards, triggers = read_equipment_dashboards(motors_in_equipment, plc)
+    return {
+        get_motor_id(motor_dict["number"]): format_dashboard_motor(
+            motor_dict,
+            part_motor_number_dict,
+            dashboards,
+            triggers,
+            plc,
         )
-    return dict(
-        sorted(response.items(), key=lambda x: int(re.sub(r"[^0-9]", "", x[0]))),
-    )
+        for motor_dict in motors_in_equipment
+    }
 
 
 def format_trigger_status(trigger_status: dict) -> dict:
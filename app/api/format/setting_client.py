@@ -19,35 +19,22 @@ def matching_metadata_and_trigger(
     trigger 테이블에서 rms_v, rms_w를 만드는 것이 바람직함.
     """
     n = 3
-    metadata_query_results = [
-        metadata_query_results[i * n : (i + 1) * n]
-        for i in range((len(metadata_query_results) + n - 1) // n)
-    ]
-
-    for metadata_three_row, trigger_row in zip(
-        metadata_query_results,
+    # metadata는 u, v, w 3개 row가 trigger row 1개에 대응되므로 3개씩 바로 수정
+    for i, trigger_row in zip(
+        range(0, len(metadata_query_results), n),
         trigger_query_results,
     ):
-        metadata_acq_time = metadata_three_row[0]["acq_time"]
         trigger_acq_time = trigger_row["acq_time"]
-
-        for metadata_row in metadata_three_row:
-
-            if metadata_acq_time == trigger_acq_time and metadata_row["phase"] == "u":
+        acq_time_matched = metadata_query_results[i]["acq_time"] == trigger_acq_time
+        for metadata_row in metadata_query_results[i : i + n]:
+            if acq_time_matched and metadata_row["phase"] == "u":
                 metadata_row.update(
                     {"rms_u": round(trigger_row["rms_u"], 6), "rms_v": 0, "rms_w": 0},
                 )
             else:
                 metadata_row.update({"rms_u": 0, "rms_v": 0, "rms_w": 0})
 
-    def flatten(nested_list: list) -> list:
-        """Nested list를 flatten 하는 함수.
-
-        출처 : https://stackoverflow.com/questions/952914/how-do-i-make-a-flat-list-out-of-a-list-of-lists.
-        """
-        return [item for sublist in nested_list for item in sublist]
-
-    return flatten(metadata_query_results)
+    return metadata_query_results
 
 
 def format_motor_bearing(body: dict, aware_now: datetime) -> dict:
@@ -3,7 +3,6 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
-from collections import defaultdict
 from datetime import datetime
 from typing import Optional, Union
 
@@ -17,7 +16,7 @@ from api.crud.trend import (
     VariableLoad,
     VariableOperating,
 )
-from api.crud.util import get_matching_part, merge_list_of_dictionary
+from api.crud.util import gather_motors, get_matching_part, merge_list_of_dictionary
 from api.format.detail import generate_motor_code, response_key_change
 from db.feature.database import FeatureSessionLocal
 from db.feature.model import (
@@ -27,7 +26,165 @@ from db.feature.model import (
 )
 
 
-def format_load(
+def read_required_dict(
+    motor_dict: dict[str, Union[int, str]],
+    plc: Optional[int] = None,
+) -> dict[str, int]:
+    """트렌드 조회 조건(호기 번호, 모터 번호, plc)을 만드는 함수.
+
+    Args:
+        motor_dict (Dict[str, Union[int, str]]): 모터 정보
+        plc (int): plc 모델 번호. PLC가 None인 경우, 모터 파라미터의 plc 사용
+    Returns:
+        Dict[str, int]
+    """
+    motor_info = MotorInfo(
+        motor_dict["equipment_id"],
+        motor_dict["number"],
+        motor_dict["category"],
+    )
+    motor_param = motor_info.read_motor_parameter()
+    motor_param["motor_number"] = motor_param["number"]
+    if plc is None:
+        columns = ["equipment_id", "motor_number", "plc"]
+        required_dict = {col: motor_param[col] for col in columns}
+    else:
+        columns = ["equipment_id", "motor_number"]
+        required_dict = {col: motor_param[col] for col in columns} | {"plc": plc}
+    return required_dict
+
+
+def format_trend_response(
+    trend: list[dict],
+    motor_dict: dict[str, Union[int, str]],
+    part_motor_number_dict: dict[str, tuple[int]],
+) -> dict:
+    """모터 1개의 트렌드 조회 결과에 파트, 이름, 라벨을 붙여 응답 형태로 만드는 함수.
+
+    Args:
+        trend (List[dict]): 트렌드 조회 결과
+        motor_dict (Dict[str, Union[int, str]]): 모터 정보
+        part_motor_number_dict (Dict[str, Tuple[int]]): 파트별 모터 번호
+    Returns:
+        dict
+    """
+    merged_trend = merge_list_of_dictionary(trend)
+    return response_key_change(
+        merged_trend
+        | {
+            "part": get_matching_part(part_motor_number_dict, motor_dict["number"]),
+            "name": generate_motor_code(motor_dict["name"]),
+            "label": motor_dict["category"],
+        },
+    )
+
+
+def format_load_motor(
+    motor_dict: dict[str, Union[int, str]],
+    part_motor_number_dict: dict[str, tuple[int]],
+    plc: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> dict:
+    """모터 1개의 Load API 응답을 만드는 함수, 인자는 format_load 참고."""
+    required_dict = read_required_dict(motor_dict, plc)
+    if motor_dict["category"] == "u3e":
+        ul = UniformLoad(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in ul.read_trend(FeatureSessionLocal, UniformSpeedExternalFeature)
+        ]
+    elif motor_dict["category"] == "u3t":
+        ut = UniformLoad(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in ut.read_trend(FeatureSessionLocal, UniformSpeedTensionFeature)
+        ]
+    elif motor_dict["category"] == "v3":
+        vl = VariableLoad(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in vl.read_trend(FeatureSessionLocal, VariableSpeedPhase3Feature)
+        ]
+    return format_trend_response(trend, motor_dict, part_motor_number_dict)
+
+
+def format_operating_motor(
+    motor_dict: dict[str, Union[int, str]],
+    part_motor_number_dict: dict[str, tuple[int]],
+    plc: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> dict:
+    """모터 1개의 Operating API 응답을 만드는 함수, 인자는 format_operating 참고."""
+    required_dict = read_required_dict(motor_dict, plc)
+    if motor_dict["category"] == "u3e":
+        ul = UniformOperating(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in ul.read_trend(FeatureSessionLocal, UniformSpeedExternalFeature)
+        ]
+    elif motor_dict["category"] == "u3t":
+        ut = UniformOperating(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in ut.read_trend(FeatureSessionLocal, UniformSpeedTensionFeature)
+        ]
+    elif motor_dict["category"] == "v3":
+        vl = VariableOperating(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in vl.read_trend(FeatureSessionLocal, VariableSpeedPhase3Feature)
+        ]
+    return format_trend_response(trend, motor_dict, part_motor_number_dict)
+
+
+def format_variable_diagnosis_motor(
+    motor_dict: dict[str, Union[int, str]],
+    part_motor_number_dict: dict[str, tuple[int]],
+    plc: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[dict]:
+    """모터 1개의 Variable diagnosis API 응답을 만드는 함수, 변속 모터가 아니면 None."""
+    if motor_dict["category"] != "v3":
+        return None
+    required_dict = read_required_dict(motor_dict, plc)
+    vd = VariableDiagnosis(required_dict, start, end)
+    trend = [
+        x._asdict()
+        for x in vd.read_trend(FeatureSessionLocal, VariableSpeedPhase3Feature)
+    ]
+    return format_trend_response(trend, motor_dict, part_motor_number_dict)
+
+
+def format_uniform_diagnosis_motor(
+    motor_dict: dict[str, Union[int, str]],
+    part_motor_number_dict: dict[str, tuple[int]],
+    plc: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[dict]:
+    """모터 1개의 Uniform diagnosis API 응답을 만드는 함수, 정속 모터가 아니면 None."""
+    if motor_dict["category"] not in ("u3e", "u3t"):
+        return None
+    required_dict = read_required_dict(motor_dict, plc)
+    if motor_dict["category"] == "u3e":
+        ud = UniformExternalDiagnosis(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in ud.read_trend(FeatureSessionLocal, UniformSpeedExternalFeature)
+        ]
+    elif motor_dict["category"] == "u3t":
+        ut = UniformTensionDiagnosis(required_dict, start, end)
+        trend = [
+            x._asdict()
+            for x in ut.read_trend(FeatureSessionLocal, UniformSpeedTensionFeature)
+        ]
+    return format_trend_response(trend, motor_dict, part_motor_number_dict)
+
+
+async def format_load(
     motors_in_equipment: list[dict[str, Union[int, str]]],
     part_motor_number_dict: dict[str, tuple[int]],
     plc: Optional[int] = None,
@@ -64,50 +221,17 @@ def format_load(
             "fc": (9, 10, 11, 14),
         }.
     """
-    response: dict = defaultdict(dict)
-    for motor_dict in motors_in_equipment:
-        motor_number = motor_dict["number"]
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        motor_info = MotorInfo(motor_dict["equipment_id"], motor_number)
-        motor_param = motor_info.read_motor_parameter()
-        motor_param["motor_number"] = motor_param["number"]
-        if plc is None:
-            columns = ["equipment_id", "motor_number", "plc"]
-            required_dict = {col: motor_param[col] for col in columns}
-        else:
-            columns = ["equipment_id", "motor_number"]
-            required_dict = {col: motor_param[col] for col in columns} | {"plc": plc}
-
-        if motor_dict["category"] == "u3e":
-            ul = UniformLoad(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in ul.read_trend(FeatureSessionLocal, UniformSpeedExternalFeature)
-            ]
-        elif motor_dict["category"] == "u3t":
-            ut = UniformLoad(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in ut.read_trend(FeatureSessionLocal, UniformSpeedTensionFeature)
-            ]
-        elif motor_dict["category"] == "v3":
-            vl = VariableLoad(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in vl.read_trend(FeatureSessionLocal, VariableSpeedPhase3Feature)
-            ]
-        merged_trend = merge_list_of_dictionary(trend)
-        response[str_mtr_id] = merged_trend | {
-            "part": get_matching_part(part_motor_number_dict, motor_number),
-            "name": generate_motor_code(motor_dict["name"]),
-            "label": motor_dict["category"],
-        }
+    return await gather_motors(
+        format_load_motor,
+        motors_in_equipment,
+        part_motor_number_dict,
+        plc,
+        start,
+        end,
+    )
 
-        response[str_mtr_id] = response_key_change(response[str_mtr_id])
-    return response
 
-
-def format_operating(
+async def format_operating(
     motors_in_equipment: list[dict[str, Union[int, str]]],
     part_motor_number_dict: dict[str, tuple[int]],
     plc: Optional[int] = None,
@@ -144,50 +268,17 @@ def format_operating(
             "fc": (9, 10, 11, 14),
         }.
     """
-    response: dict = defaultdict(dict)
-    for motor_dict in motors_in_equipment:
-        motor_number = motor_dict["number"]
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        motor_info = MotorInfo(motor_dict["equipment_id"], motor_number)
-        motor_param = motor_info.read_motor_parameter()
-        motor_param["motor_number"] = motor_param["number"]
-        if plc is None:
-            columns = ["equipment_id", "motor_number", "plc"]
-            required_dict = {col: motor_param[col] for col in columns}
-        else:
-            columns = ["equipment_id", "motor_number"]
-            required_dict = {col: motor_param[col] for col in columns} | {"plc": plc}
+    return await gather_motors(
+        format_operating_motor,
+        motors_in_equipment,
+        part_motor_number_dict,
+        plc,
+        start,
+        end,
+    )
 
-        if motor_dict["category"] == "u3e":
-            ul = UniformOperating(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in ul.read_trend(FeatureSessionLocal, UniformSpeedExternalFeature)
-            ]
-        elif motor_dict["category"] == "u3t":
-            ut = UniformOperating(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in ut.read_trend(FeatureSessionLocal, UniformSpeedTensionFeature)
-            ]
-        elif motor_dict["category"] == "v3":
-            vl = VariableOperating(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in vl.read_trend(FeatureSessionLocal, VariableSpeedPhase3Feature)
-            ]
-        merged_trend = merge_list_of_dictionary(trend)
-        response[str_mtr_id] = merged_trend | {
-            "part": get_matching_part(part_motor_number_dict, motor_number),
-            "name": generate_motor_code(motor_dict["name"]),
-            "label": motor_dict["category"],
-        }
 
-        response[str_mtr_id] = response_key_change(response[str_mtr_id])
-    return response
-
-
-def format_variable_diagnosis(
+async def format_variable_diagnosis(
     motors_in_equipment: list[dict[str, Union[int, str]]],
     part_motor_number_dict: dict[str, tuple[int]],
     plc: Optional[int] = None,
@@ -224,39 +315,17 @@ def format_variable_diagnosis(
             "fc": (9, 10, 11, 14),
         }.
     """
-    response: dict = defaultdict(dict)
-    for motor_dict in motors_in_equipment:
-        if motor_dict["category"] == "v3":
-            motor_number = motor_dict["number"]
-            str_mtr_id = "".join(("motor", str(motor_number)))
-            motor_info = MotorInfo(motor_dict["equipment_id"], motor_number)
-            motor_param = motor_info.read_motor_parameter()
-            motor_param["motor_number"] = motor_param["number"]
-            if plc is None:
-                columns = ["equipment_id", "motor_number", "plc"]
-                required_dict = {col: motor_param[col] for col in columns}
-            else:
-                columns = ["equipment_id", "motor_number"]
-                required_dict = {col: motor_param[col] for col in columns} | {
-                    "plc": plc,
-                }
-            vd = VariableDiagnosis(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in vd.read_trend(FeatureSessionLocal, VariableSpeedPhase3Feature)
-            ]
-            merged_trend = merge_list_of_dictionary(trend)
-            response[str_mtr_id] = merged_trend | {
-                "part": get_matching_part(part_motor_number_dict, motor_number),
-                "name": generate_motor_code(motor_dict["name"]),
-                "label": "v3",
-            }
-            response[str_mtr_id] = response_key_change(response[str_mtr_id])
-
-    return response
+    return await gather_motors(
+        format_variable_diagnosis_motor,
+        motors_in_equipment,
+        part_motor_number_dict,
+        plc,
+        start,
+        end,
+    )
 
 
-def format_uniform_diagnosis(
+async def format_uniform_diagnosis(
     motors_in_equipment: list[dict[str, Union[int, str]]],
     part_motor_number_dict: dict[str, tuple[int]],
     plc: Optional[int] = None,
@@ -293,47 +362,11 @@ def format_uniform_diagnosis(
             "fc": (9, 10, 11, 14),
         }.
     """
-    response: dict = defaultdict(dict)
-    for motor_dict in motors_in_equipment:
-        motor_number = motor_dict["number"]
-        str_mtr_id = "".join(("motor", str(motor_number)))
-        motor_info = MotorInfo(motor_dict["equipment_id"], motor_number)
-        motor_param = motor_info.read_motor_parameter()
-        motor_param["motor_number"] = motor_param["number"]
-        if plc is None:
-            columns = ["equipment_id", "motor_number", "plc"]
-            required_dict = {col: motor_param[col] for col in columns}
-        else:
-            columns = ["equipment_id", "motor_number"]
-            required_dict = {col: motor_param[col] for col in columns} | {"plc": plc}
-
-        if motor_dict["category"] == "u3e":
-            ud = UniformExternalDiagnosis(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in ud.read_trend(FeatureSessionLocal, UniformSpeedExternalFeature)
-            ]
-            merged_trend = merge_list_of_dictionary(trend)
-            response[str_mtr_id] = merged_trend | {
-                "part": get_matching_part(part_motor_number_dict, motor_number),
-                "name": generate_motor_code(motor_dict["name"]),
-                "label": motor_dict["category"],
-            }
-        elif motor_dict["category"] == "u3t":
-            ut = UniformTensionDiagnosis(required_dict, start, end)
-            trend = [
-                x._asdict()
-                for x in ut.read_trend(FeatureSessionLocal, UniformSpeedTensionFeature)
-            ]
-            merged_trend = merge_list_of_dictionary(trend)
-            response[str_mtr_id] = merged_trend | {
-                "part": get_matching_part(part_motor_number_dict, motor_number),
-                "name": generate_motor_code(motor_dict["name"]),
-                "label": motor_dict["category"],
-            }
-        else:
-            continue
-
-        response[str_mtr_id] = response_key_change(response[str_mtr_id])
-
-    return response
+    return await gather_motors(
+        format_uniform_diagnosis_motor,
+        motors_in_equipment,
+        part_motor_number_dict,
+        plc,
+        start,
+        end,
+    )
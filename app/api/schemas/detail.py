@@ -5,12 +5,15 @@
 """
 from api.crud.detail import MotorInfo
 from api.crud.util import (
-    display_num_dict,
     get_detail_motor_number_list,
+    get_display_num,
     get_equipment_name,
+    get_motor_id,
 )
 from api.format.detail import parse_for_detail_init
+from core.config import setting
 from schemas.detail import DetailInitFactory
+from util.cache import ttl_cache
 
 
 class DetailInitAPIFactory:
@@ -36,21 +39,32 @@ class DetailInitAPIFactory:
         Returns:
             dict
         """
-        equipment_name = get_equipment_name(self.equipment_id)
-        motor_number_list = get_detail_motor_number_list(equipment_name)[self.part_name]
-        response = {}
-        for motor_number in motor_number_list:
-            str_mtr_id = "".join(("motor", str(motor_number)))
-            motor_info = MotorInfo(self.equipment_id, motor_number)
-            motor_param = motor_info.read_motor_parameter()
-            response[str_mtr_id] = parse_for_detail_init(motor_param)
-            detail_init = DetailInitFactory.create_detail(
-                response[str_mtr_id]["category"],
-            )
-            response[str_mtr_id].update(detail_init.dict())
-
-        for motor_number in response:
-            for key, value in display_num_dict.items():
-                if key in response[motor_number]["name"]:
-                    response[motor_number]["display_num"] = value
-        return response
+        return load_detail_init(self.equipment_id, self.part_name)
+
+
+@ttl_cache(setting.cache_ttl)
+def load_detail_init(equipment_id: int, part_name: str) -> dict:
+    """상세페이지 init API의 응답을 만드는 함수.
+
+    현재 plc 모델이나 파라미터가 바뀌면 cache_clear()로 캐시를 비워야함.
+
+    Args:
+        equipment_id (int): 호기 번호
+        part_name (str): 파트 이름
+    Returns:
+        dict
+    """
+    equipment_name = get_equipment_name(equipment_id)
+    motor_number_list = get_detail_motor_number_list(equipment_name)[part_name]
+    response = {}
+    for motor_number in motor_number_list:
+        motor_info = MotorInfo(equipment_id, motor_number)
+        motor_param = motor_info.read_motor_parameter()
+        motor_response = parse_for_detail_init(motor_param)
+        detail_init = DetailInitFactory.create_detail(motor_response["category"])
+        motor_response.update(detail_init.dict())
+        display_num = get_display_num(motor_param["name"])
+        if display_num is not None:
+            motor_response["display_num"] = display_num
+        response[get_motor_id(motor_number)] = motor_response
+    return response
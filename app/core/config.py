@@ -25,6 +25,16 @@ class Setting(BaseSettings):
         bucket_name : 버킷 이름
         timezone : 타임존
         line_num : 라인 번호
+        cache_ttl : 설정 값 조회 결과를 캐시하는 시간(초)
+        plc_cache_ttl : 현재 plc 모델 조회 결과를 캐시하는 시간(초)
+        plc_log_flush_interval : 쌓아둔 plc log를 DB에 insert하는 주기(초)
+        plc_log_max_pending : insert에 실패한 plc log를 재시도하기 위해 보관할 최대 개수
+        db_pool_size : DB별 connection pool에 유지할 connection 개수
+        db_max_overflow : pool_size를 넘어서 추가로 열 수 있는 connection 개수
+        db_pool_recycle : connection을 재사용할 최대 시간(초)
+        db_query_cache_size : 엔진별로 컴파일된 SQL을 저장할 최대 개수
+        threadpool_size : sync 엔드포인트와 to_thread.run_sync가 함께 쓰는 스레드 개수,
+                        db_pool_size + db_max_overflow 이하로 설정
     """
 
     servicedb_uri: str
@@ -39,6 +49,15 @@ class Setting(BaseSettings):
     bucket_name: str
     timezone: str
     line_num: str
+    cache_ttl: int = 3600
+    plc_cache_ttl: int = 30
+    plc_log_flush_interval: float = 0.5
+    plc_log_max_pending: int = 100000
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 600
+    db_query_cache_size: int = 1200
+    threadpool_size: int = 30
 
 
 setting = Setting()
@@ -8,5 +8,12 @@ from core.config import setting
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-engine = create_engine(setting.fdcdb_uri, pool_pre_ping=True)
+engine = create_engine(
+    setting.fdcdb_uri,
+    pool_pre_ping=True,
+    pool_size=setting.db_pool_size,
+    max_overflow=setting.db_max_overflow,
+    pool_recycle=setting.db_pool_recycle,
+    query_cache_size=setting.db_query_cache_size,
+)
 FDCSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
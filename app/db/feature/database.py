@@ -11,6 +11,10 @@ from sqlalchemy.orm import sessionmaker
 engine = create_engine(
     setting.featuredb_uri,
     pool_pre_ping=True,
+    pool_size=setting.db_pool_size,
+    max_overflow=setting.db_max_overflow,
+    pool_recycle=setting.db_pool_recycle,
+    query_cache_size=setting.db_query_cache_size,
     connect_args={"options": f"-c timezone={setting.timezone}"},
 )
 
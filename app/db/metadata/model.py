@@ -8,7 +8,7 @@ Motor를 중심으로 하는 Star Schema 구조를 채택
 """
 
 from db.table import Base
-from sqlalchemy import VARCHAR, Column, DateTime, Integer, String
+from sqlalchemy import VARCHAR, Column, DateTime, Index, Integer, String
 from sqlalchemy.sql import func
 
 
@@ -36,3 +36,14 @@ class MetaData(Base):
     file_path = Column(String, nullable=False)
     sampling_rate = Column(Integer, nullable=False)
     sample_size = Column(Integer, nullable=False)
+
+    __table_args__: tuple = (
+        # 기본키가 line_id로 시작해서 호기, 모터별 acq_time 구간 조회(read_metadata)에 쓸 수 없음
+        Index(
+            "ix_metadata_equipment_id_motor_number_acq_time",
+            "equipment_id",
+            "motor_number",
+            acq_time.desc(),
+        ),
+        {},
+    )
@@ -5,13 +5,19 @@
 """
 import logging
 
+from core.config import setting
 from db.plc.database import PLCSessionLocal
 from db.plc.model import MemoryMapping, PLCLog
+from util.cache import ttl_cache
 
 
+@ttl_cache(setting.plc_cache_ttl, maxsize=256)
 def load_current_plc_model(line_equipment: dict) -> int:
     """현재 plc 모델 상태를 불러오는 함수.
 
+    대쉬보드와 상세페이지에서 같은 호기에 대해 반복 호출되므로 짧게 캐시하며,
+    plc log가 새로 들어오면 cache_clear()로 비운다.
+
     Args:
         line_equipment (dict): 라인 번호, 호기 번호, "CellState_Model"을 포함한 딕셔너리
     Returns:
@@ -33,3 +39,21 @@ def load_current_plc_model(line_equipment: dict) -> int:
             return 3
 
         return int(query_result)
+
+
+@ttl_cache(setting.cache_ttl)
+def load_plc_model_mm_ids() -> frozenset[int]:
+    """현재 plc 모델(CellState_Model)을 기록하는 memory mapping id들을 불러오는 함수.
+
+    plc log 중 plc 모델이 바뀐 경우에만 관련 캐시를 비우기 위해 사용함.
+
+    Returns:
+        frozenset[int]
+    """
+    with PLCSessionLocal() as session:
+        return frozenset(
+            mm_id
+            for (mm_id,) in session.query(MemoryMapping.id).filter(
+                MemoryMapping.name == "CellState_Model",
+            )
+        )
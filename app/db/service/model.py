@@ -51,7 +51,8 @@ class Equipment(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     line_id = Column(Integer, nullable=False)
-    name = Column(String, nullable=False)
+    # plc log 수집 시 호기 이름으로 호기 id를 조회함
+    name = Column(String, nullable=False, index=True)
 
     __table_args__: tuple = (
         ForeignKeyConstraint([line_id], [Line.id]),
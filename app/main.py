@@ -3,14 +3,19 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
+import asyncio
 import os
 import sys
 
+from anyio import to_thread
 from api.api_v1.api import api_router
+from api.crud.plc_log_writer import plc_log_writer
+from api.crud.warm_up import warm_up_cache
+from core.config import setting
 from core.logger import make_logger
 from fastapi import FastAPI
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 
@@ -21,7 +26,7 @@ sys.path.append(
 )
 
 
-app = FastAPI(docs_url=None, redoc_url=None)
+app = FastAPI(docs_url=None, redoc_url=None, default_response_class=ORJSONResponse)
 origins = ["*"]
 
 app.include_router(api_router, prefix="/api/v1")
@@ -31,11 +36,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # /setting-client/raw-data/binary 응답의 메타데이터 헤더
+    expose_headers=[
+        "X-Equipment-Id",
+        "X-Equipment-Name",
+        "X-Number",
+        "X-Name",
+        "X-Channel",
+        "X-Dtype",
+        "X-Length",
+    ],
 )
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+@app.on_event("startup")
+async def resize_threadpool() -> None:
+    """Sync 엔드포인트와 DB 조회가 실행되는 스레드풀 크기를 설정하는 함수.
+
+    sync 엔드포인트와 async 엔드포인트의 to_thread.run_sync 호출이 모두 anyio의
+    기본 limiter를 공유하므로, 동시에 DB를 사용하는 스레드가 threadpool_size를 넘지 않음.
+    threadpool_size는 엔진별 connection 개수(db_pool_size + db_max_overflow) 이하로 설정.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = setting.threadpool_size
+
+
+@app.on_event("startup")
+async def warm_up() -> None:
+    """설정 값 캐시를 백그라운드에서 미리 채워 첫 요청도 캐시를 사용하도록 하는 함수."""
+    app.state.warm_up_task = asyncio.create_task(to_thread.run_sync(warm_up_cache))
+
+
+@app.on_event("startup")
+async def start_plc_log_writer() -> None:
+    """쌓아둔 plc log를 주기적으로 insert하는 백그라운드 스레드를 시작하는 함수."""
+    plc_log_writer.start()
+
+
+@app.on_event("shutdown")
+async def stop_plc_log_writer() -> None:
+    """앱 종료 전에 쌓여있는 plc log를 모두 insert하는 함수."""
+    await to_thread.run_sync(plc_log_writer.stop)
+
+
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html() -> HTMLResponse:
     """Offline swagger가 될 수 있도록 하는 함수."""
@@ -4,9 +4,9 @@
 - Contact: sewon.kim@onepredict.com
 """
 from enum import Enum
-from typing import Union
+from typing import Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Extra
 
 
 class UniformExternalDetailInit(BaseModel):
@@ -134,3 +134,30 @@ class DetailInitFactory:
         motor_category = MotorCategory(category)
         detail_init_class = motor_category.detail_init_class
         return detail_init_class()
+
+
+class MotorDetail(BaseModel):
+    """상세페이지 API에서 모터 1개에 해당하는 응답 DTO, 문서화 용도로만 사용.
+
+    feature 트렌드, threshold 키는 모터 카테고리마다 다르므로 정의하지 않음.
+
+    Attributes:
+        name : 모터 이름 코드
+        category : 모터 카테고리
+        display_num : 상세페이지 디스플레이 순서
+    """
+
+    name: str
+    category: str
+    display_num: Optional[int] = None
+
+    class Config:
+        """카테고리별 feature 키를 허용하기 위한 설정."""
+
+        extra = Extra.allow
+
+
+class DetailResponse(BaseModel):
+    """상세페이지 API 응답 DTO, 키는 motor1, motor2와 같은 모터 아이디."""
+
+    __root__: dict[str, MotorDetail]
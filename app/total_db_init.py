@@ -25,6 +25,9 @@ def servicedb_initialization_lami():
 
     if database_exists(setting.servicedb_uri):
         print("servicedb already exists")
+        # 이미 있는 테이블에는 create_all이 인덱스를 추가하지 않으므로 없는 인덱스만 생성
+        for index in Equipment.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
         return
 
     if not database_exists(setting.servicedb_uri):
@@ -119,13 +122,13 @@ def metadatadb_initialization_dev():
     zstd_current = zstd_compress(tmp_current)
     # print(acq_time)
 
-    from api.crud.setting_client import read_total_motor_equipment
+    from api.crud.setting_client import read_total_motor_equipment_dicts
 
     target_keys = ("equipment_id", "number", "line_id")
 
     target_rows = [
-        {key: value for key, value in row.dict().items() if key in target_keys}
-        for row in read_total_motor_equipment()
+        {key: value for key, value in row.items() if key in target_keys}
+        for row in read_total_motor_equipment_dicts()
     ]
     line_id_list = set([row["line_id"] for row in target_rows])
     equipment_id_list = set([row["equipment_id"] for row in target_rows])
@@ -197,11 +200,14 @@ def servicedb_initialization() -> None:
 def metadatadb_initialization_lami():
     from core.config import setting
     from db.metadata.database import MetadataSessionLocal, engine
-    from db.metadata.model import Base
+    from db.metadata.model import Base, MetaData
     from sqlalchemy_utils import create_database, database_exists
 
     if database_exists(setting.metadatadb_uri):
         print("metadatadb already exists")
+        # 이미 있는 테이블에는 create_all이 인덱스를 추가하지 않으므로 없는 인덱스만 생성
+        for index in MetaData.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
         return
 
     if not database_exists(setting.metadatadb_uri):
@@ -0,0 +1,107 @@
+"""프로세스 내 TTL 캐시 모음.
+
+- Author: Sewon Kim
+- Contact: sewon.kim@onepredict.com
+호기, 모터, plc 모델처럼 자주 바뀌지 않는 설정 값 조회 결과를 메모리에 저장해두고,
+만료 시간(ttl)이 지나거나 cache_clear()가 호출되기 전까지 DB 조회 없이 재사용한다.
+캐시된 값은 여러 요청이 공유하므로 호출하는 쪽에서 수정하면 안된다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import update_wrapper
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    """dict, list처럼 hash가 불가능한 인자를 캐시 키로 쓸 수 있도록 변환하는 함수.
+
+    Args:
+        value (Any): 함수 인자
+    Returns:
+        Hashable
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class TTLCachedFunction(Generic[T]):
+    """ttl_cache 데코레이터로 감싼 함수.
+
+    Attributes:
+        ttl: 캐시 만료 시간(초)
+        maxsize: 저장할 최대 결과 개수, 넘으면 가장 오래 사용하지 않은 결과부터 삭제
+    """
+
+    def __init__(self, func: Callable[..., T], ttl: float, maxsize: int) -> None:
+        """감쌀 함수와 만료 시간, 최대 크기로 객체 생성.
+
+        Args:
+            func (Callable[..., T]): 캐시할 함수
+            ttl (float): 캐시 만료 시간(초)
+            maxsize (int): 저장할 최대 결과 개수
+        """
+        self.func = func
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._cache: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T:
+        """만료되지 않은 결과가 있으면 재사용하고, 없으면 함수를 호출하여 저장.
+
+        함수를 호출하는 동안 cache_clear()가 호출되었다면 이전 DB 상태로 만든 결과일 수
+        있으므로 리턴만 하고 저장하지 않는다.
+        """
+        key = (_freeze(args), _freeze(kwargs))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > now:
+                self._cache.move_to_end(key)
+                return cached[1]
+            generation = self._generation
+
+        value = self.func(*args, **kwargs)
+
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._cache[key] = (now + self.ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return value
+
+    def cache_clear(self) -> None:
+        """저장된 결과를 모두 삭제, 관련 테이블을 수정하는 api에서 호출."""
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
+
+
+def ttl_cache(
+    ttl: float,
+    maxsize: int = 128,
+) -> Callable[[Callable[..., T]], TTLCachedFunction[T]]:
+    """함수의 결과를 ttl초 동안 메모리에 저장하는 데코레이터.
+
+    Args:
+        ttl (float): 캐시 만료 시간(초)
+        maxsize (int): 저장할 최대 결과 개수
+    Returns:
+        Callable[[Callable[..., T]], TTLCachedFunction[T]]
+    """
+
+    def decorator(func: Callable[..., T]) -> TTLCachedFunction[T]:
+        return TTLCachedFunction(func, ttl, maxsize)
+
+    return decorator
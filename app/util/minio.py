@@ -5,6 +5,7 @@
 """
 from array import array
 from datetime import datetime
+from functools import lru_cache
 
 import boto3
 import zstd
@@ -33,9 +34,13 @@ def connect_minio_resource() -> boto3.resource:
     return s3
 
 
+@lru_cache(maxsize=1)
 def connect_minio_client() -> boto3.client:
     """Minio client 객체를 리턴받는 함수.
 
+    client 생성 비용(서비스 모델 로딩, connection pool 생성)이 크기 때문에
+    한 번 생성한 객체를 재사용하며, boto3 client는 스레드 간에 공유해도 안전함.
+
     Returns:
         boto3.client
     """
@@ -55,19 +60,29 @@ def connect_minio_client() -> boto3.client:
     return s3
 
 
-def get_zstd_object(key: str) -> list[float]:
-    """Minio key를 이용하여 float list 형태로 변환.
+def get_zstd_bytes(key: str) -> bytes:
+    """Minio key에 해당하는 객체를 압축 해제한 float32(little endian) bytes로 리턴.
 
     Args:
         key (str): zstd 압축방식으로 압축한 객체의 키
     Returns:
-        List[float]
+        bytes
     """
     s3 = connect_minio_client()
     obj = s3.get_object(Bucket=setting.bucket_name, Key=key)
     zstd_data = obj["Body"].read()
-    bytes_data = zstd.decompress(zstd_data)
-    return list(array("f", bytes_data))
+    return zstd.decompress(zstd_data)
+
+
+def get_zstd_object(key: str) -> list[float]:
+    """Minio key를 이용하여 float list 형태로 변환.
+
+    Args:
+        key (str): zstd 압축방식으로 압축한 객체의 키
+    Returns:
+        List[float]
+    """
+    return list(array("f", get_zstd_bytes(key)))
 
 
 def zstd_compress(data_list: list, level: int = 22) -> bytes:
@@ -3,12 +3,15 @@
 - Author: Sewon Kim
 - Contact: sewon.kim@onepredict.com
 """
+from collections.abc import Mapping
 from typing import Any, Optional, TypeVar, Union
 
+from pydantic import BaseModel
 from sqlalchemy.engine.row import Row
 from util.exception import EmptyKeyListError
 
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 def extract_threshold(motor_param: dict, category: str) -> Optional[dict]:
@@ -282,21 +285,6 @@ def change_key_name(x: dict, org_key: str, new_key: str) -> dict:
     return x
 
 
-def load_columns(obj: type[T]) -> list[str]:
-    """ORM 객체의 column를 모두 불러오는 함수.
-
-    Args:
-        obj (Generic[T]): ORM 객체
-    Returns:
-        list[str]
-    """
-    return [
-        attr
-        for attr in dir(obj)
-        if not attr.startswith("_") and attr not in ["metadata", "registry"]
-    ]
-
-
 def delete_key(_dict: dict, popped_columns: list[str]) -> dict:
     """쿼리 결과 중에 _sa_instance_state 부분을 제거해주는 함수.
 
@@ -309,3 +297,20 @@ def delete_key(_dict: dict, popped_columns: list[str]) -> dict:
     for col in popped_columns:
         _dict.pop(col, None)
     return _dict
+
+
+def construct_model(model_cls: type[ModelT], values: Mapping[str, Any]) -> ModelT:
+    """DB에서 읽은 값으로 pydantic 모델을 검증 없이 생성하는 함수.
+
+    DB 컬럼 타입으로 이미 보장되는 값에만 사용하며, 모델에 없는 키는 버리고
+    빠진 필드는 모델의 기본값으로 채운다.
+
+    Args:
+        model_cls (type[ModelT]): 생성할 pydantic 모델
+        values (Mapping[str, Any]): 쿼리 결과 row
+    Returns:
+        ModelT
+    """
+    return model_cls.construct(
+        **{name: values[name] for name in model_cls.__fields__ if name in values},
+    )
@@ -0,0 +1,79 @@
+from api.crud.interface import AnalysisSQL, get_analysis_sql
+from sqlalchemy import Column, DateTime, Integer, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+Base = declarative_base()
+
+
+class Feature(Base):
+    __tablename__ = "feature"
+
+    id = Column(Integer, primary_key=True)
+    equipment_id = Column(Integer)
+    motor_number = Column(Integer)
+    acq_time = Column(DateTime)
+    final_diagnosis = Column(Integer)
+
+
+def make_session_local() -> sessionmaker:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            Feature.__table__.insert(),
+            [
+                {"equipment_id": 1, "motor_number": 1, "final_diagnosis": value}
+                for value in range(3)
+            ],
+        )
+    return sessionmaker(bind=engine)
+
+
+def test_load_query_result():
+    SessionLocal = make_session_local()
+    analysis_sql = AnalysisSQL(["motor_number", "final_diagnosis"], SessionLocal, Feature)
+
+    assert analysis_sql.load_query_result(
+        equal_condition={"equipment_id": 1},
+        order_by_condition={"column": "final_diagnosis", "option": "desc"},
+        limit_condition=2,
+    ) == [
+        {"motor_number": 1, "final_diagnosis": 2},
+        {"motor_number": 1, "final_diagnosis": 1},
+    ]
+
+
+def test_get_analysis_sql_reuses_instance():
+    SessionLocal = make_session_local()
+    columns = ("motor_number", "final_diagnosis")
+
+    assert get_analysis_sql(columns, SessionLocal, Feature) is get_analysis_sql(
+        columns,
+        SessionLocal,
+        Feature,
+    )
+
+
+def test_load_query_first():
+    SessionLocal = make_session_local()
+    analysis_sql = AnalysisSQL(["final_diagnosis"], SessionLocal, Feature)
+
+    assert analysis_sql.load_query_first(
+        equal_condition={"equipment_id": 1},
+        order_by_condition={"column": "final_diagnosis", "option": "desc"},
+    ) == {"final_diagnosis": 2}
+    assert analysis_sql.load_query_first(equal_condition={"equipment_id": 2}) is None
+
+
+def test_load_query_result_between_condition():
+    SessionLocal = make_session_local()
+    analysis_sql = AnalysisSQL(
+        ["final_diagnosis"],
+        SessionLocal,
+        Feature,
+        between_column="final_diagnosis",
+    )
+
+    assert analysis_sql.load_query_result(
+        between_condition={"from": 0, "end": 2},
+    ) == [{"final_diagnosis": 1}]
@@ -0,0 +1,102 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from util import cache
+from util.cache import ttl_cache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=fake_clock.monotonic))
+    return fake_clock
+
+
+def make_counted(ttl: float = 10, maxsize: int = 128):
+    calls: list[tuple] = []
+
+    @ttl_cache(ttl, maxsize=maxsize)
+    def func(*args, **kwargs):
+        calls.append((args, kwargs))
+        return len(calls)
+
+    return func, calls
+
+
+def test_ttl_cache_reuses_until_expired(clock: FakeClock):
+    func, calls = make_counted(ttl=10)
+
+    assert func(1) == 1
+    clock.now = 9.9
+    assert func(1) == 1
+    clock.now = 10
+    assert func(1) == 2
+    assert len(calls) == 2
+
+
+def test_ttl_cache_evicts_least_recently_used(clock: FakeClock):
+    func, calls = make_counted(maxsize=2)
+
+    func(1)
+    func(2)
+    func(1)
+    func(3)
+
+    assert len(calls) == 3
+    func(1)
+    assert len(calls) == 3
+    func(2)
+    assert len(calls) == 4
+
+
+def test_cache_clear(clock: FakeClock):
+    func, calls = make_counted()
+
+    func(1)
+    func.cache_clear()
+    func(1)
+
+    assert len(calls) == 2
+
+
+def test_ttl_cache_freezes_dict_and_list_arguments(clock: FakeClock):
+    func, calls = make_counted()
+
+    assert func({"a": [1, 2], "b": 1}, items=[1, {2}]) == 1
+    assert func({"b": 1, "a": [1, 2]}, items=[1, {2}]) == 1
+    assert func({"a": [2, 1], "b": 1}, items=[1, {2}]) == 2
+    assert len(calls) == 2
+
+
+def test_cache_clear_during_call_does_not_store_stale_value(clock: FakeClock):
+    started = threading.Event()
+    release = threading.Event()
+    results: list[str] = []
+    source = {"value": "old"}
+
+    @ttl_cache(10)
+    def read_value() -> str:
+        value = source["value"]
+        started.set()
+        release.wait()
+        return value
+
+    thread = threading.Thread(target=lambda: results.append(read_value()))
+    thread.start()
+    started.wait()
+    source["value"] = "new"
+    read_value.cache_clear()
+    release.set()
+    thread.join()
+
+    assert results == ["old"]
+    assert read_value() == "new"